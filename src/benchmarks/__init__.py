@@ -0,0 +1,10 @@
+"""
+Micro-pruebas de rendimiento de las partes más usadas del juego.
+
+Miden el tablero (`reset`, `initialize_board`, `move_agent` y
+`move_dangerous_object`) y el tablero disperso de los mapas grandes, la
+búsqueda A* (plana, JPS, HPA* y en el espacio-tiempo), la búsqueda
+alfa-beta de MinMax sobre los tableros de `tableros/` y el dibujo del
+tablero con pygame. Los resultados se guardan en JSON y se comparan con
+`compare`.
+"""
@@ -0,0 +1,51 @@
+import argparse
+import sys
+
+from .runner import THRESHOLD, compare_results, load_results, run_benchmarks, save_results
+
+
+def main():
+    """
+    Ejecuta las micro-pruebas o compara dos ejecuciones guardadas.
+
+    Uso (desde la raíz del proyecto):
+        python -m src.benchmarks run -salida base.json
+        python -m src.benchmarks compare base.json nuevo.json -umbral 10
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmarks",
+        description="Micro-pruebas de rendimiento de Hunt the Wumpus",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Ejecuta las pruebas y guarda los resultados")
+    run.add_argument("-salida", type=str, help="Archivo JSON con los resultados")
+    run.add_argument("-filtro", type=str, help="Ejecuta solo los casos que contienen este texto")
+    run.add_argument("-repeticiones", type=int, default=5)
+    run.add_argument("-tiempo", type=float, default=0.2, help="Segundos mínimos por medición")
+
+    compare = commands.add_parser("compare", help="Compara dos ejecuciones guardadas")
+    compare.add_argument("base", type=str, help="Resultados de referencia")
+    compare.add_argument("nuevo", type=str, help="Resultados nuevos")
+    compare.add_argument(
+        "-umbral", type=float, default=THRESHOLD, help="Porcentaje de aumento que es una regresión"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run_benchmarks(args.filtro, args.repeticiones, args.tiempo)
+        if args.salida:
+            save_results(report, args.salida)
+        return
+
+    lines, regressions = compare_results(load_results(args.base), load_results(args.nuevo), args.umbral)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} regresiones de más del {args.umbral:g}%")
+        sys.exit(1)
+    print("Sin regresiones")
+
+
+if __name__ == "__main__":
+    main()
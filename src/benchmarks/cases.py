@@ -0,0 +1,257 @@
+"""
+Casos de las micro-pruebas de rendimiento.
+
+Cada caso es una función de preparación que crea el tablero o el jugador y
+devuelve la función sin argumentos que se cronometra. La preparación no se
+incluye en el tiempo medido.
+"""
+
+import math
+import os
+
+from ..game.board import Board
+from ..game.sparse_board import SparseBoard
+from ..game.utils import read_text_board
+
+BOARDS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "tableros")
+
+# Tamaños de tablero de las pruebas del tablero, A* y el dibujo
+SIZES = (3, 6, 10, 20, 40, 80)
+# Tamaños de las pruebas del tablero disperso
+SPARSE_SIZES = (100, 500)
+# Tamaños de las pruebas de la búsqueda en el espacio-tiempo (con pozo móvil)
+SPACE_TIME_SIZES = (6, 10, 20, 40)
+# Profundidades de las pruebas de alfa-beta
+DEPTHS = range(2, 9)
+# Semilla de los tableros aleatorios, para que todas las ejecuciones midan lo mismo
+SEED = 0
+
+
+def text_boards():
+    """
+    Devuelve los tableros de `tableros/` que tienen agente y oro.
+
+    Returns:
+        list: Pares (nombre del archivo, tablero personalizado).
+    """
+    boards = []
+    for file_name in sorted(os.listdir(BOARDS_DIR)):
+        if not file_name.endswith(".txt"):
+            continue
+        custom_board, _ = read_text_board(os.path.join(BOARDS_DIR, file_name))
+        contents = "".join("".join(row) for row in custom_board)
+        if "A" not in contents or "G" not in contents:
+            continue
+        boards.append((file_name[: -len(".txt")], custom_board))
+    return boards
+
+
+def bench_reset(size: int, board_class=Board):
+    board = board_class(size, verbose=False, seed=SEED)
+    return board.reset
+
+
+def bench_initialize_board(size: int):
+    board = Board(size, verbose=False, seed=SEED)
+    cells = len(board._cells)
+
+    def run():
+        # Solo la colocación de los objetos, sobre un tablero vacío
+        board._cells = bytearray(cells)
+        board._pit_count = bytearray(cells)
+        board._wumpus_count = bytearray(cells)
+        board.pits = []
+        board.initialize_board()
+
+    return run
+
+
+def bench_move_agent(size: int, board_class=Board):
+    board = board_class(size, verbose=False, seed=SEED)
+
+    def run():
+        # Ida y vuelta desde la casilla inicial, que nunca tiene peligros al lado
+        board.move_agent("up")
+        board.move_agent("down")
+
+    return run
+
+
+def bench_move_dangerous_object(size: int, board_class=Board):
+    start = board_class(size, verbose=False, seed=SEED).to_state()
+    boards = [board_class.from_state(start)]
+
+    def run():
+        board = boards[0]
+        # El pozo persigue al agente; al alcanzarlo se vuelve a la posición inicial
+        if board.moving_pit == board.agent_pos or not board.move_dangerous_object():
+            boards[0] = board_class.from_state(start)
+
+    return run
+
+
+def bench_a_star_search(size: int, board_class=Board):
+    from ..game.ai.astar import AStarPlayer
+
+    board = board_class(size, verbose=False, seed=SEED)
+    player = AStarPlayer(board, headless=True)
+    return lambda: player.a_star_search(board.agent_pos, board.gold_pos)
+
+
+def bench_jump_point_search(size: int, board_class=Board):
+    from ..game.ai.astar import AStarPlayer
+
+    board = board_class(size, verbose=False, seed=SEED)
+    player = AStarPlayer(board, headless=True)
+    return lambda: player.jump_point_search(board.agent_pos, board.gold_pos)
+
+
+def bench_space_time_search(size: int):
+    from ..game.ai.astar import AStarPlayer
+
+    board = Board(size, verbose=False, seed=SEED)
+    player = AStarPlayer(board, planner="spacetime", moving_pit=True, headless=True)
+    return lambda: player.space_time_search(board.agent_pos, board.gold_pos)
+
+
+def bench_hpa_find_path(size: int, board_class=Board):
+    from ..game.ai.astar import AStarPlayer
+    from ..game.ai.hpa import HierarchicalPlanner
+
+    board = board_class(size, verbose=False, seed=SEED)
+    player = AStarPlayer(board, headless=True)
+
+    def run():
+        # Planificador nuevo: incluye la abstracción de los clústeres que recorre
+        planner = HierarchicalPlanner(size, player.get_cost, player.min_step_cost())
+        planner.find_path(board.agent_pos, board.gold_pos)
+
+    return run
+
+
+def bench_hpa_replan(size: int, board_class=Board):
+    from ..game.ai.astar import AStarPlayer
+    from ..game.ai.hpa import HierarchicalPlanner
+
+    board = board_class(size, verbose=False, seed=SEED)
+    player = AStarPlayer(board, headless=True)
+    planner = HierarchicalPlanner(size, player.get_cost, player.min_step_cost())
+    planner.find_path(board.agent_pos, board.gold_pos)
+
+    def run():
+        # El pozo se mueve y se vuelve a planificar con los clústeres ya abstraídos.
+        # Los movimientos de prueba de `apply_hazard_move` no se anotan en el
+        # tablero, así que el pozo se mueve de verdad y se devuelve a su sitio
+        old_pos = board.moving_pit
+        revision = board.revision
+        board.move_dangerous_object()
+        planner.invalidate(board.changes_since(revision))
+        planner.find_path(board.agent_pos, board.gold_pos)
+        revision = board.revision
+        if board.moving_pit != old_pos:
+            board.move_object("O", board.moving_pit, old_pos)
+            board.moving_pit = old_pos
+        planner.invalidate(board.changes_since(revision))
+
+    return run
+
+
+def bench_alphabeta(custom_board: list, depth: int):
+    from ..game.ai.minmax import MinMaxPlayer
+
+    board = Board(len(custom_board), custom_board=custom_board, verbose=False, seed=SEED)
+    # Tabla pequeña para que vaciarla en cada búsqueda no domine el tiempo medido
+    player = MinMaxPlayer(board, depth_limit=depth, tt_size=1 << 10, headless=True)
+
+    def run():
+        # Búsqueda completa, sin reutilizar la tabla de transposición anterior
+        player.new_game()
+        player.alphabeta(board, 0, True, -math.inf, math.inf)
+
+    return run
+
+
+def pygame_window(size: int):
+    """
+    Crea la ventana del modo gráfico con el controlador de vídeo vacío de SDL.
+
+    Returns:
+        PygameMode: Interfaz gráfica sobre un tablero aleatorio.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    from ..ui.pygame_mode import PygameMode
+
+    return PygameMode(Board(size, verbose=False, seed=SEED))
+
+
+def bench_draw_board_full(size: int):
+    game = pygame_window(size)
+
+    def run():
+        game.invalidate()
+        game.draw_board()
+
+    return run
+
+
+def bench_draw_board_move(size: int):
+    game = pygame_window(size)
+    board = game.board
+    game.draw_board()
+
+    def run():
+        # Un turno típico: el agente se mueve y solo se redibujan sus celdas
+        board.move_agent("up")
+        game.draw_board()
+        board.move_agent("down")
+        game.draw_board()
+
+    return run
+
+
+def benchmark_cases():
+    """
+    Devuelve todos los casos, en el orden en que se ejecutan.
+
+    Returns:
+        dict: Nombre del caso -> función de preparación sin argumentos.
+    """
+    cases = {}
+    for size in SIZES:
+        cases[f"board.reset/{size}"] = lambda size=size: bench_reset(size)
+        cases[f"board.initialize_board/{size}"] = lambda size=size: bench_initialize_board(size)
+        cases[f"board.move_agent/{size}"] = lambda size=size: bench_move_agent(size)
+        cases[f"board.move_dangerous_object/{size}"] = (
+            lambda size=size: bench_move_dangerous_object(size)
+        )
+        cases[f"astar.a_star_search/{size}"] = lambda size=size: bench_a_star_search(size)
+        cases[f"astar.jump_point_search/{size}"] = lambda size=size: bench_jump_point_search(size)
+        cases[f"astar.hpa_find_path/{size}"] = lambda size=size: bench_hpa_find_path(size)
+    for size in SPACE_TIME_SIZES:
+        cases[f"astar.space_time_search/{size}"] = lambda size=size: bench_space_time_search(size)
+    for size in SPARSE_SIZES:
+        cases[f"sparse.reset/{size}"] = lambda size=size: bench_reset(size, SparseBoard)
+        cases[f"sparse.move_agent/{size}"] = lambda size=size: bench_move_agent(size, SparseBoard)
+        cases[f"sparse.move_dangerous_object/{size}"] = (
+            lambda size=size: bench_move_dangerous_object(size, SparseBoard)
+        )
+        cases[f"sparse.a_star_search/{size}"] = (
+            lambda size=size: bench_a_star_search(size, SparseBoard)
+        )
+        cases[f"sparse.jump_point_search/{size}"] = (
+            lambda size=size: bench_jump_point_search(size, SparseBoard)
+        )
+        cases[f"sparse.hpa_find_path/{size}"] = (
+            lambda size=size: bench_hpa_find_path(size, SparseBoard)
+        )
+        cases[f"sparse.hpa_replan/{size}"] = lambda size=size: bench_hpa_replan(size, SparseBoard)
+    for name, custom_board in text_boards():
+        for depth in DEPTHS:
+            cases[f"minmax.alphabeta/{name}/{depth}"] = (
+                lambda custom_board=custom_board, depth=depth: bench_alphabeta(custom_board, depth)
+            )
+    for size in SIZES:
+        cases[f"pygame.draw_board_full/{size}"] = lambda size=size: bench_draw_board_full(size)
+        cases[f"pygame.draw_board_move/{size}"] = lambda size=size: bench_draw_board_move(size)
+    return cases
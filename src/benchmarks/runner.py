@@ -0,0 +1,123 @@
+"""
+Ejecución de las micro-pruebas y comparación de resultados guardados en JSON.
+"""
+
+import datetime
+import json
+import platform
+import statistics
+import sys
+import timeit
+
+from .cases import benchmark_cases
+
+# Porcentaje de aumento del tiempo a partir del cual se considera una regresión
+THRESHOLD = 10.0
+
+
+def time_case(setup, repeat: int = 5, min_time: float = 0.2):
+    """
+    Cronometra un caso.
+
+    El número de llamadas por medición se ajusta para que cada una dure al
+    menos `min_time` segundos, como hace `timeit`.
+
+    Args:
+        setup: Función de preparación que devuelve la función a cronometrar.
+        repeat (int): Número de mediciones.
+        min_time (float): Duración mínima de cada medición en segundos.
+
+    Returns:
+        dict: Llamadas por medición, número de mediciones y tiempo mínimo y
+        mediano por llamada en microsegundos.
+    """
+    timer = timeit.Timer(setup())
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 10 if number < 1000 else 2
+    times = [time / number * 1e6 for time in timer.repeat(repeat, number)]
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_us": min(times),
+        "median_us": statistics.median(times),
+    }
+
+
+def run_benchmarks(pattern: str = None, repeat: int = 5, min_time: float = 0.2):
+    """
+    Ejecuta los casos cuyo nombre contiene `pattern` y muestra cada resultado.
+
+    Args:
+        pattern (str): Texto que debe aparecer en el nombre del caso. Por defecto, todos.
+        repeat (int): Número de mediciones de cada caso.
+        min_time (float): Duración mínima de cada medición en segundos.
+
+    Returns:
+        dict: Entorno de la ejecución y resultado de cada caso.
+    """
+    results = {}
+    for name, setup in benchmark_cases().items():
+        if pattern is not None and pattern not in name:
+            continue
+        results[name] = time_case(setup, repeat, min_time)
+        print(f"{name:45} {format_time(results[name]['min_us']):>12}")
+    return {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def format_time(us: float):
+    if us >= 1e6:
+        return f"{us / 1e6:.2f} s"
+    if us >= 1e3:
+        return f"{us / 1e3:.2f} ms"
+    return f"{us:.2f} us"
+
+
+def save_results(report: dict, path: str):
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+
+def load_results(path: str):
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = THRESHOLD):
+    """
+    Compara dos ejecuciones caso a caso usando el tiempo mínimo por llamada.
+
+    Args:
+        baseline (dict): Ejecución de referencia.
+        current (dict): Ejecución nueva.
+        threshold (float): Porcentaje de aumento a partir del cual hay regresión.
+
+    Returns:
+        list, list: Líneas del informe y nombres de los casos con regresión.
+    """
+    lines = []
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            lines.append(f"{name:45} {format_time(result['min_us']):>12}  (nuevo)")
+            continue
+        change = 100 * (result["min_us"] / base["min_us"] - 1)
+        mark = ""
+        if change > threshold:
+            mark = "  REGRESIÓN"
+            regressions.append(name)
+        elif change < -threshold:
+            mark = "  mejora"
+        lines.append(
+            f"{name:45} {format_time(base['min_us']):>12} -> "
+            f"{format_time(result['min_us']):>12} {change:+7.1f}%{mark}"
+        )
+    return lines, regressions
@@ -0,0 +1,124 @@
+"""
+Comprueba que el modo texto y las partidas sin ventana arrancan sin pygame ni NumPy.
+
+Ejecuta cada camino de arranque en un intérprete nuevo con `python -X importtime`
+y falla si se importa algún módulo prohibido o si el tiempo total de imports
+supera el presupuesto (mediana de varias ejecuciones). Un camino juega además
+la primera decisión de cada jugador sin ventana, porque los planificadores
+importan sus dependencias al usarse.
+
+Uso:
+    python -m src.check_startup [-repeticiones 5] [-presupuesto 100]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Tiempo máximo de imports de cada camino, en milisegundos. Con pygame y NumPy
+# el modo texto tardaba unos 300 ms en importarse; sin ellos, unos 30 ms.
+BUDGET_MS = 100
+
+FORBIDDEN = ("pygame", "numpy")
+
+# Camino de arranque -> código que ejecuta
+STARTUP_PATHS = {
+    "texto": "import src.main; src.main.game_mode_class('text')",
+    "sin ventana": (
+        "from src.game.simulation import play_board, player_class; "
+        "player_class('astar'); player_class('minmax')"
+    ),
+    "decisión sin ventana": (
+        "from src.game.board import Board; "
+        "from src.game.sparse_board import SparseBoard; "
+        "from src.game.simulation import player_class; "
+        "[player_class('astar')(board_class(8, verbose=False, seed=1), headless=True, "
+        "planner=planner, moving_pit=True).decide() "
+        "for board_class in (Board, SparseBoard) "
+        "for planner in ('astar', 'dstar', 'hpa', 'jps', 'spacetime')]; "
+        "player_class('minmax')(Board(8, verbose=False, seed=1), headless=True).decide()"
+    ),
+}
+
+
+def import_times(code: str):
+    """
+    Ejecuta un código en un intérprete nuevo y lee los tiempos de `-X importtime`.
+
+    Args:
+        code (str): Código que se ejecuta con `python -c`.
+
+    Returns:
+        dict: Tiempo propio en microsegundos de cada módulo importado.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue  # Cabecera de la tabla
+        times[name.strip()] = times.get(name.strip(), 0) + int(self_us)
+    return times
+
+
+def check_path(name: str, code: str, repeats: int, budget_ms: float):
+    """
+    Comprueba un camino de arranque.
+
+    Args:
+        name (str): Nombre del camino.
+        code (str): Código que se ejecuta.
+        repeats (int): Número de ejecuciones de las que se toma la mediana.
+        budget_ms (float): Tiempo máximo de imports en milisegundos.
+
+    Returns:
+        bool: True si no importa módulos prohibidos y cumple el presupuesto.
+    """
+    totals = []
+    forbidden = set()
+    for _ in range(repeats):
+        times = import_times(code)
+        totals.append(sum(times.values()) / 1000)
+        forbidden.update(
+            module.split(".")[0] for module in times if module.split(".")[0] in FORBIDDEN
+        )
+
+    total_ms = statistics.median(totals)
+    ok = not forbidden and total_ms <= budget_ms
+    print(f"{name}: {total_ms:.1f} ms de imports (presupuesto {budget_ms:g} ms)")
+    if forbidden:
+        print(f"  importa módulos prohibidos: {', '.join(sorted(forbidden))}")
+    elif total_ms > budget_ms:
+        print("  supera el presupuesto")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Comprueba el tiempo de arranque del modo texto y sin ventana"
+    )
+    parser.add_argument("-repeticiones", type=int, default=5)
+    parser.add_argument("-presupuesto", type=float, default=BUDGET_MS)
+    args = parser.parse_args()
+
+    results = [
+        check_path(name, code, args.repeticiones, args.presupuesto)
+        for name, code in STARTUP_PATHS.items()
+    ]
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
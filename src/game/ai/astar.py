@@ -1,18 +1,27 @@
 import heapq
 import sys
-import pygame
-import time
 import os
 
 from ..board import Board
+from ..sparse_board import SparseBoard
+from ..cells import BREEZE, HAZARD, PIT, STENCH
 from ..utils import get_move_direction
+from .costs import CostGrid
+from .dstar_lite import DStarLite
+from .hpa import HierarchicalPlanner
+from .indexed_heap import CountingMinHeap, IndexedMinHeap
+from .search_state import cell_flags, cell_values
+from .stats import GameStats, timed
 
 # Ajustar el sys.path para permitir imports relativos
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
 sys.path.append(project_root)
 
-from src.ui.pygame_mode import PygameMode
+# Horizonte de `space_time_search`, en pasos por cada celda de lado del tablero
+SPACE_TIME_HORIZON = 4
+# Estados que abre como mucho `space_time_search` antes de devolver una ruta parcial
+SPACE_TIME_MAX_EXPANSIONS = 50000
 
 
 class AStarPlayer:
@@ -21,16 +30,110 @@ class AStarPlayer:
     la mejor ruta hacia el oro.
     """
 
-    def __init__(self, board: Board):
+    def __init__(
+        self,
+        board: Board,
+        planner: str = "astar",
+        moving_pit: bool = False,
+        headless: bool = False,
+        speed: float = 1.0,
+        fps: int = 30,
+        stats_path: str = None,
+        profile_turn: int = None,
+    ):
         """
         Inicializa el jugador con el tablero en el que se encuentra.
 
         Args:
             board (Board): Tablero en el que se encuentra el jugador.
+            planner (str): "astar" calcula la ruta una vez; "dstar" la repara
+                con D* Lite cada vez que cambian los peligros del tablero; "hpa"
+                la busca por clústeres con HPA* y, cuando cambian los peligros,
+                solo vuelve a abstraer los clústeres afectados; "jps" la calcula
+                una vez con Jump Point Search, que salta las zonas sin percepciones;
+                "spacetime" la busca en el espacio-tiempo simulando la respuesta
+                del pozo móvil a cada paso, así que la ruta ya lo esquiva.
+            moving_pit (bool): Si es True, el pozo móvil se mueve tras cada paso del agente.
+            headless (bool): Si es True no se crea la ventana de Pygame (simulaciones por lotes).
+            speed (float): Multiplicador de la velocidad de la partida (0 para ir lo más rápido posible).
+            fps (int): Fotogramas por segundo máximos de la ventana.
+            stats_path (str): Activa las estadísticas internas y añade el informe
+                de cada partida a este archivo JSON lines.
+            profile_turn (int): Activa las estadísticas y perfila con `cProfile`
+                la decisión de ese turno.
         """
+        if planner not in ("astar", "dstar", "hpa", "jps", "spacetime"):
+            raise ValueError(f"Planificador desconocido: {planner}")
         self.board = board
+        self.planner = planner
+        self.moving_pit = moving_pit
         self.path = None
-        self.game = PygameMode(board)
+        self.path_index = 0  # Posición del agente dentro de `path`
+        self.pit_path = None  # Posición prevista del pozo móvil en cada paso de `path`
+        self.revision = None
+        self.dstar = None
+        self.hpa = None
+        self.jump_bounds = None  # Peligros y destino de la última `jump_point_bounds`
+        self.cost_grid = CostGrid(board)
+        self.speed = speed
+        self.fps = fps
+        self.stats = None
+        if stats_path is not None or profile_turn is not None:
+            self.stats = GameStats(stats_path, profile_turn)
+        self.game = None
+        if not headless:
+            # pygame solo se carga si hay ventana
+            from src.ui.pygame_mode import PygameMode
+
+            self.game = PygameMode(board)
+
+    def new_game(self):
+        """
+        Prepara una partida nueva sobre el estado actual del tablero.
+
+        La ruta se calcula en el primer `get_best_move`.
+        """
+        self.path = None
+        self.pit_path = None
+        self.revision = None
+        self.dstar = None
+        self.hpa = None
+        self.jump_bounds = None
+        self.cost_grid = CostGrid(self.board)
+        if self.stats is not None:
+            self.stats.reset()
+
+    def decide(self):
+        """
+        Elige el movimiento del turno sin modificar el tablero.
+
+        Returns:
+            str: Movimiento del agente, o None si no tiene ruta hacia el oro.
+        """
+        return timed(self.stats, "think", self.get_best_move)
+
+    def apply_turn(self, move: str):
+        """
+        Aplica un turno: el agente hace el movimiento elegido y, si procede, se mueve el pozo.
+
+        Args:
+            move (str): Movimiento devuelto por `decide`.
+        """
+        if move:
+            timed(self.stats, "move", self.board.move_agent, move)
+        if self.moving_pit and not self.board.check_game_over()[0]:
+            timed(self.stats, "hazard", self.board.move_dangerous_object)
+
+    def play_turn(self):
+        """
+        Juega un turno: el agente avanza por la ruta y, si procede, se mueve el pozo.
+
+        Returns:
+            str: Movimiento del agente, o None si no tiene ruta hacia el oro.
+        """
+        move = self.decide()
+        self.apply_turn(move)
+        return move
 
     def calculate_path(self):
         """
@@ -38,7 +141,57 @@ class AStarPlayer:
         """
         start = self.board.agent_pos
         goal = self.board.gold_pos
-        self.path = self.a_star_search(start, goal)
+        self.revision = self.board.revision
+        self.path_index = 0
+        if self.planner == "dstar":
+            self.dstar = DStarLite(
+                self.board.size,
+                self.get_cost,
+                self.min_step_cost(),
+                sparse=isinstance(self.board, SparseBoard),
+            )
+            self.dstar.initialize(start, goal)
+            self.dstar.compute_shortest_path()
+            self.path = self.dstar.extract_path()
+        elif self.planner == "hpa":
+            counters = None if self.stats is None else self.stats.counters
+            self.hpa = HierarchicalPlanner(
+                self.board.size, self.get_cost, self.min_step_cost(), counters=counters
+            )
+            self.path = self.hpa.find_path(start, goal)
+        elif self.planner == "jps":
+            self.path = self.jump_point_search(start, goal)
+        elif self.planner == "spacetime" and self.moving_pit and self.board.moving_pit is not None:
+            self.path, self.pit_path = self.space_time_search(start, goal)
+        else:
+            self.path = self.a_star_search(start, goal)
+
+    def update_path(self):
+        """
+        Repara la ruta con D* Lite o HPA* si han cambiado los peligros del tablero.
+        """
+        changes = self.board.changes_since(self.revision)
+        if changes is None:
+            self.calculate_path()
+            return
+        self.revision = self.board.revision
+        if not changes:
+            return
+
+        if self.planner == "hpa":
+            self.hpa.invalidate(changes)
+            # Se mantiene la ruta mientras no cambie ninguna de las celdas que
+            # quedan por recorrer; replanificar con cada movimiento del pozo
+            # hace que el agente oscile entre rutas de coste parecido
+            if self.path and not set(changes).intersection(self.path[self.path_index + 1 :]):
+                return
+            self.path = self.hpa.find_path(self.board.agent_pos, self.board.gold_pos)
+        else:
+            self.dstar.move_start(self.board.agent_pos)
+            self.dstar.update_cells(changes)
+            self.dstar.compute_shortest_path()
+            self.path = self.dstar.extract_path()
+        self.path_index = 0
 
     def get_best_move(self):
         """
@@ -47,19 +200,66 @@ class AStarPlayer:
         Returns:
             str: Dirección del movimiento a realizar.
         """
-        if self.path is None:
+        if self.dstar is not None or self.hpa is not None:
+            self.update_path()
+        elif self.pit_path is not None:
+            # Se vuelve a buscar al acabar una ruta parcial o si el pozo no está donde se preveía
+            if (
+                self.path_index + 1 >= len(self.path)
+                or self.board.moving_pit != self.pit_path[self.path_index]
+            ):
+                self.calculate_path()
+        elif self.path is None and self.revision != self.board.revision:
             self.calculate_path()
 
-        if self.path and len(self.path) > 1:
-            next_pos = self.path[1]
-            self.path = self.path[1:]
+        if self.path and self.path_index + 1 < len(self.path):
+            self.path_index += 1
+            next_pos = self.path[self.path_index]
             return get_move_direction(self.board.agent_pos, next_pos)
         return None
 
+    def min_step_cost(self):
+        """
+        Devuelve el menor coste posible de un paso según `get_cost`.
+
+        Returns:
+            int: Coste mínimo de entrar en una celda.
+        """
+        return self.cost_grid.min_cost()
+
+    def search_cells(self):
+        """
+        Indica cómo guardar el estado de cada celda durante una búsqueda.
+
+        Returns:
+            int, int, bool: Número de celdas del tablero, capacidad del
+            montículo abierto (None para no preasignarlo) y si el estado se
+            guarda en diccionarios porque el tablero es disperso.
+        """
+        cells = self.board.size * self.board.size
+        if isinstance(self.board, SparseBoard):
+            return cells, None, True
+        return cells, cells, False
+
     def a_star_search(self, start: tuple, goal: tuple):
         """
         Implementación del algoritmo A* para encontrar la ruta óptima entre dos puntos.
 
+        Las celdas se identifican por su índice `x * size + y`. La lista abierta
+        es un montículo indexado que permite saber en O(1) si una celda está
+        abierta y reducir su prioridad cuando se encuentra un camino mejor, y
+        `g` y `came_from` se guardan en listas preasignadas. En un
+        `SparseBoard` se guardan en diccionarios (`search_state`), que solo
+        ocupan memoria por las celdas visitadas.
+
+        Los costes se leen por índice de `CostGrid` y la heurística es la de
+        `CostGrid.heuristic`, que es consistente: una celda cerrada ya tiene
+        su coste definitivo y no se vuelve a abrir. A igual `f` se abre antes
+        la celda más cercana al destino.
+
+        Con las estadísticas activas se cuentan las operaciones del montículo
+        y las expansiones.
+
         Args:
             start (tuple): Posición de inicio (x, y).
             goal (tuple): Posición de destino (x, y).
@@ -67,47 +267,475 @@ class AStarPlayer:
         Returns:
             list: Lista de posiciones que forman la ruta óptima.
         """
-        open_list = []
-        closed_set = set()
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: self.board.heuristic(start, goal)}
-
-        heapq.heappush(open_list, (f_score[start], start))
-
-        while open_list:
-            current = heapq.heappop(open_list)[1]
-
-            if current == goal:
+        size = self.board.size
+        start_index = start[0] * size + start[1]
+        goal_index = goal[0] * size + goal[1]
+
+        costs = self.cost_grid.update()
+        heuristic = self.cost_grid.heuristic
+
+        cells, capacity, sparse = self.search_cells()
+        g_score = cell_values(cells, float("inf"), sparse)
+        came_from = cell_values(cells, -1, sparse)
+        closed = cell_flags(cells, sparse)
+        stats = self.stats
+        if stats is None:
+            open_heap = IndexedMinHeap(capacity)
+        else:
+            open_heap = CountingMinHeap(capacity, stats.counters)
+            stats.counters["astar_searches"] += 1
+
+        g_score[start_index] = 0
+        h_score = heuristic(start, goal)
+        open_heap.push(start_index, (h_score, h_score, start_index))
+
+        while open_heap:
+            current, _ = open_heap.pop()
+
+            if current == goal_index:
                 return self.reconstruct_path(came_from, current)
 
-            closed_set.add(current)
+            closed[current] = 1
+            if stats is not None:
+                stats.counters["expansions"] += 1
+            x, y = divmod(current, size)
 
-            for neighbor in self.get_neighbors(current):
-                if neighbor in closed_set:
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < size and 0 <= ny < size):
+                    continue
+                neighbor = nx * size + ny
+                if closed[neighbor]:
                     continue
 
-                tentative_g_score = g_score[current] + self.get_cost(neighbor)
+                tentative_g_score = g_score[current] + costs[neighbor]
 
-                if neighbor not in [i[1] for i in open_list]:
+                if neighbor not in open_heap:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = g_score[neighbor] + self.board.heuristic(
-                        neighbor, goal
-                    )
-                    heapq.heappush(open_list, (f_score[neighbor], neighbor))
-                elif tentative_g_score < g_score.get(neighbor, float("inf")):
+                    h_score = heuristic((nx, ny), goal)
+                    key = (tentative_g_score + h_score, h_score, neighbor)
+                    open_heap.push(neighbor, key)
+                elif tentative_g_score < g_score[neighbor]:
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = g_score[neighbor] + self.board.heuristic(
-                        neighbor, goal
-                    )
-                    if neighbor in closed_set:
-                        closed_set.remove(neighbor)
-                        heapq.heappush(open_list, (f_score[neighbor], neighbor))
+                    h_score = heuristic((nx, ny), goal)
+                    key = (tentative_g_score + h_score, h_score, neighbor)
+                    open_heap.decrease_key(neighbor, key)
+
+        return None
+
+    def jump_point_search(self, start: tuple, goal: tuple):
+        """
+        Variante de `a_star_search` con Jump Point Search.
+
+        En las zonas sin percepciones todos los caminos de la misma longitud
+        son equivalentes, así que en lugar de abrir cada celda la búsqueda
+        salta en línea recta hasta la siguiente celda interesante (`jump`) y
+        solo abre esa. Junto a las percepciones y los peligros se vuelve a la
+        expansión normal: las celdas con percepciones, o con vecinas que las
+        tienen, se abren en las cuatro direcciones.
+
+        El coste de cada salto es la suma de los costes de `CostGrid` de las
+        celdas que recorre y la heurística es la misma que en `a_star_search`.
+        Hacia el oro la ruta cuesta lo mismo que la de `a_star_search`.
+
+        Args:
+            start (tuple): Posición de inicio (x, y).
+            goal (tuple): Posición de destino (x, y).
+
+        Returns:
+            list: Lista de posiciones que forman la ruta, o None si no hay ruta.
+        """
+        size = self.board.size
+        start_index = start[0] * size + start[1]
+        goal_index = goal[0] * size + goal[1]
+        costs = self.cost_grid.update()
+        heuristic = self.cost_grid.heuristic
+
+        cells, capacity, sparse = self.search_cells()
+        g_score = cell_values(cells, float("inf"), sparse)
+        came_from = cell_values(cells, -1, sparse)
+        closed = cell_flags(cells, sparse)
+        # Celdas ya clasificadas por `is_uniform` en esta búsqueda (1 sí, 2 no)
+        self.uniform_cells = cell_flags(cells, sparse)
+        self.ray_bounds = self.jump_point_bounds(goal)
+        stats = self.stats
+        if stats is None:
+            open_heap = IndexedMinHeap(capacity)
+        else:
+            open_heap = CountingMinHeap(capacity, stats.counters)
+            stats.counters["jps_searches"] += 1
+
+        g_score[start_index] = 0
+        h_score = heuristic(start, goal)
+        open_heap.push(start_index, (h_score, h_score, start_index))
+
+        while open_heap:
+            current, _ = open_heap.pop()
+
+            if current == goal_index:
+                return self.reconstruct_jump_path(came_from, current)
+
+            closed[current] = 1
+            if stats is not None:
+                stats.counters["expansions"] += 1
+            x, y = divmod(current, size)
+
+            parent = came_from[current]
+            if parent == -1 or not self.is_uniform(x, y):
+                directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            else:
+                # Se sigue de frente o se gira, pero no se vuelve atrás
+                px, py = divmod(parent, size)
+                dx, dy = (x > px) - (x < px), (y > py) - (y < py)
+                directions = [(dx, dy), (dy, dx), (-dy, -dx)]
+
+            for dx, dy in directions:
+                jump = self.jump(x + dx, y + dy, dx, dy, goal, costs)
+                if jump is None:
+                    continue
+                (nx, ny), cost = jump
+                neighbor = nx * size + ny
+                if closed[neighbor]:
+                    continue
+
+                tentative_g_score = g_score[current] + cost
+                if tentative_g_score >= g_score[neighbor]:
+                    continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                h_score = heuristic((nx, ny), goal)
+                key = (tentative_g_score + h_score, h_score, neighbor)
+                if neighbor in open_heap:
+                    open_heap.decrease_key(neighbor, key)
+                else:
+                    open_heap.push(neighbor, key)
+
+        return None
+
+    def jump(self, x: int, y: int, dx: int, dy: int, goal: tuple, costs):
+        """
+        Avanza en línea recta desde (x, y) hasta el siguiente punto de salto.
+
+        Son puntos de salto el destino, las celdas de su fila o su columna
+        que se cruzan, las celdas no uniformes y las que tienen a un lado una
+        celda no uniforme, por donde puede abrirse un camino nuevo. Como
+        los peligros siempre dejan percepciones en sus vecinas, parar en las
+        celdas no uniformes cubre también los vecinos forzados del JPS clásico.
+        Además, como en el JPS de cuatro direcciones, el salto para en las
+        celdas desde las que girando se llega en línea recta a otro punto de
+        salto (`ray_hits`), porque la ruta óptima puede girar en ellas.
+
+        Args:
+            x (int): Fila de la primera celda del salto.
+            y (int): Columna de la primera celda del salto.
+            dx (int): Dirección del salto en filas.
+            dy (int): Dirección del salto en columnas.
+            goal (tuple): Posición de destino.
+            costs (array): Costes de `CostGrid` por índice de celda.
 
+        Returns:
+            tuple, float: Punto de salto y coste de llegar a él, o None si el
+            salto acaba en un peligro o en el borde del tablero.
+        """
+        board = self.board
+        size = board.size
+        goal_x, goal_y = goal
+        is_uniform = self.is_uniform
+        cost = 0
+        while 0 <= x < size and 0 <= y < size and not board.cell_flags(x, y) & HAZARD:
+            cost += costs[x * size + y]
+            # Desde la fila o la columna del destino se llega a él en línea recta
+            if (x, y) == goal or (dx and x == goal_x) or (dy and y == goal_y):
+                return (x, y), cost
+            if not is_uniform(x, y):
+                return (x, y), cost
+            # Las vecinas de los lados que no son uniformes pueden abrir un camino nuevo
+            if not (is_uniform(x + dy, y + dx) and is_uniform(x - dy, y - dx)):
+                return (x, y), cost
+            # Si girando aquí se llega en línea recta a otro punto de salto, la
+            # ruta óptima puede girar en esta celda y no más adelante
+            if self.ray_hits(x + dy, y + dx, dy, dx) or self.ray_hits(x - dy, y - dx, -dy, -dx):
+                return (x, y), cost
+            x += dx
+            y += dy
         return None
 
+    def jump_point_bounds(self, goal: tuple):
+        """
+        Calcula dónde hay puntos de salto en cada fila y en cada columna.
+
+        Una celda no es uniforme si está a distancia 2 o menos de un peligro,
+        así que los puntos de salto de un rayo horizontal (celdas no uniformes
+        o con una vecina no uniforme encima o debajo) se deducen de los
+        peligros sin recorrer el tablero, y lo mismo en vertical. El resultado
+        se reutiliza mientras no cambien los peligros ni el destino.
+
+        Args:
+            goal (tuple): Posición de destino, que también es un punto de salto.
+
+        Returns:
+            tuple: Diccionarios de filas y de columnas con la primera y la
+            última posición de cada una en la que hay un punto de salto.
+        """
+        board = self.board
+        size = board.size
+        key = (size, frozenset(board.pits), board.wumpus_pos, goal)
+        if self.jump_bounds is not None and self.jump_bounds[0] == key:
+            return self.jump_bounds[1]
+        hazards = list(board.pits)
+        if board.wumpus_pos is not None:
+            hazards.append(board.wumpus_pos)
+
+        rows, columns = {}, {}
+        for hazard_x, hazard_y in hazards:
+            for offset in range(-3, 4):
+                reach = 2 - max(0, abs(offset) - 1)
+                for lines, line, center in (
+                    (rows, hazard_x + offset, hazard_y),
+                    (columns, hazard_y + offset, hazard_x),
+                ):
+                    if not 0 <= line < size:
+                        continue
+                    low, high = max(0, center - reach), min(size - 1, center + reach)
+                    bounds = lines.get(line)
+                    if bounds is None:
+                        lines[line] = [low, high]
+                    else:
+                        bounds[0] = min(bounds[0], low)
+                        bounds[1] = max(bounds[1], high)
+        for lines, line, position in ((rows, goal[0], goal[1]), (columns, goal[1], goal[0])):
+            bounds = lines.setdefault(line, [position, position])
+            bounds[0] = min(bounds[0], position)
+            bounds[1] = max(bounds[1], position)
+        self.jump_bounds = (key, (rows, columns))
+        return rows, columns
+
+    def ray_hits(self, x: int, y: int, dx: int, dy: int):
+        """
+        Indica si avanzando en línea recta desde (x, y), incluida, se llega a un punto de salto.
+
+        Son puntos de salto del rayo el destino, las celdas no uniformes y las
+        que tienen a un lado una celda no uniforme, como en `jump`. Como los
+        peligros son puntos de salto, el rayo nunca los atraviesa.
+
+        Args:
+            x (int): Fila de la primera celda del rayo.
+            y (int): Columna de la primera celda del rayo.
+            dx (int): Dirección del rayo en filas.
+            dy (int): Dirección del rayo en columnas.
+
+        Returns:
+            bool: True si el rayo llega a un punto de salto antes del borde.
+        """
+        rows, columns = self.ray_bounds
+        if dx:
+            bounds, position, step = columns.get(y), x, dx
+        else:
+            bounds, position, step = rows.get(x), y, dy
+        if bounds is None:
+            return False
+        return bounds[1] >= position if step > 0 else bounds[0] <= position
+
+    def is_uniform(self, x: int, y: int):
+        """
+        Indica si una celda y sus vecinas no tienen percepciones ni peligros.
+
+        El resultado se guarda en `uniform_cells` durante la búsqueda, ya que
+        los saltos vecinos vuelven a preguntar por las mismas celdas. Las
+        celdas fuera del tablero se consideran uniformes.
+
+        Args:
+            x (int): Fila de la celda.
+            y (int): Columna de la celda.
+
+        Returns:
+            bool: True si la celda está en una zona uniforme.
+        """
+        size = self.board.size
+        if not (0 <= x < size and 0 <= y < size):
+            return True
+        index = x * size + y
+        known = self.uniform_cells[index]
+        if known:
+            return known == 1
+        cell_flags = self.board.cell_flags
+        uniform = True
+        for nx, ny in ((x, y), (x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+            if 0 <= nx < size and 0 <= ny < size and cell_flags(nx, ny) & (HAZARD | BREEZE | STENCH):
+                uniform = False
+                break
+        self.uniform_cells[index] = 1 if uniform else 2
+        return uniform
+
+    def reconstruct_jump_path(self, came_from: list, current: int):
+        """
+        Reconstruye la ruta de `jump_point_search` rellenando los saltos celda a celda.
+
+        Args:
+            came_from (list): Punto de salto anterior de cada punto de salto (-1 si ninguno).
+            current (int): Índice de la celda final.
+
+        Returns:
+            list: Lista de posiciones que forman la ruta.
+        """
+        jump_points = self.reconstruct_path(came_from, current)
+        path = [jump_points[0]]
+        for x, y in jump_points[1:]:
+            px, py = path[-1]
+            dx, dy = (x > px) - (x < px), (y > py) - (y < py)
+            while (px, py) != (x, y):
+                px, py = px + dx, py + dy
+                path.append((px, py))
+        return path
+
+    def space_time_search(self, start: tuple, goal: tuple):
+        """
+        A* en el espacio-tiempo que tiene en cuenta los movimientos del pozo móvil.
+
+        El pozo se mueve tras cada paso del agente con
+        `Board.get_next_object_position`, así que su trayectoria depende solo
+        de la ruta del agente. Cada estado es (celda del agente, celda del
+        pozo, turno) y, al avanzar, la búsqueda simula la respuesta del pozo y
+        descarta los pasos en los que el agente entra en la celda del pozo o
+        el pozo salta sobre él. Las respuestas se guardan en una tabla de
+        reservas por (celda del pozo, celda del agente), ya que muchos estados
+        comparten la misma.
+
+        Un estado está dominado si a la misma celda del agente con el pozo en
+        la misma celda ya se llega antes y con un coste menor o igual: lo que
+        puede pasar desde él es lo mismo, con menos turnos por delante. Para
+        cada par de celdas se guardan solo los (turno, coste) no dominados.
+
+        Los costes y la heurística son los de `CostGrid`; la celda de la que
+        sale el pozo pasa a costar como si no lo tuviera. La búsqueda no pasa
+        de `SPACE_TIME_HORIZON` turnos por celda de lado ni de
+        `SPACE_TIME_MAX_EXPANSIONS` estados abiertos; si no llega al oro,
+        devuelve la ruta hasta el estado abierto más cercano a él y, entre
+        ellos, el de más turnos sin que el pozo alcance al agente.
+
+        Args:
+            start (tuple): Posición de inicio (x, y).
+            goal (tuple): Posición de destino (x, y).
+
+        Returns:
+            list, list: Posiciones de la ruta y posición prevista del pozo al
+            llegar a cada una, o None, None si no se puede dar ningún paso seguro.
+        """
+        board = self.board
+        size = board.size
+        horizon = SPACE_TIME_HORIZON * size
+        costs = self.cost_grid.update()
+        heuristic = self.cost_grid.heuristic
+        pit_start = board.moving_pit
+        vacated = pit_start[0] * size + pit_start[1]
+        vacated_cost = self.cost_grid.cell_cost(*pit_start, ignore=PIT)
+        start_index = start[0] * size + start[1]
+        goal_index = goal[0] * size + goal[1]
+        stats = self.stats
+        if stats is not None:
+            stats.counters["spacetime_searches"] += 1
+
+        # (celda del pozo, celda del agente) -> celda del pozo tras su respuesta
+        reservations = {}
+        # Estados creados: celda del agente, celda del pozo, turno, coste y estado anterior
+        states = [(start_index, vacated, 0, 0, -1)]
+        dominated = bytearray(1)
+        # (celda del agente, celda del pozo) -> estados no dominados
+        frontier = {(start_index, vacated): [0]}
+        h_score = heuristic(start, goal)
+        heap = [(h_score, h_score, 0)]
+        best = (h_score, 0, 0, 0)  # (h, -turno, coste, estado) de la mejor ruta parcial
+        expansions = 0
+
+        while heap:
+            _, h_score, state = heapq.heappop(heap)
+            if dominated[state]:
+                continue
+            current, pit, turn, g_score, _ = states[state]
+            if current == goal_index:
+                return self.reconstruct_space_time_path(states, state)
+
+            if (h_score, -turn, g_score) < best[:3]:
+                best = (h_score, -turn, g_score, state)
+            expansions += 1
+            if expansions > SPACE_TIME_MAX_EXPANSIONS:
+                break
+            if stats is not None:
+                stats.counters["expansions"] += 1
+            if turn >= horizon:
+                continue
+            x, y = divmod(current, size)
+
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < size and 0 <= ny < size):
+                    continue
+                neighbor = nx * size + ny
+                if neighbor == pit:
+                    continue
+                cost = vacated_cost if neighbor == vacated else costs[neighbor]
+                if cost == float("inf"):
+                    continue
+
+                # Al llegar al oro la partida acaba y el pozo ya no se mueve
+                next_pit = pit
+                if neighbor != goal_index:
+                    next_pit = reservations.get((pit, neighbor))
+                    if next_pit is None:
+                        next_pos = board.get_next_object_position(
+                            divmod(pit, size), (nx, ny), pit_start
+                        )
+                        next_pit = pit if next_pos is None else next_pos[0] * size + next_pos[1]
+                        reservations[(pit, neighbor)] = next_pit
+                    if next_pit == neighbor:
+                        continue
+
+                tentative_g_score = g_score + cost
+                next_turn = turn + 1
+                labels = frontier.setdefault((neighbor, next_pit), [])
+                if any(
+                    states[label][2] <= next_turn and states[label][3] <= tentative_g_score
+                    for label in labels
+                ):
+                    continue
+                for label in labels:
+                    # Los estados que el nuevo domina ya no hace falta abrirlos
+                    if next_turn <= states[label][2] and tentative_g_score <= states[label][3]:
+                        dominated[label] = 1
+                labels[:] = [label for label in labels if not dominated[label]]
+
+                labels.append(len(states))
+                states.append((neighbor, next_pit, next_turn, tentative_g_score, state))
+                dominated.append(0)
+                h_score = heuristic((nx, ny), goal)
+                heapq.heappush(heap, (tentative_g_score + h_score, h_score, len(states) - 1))
+
+        if best[3] == 0:
+            return None, None
+        return self.reconstruct_space_time_path(states, best[3])
+
+    def reconstruct_space_time_path(self, states: list, state: int):
+        """
+        Reconstruye la ruta de `space_time_search` y la trayectoria prevista del pozo.
+
+        Args:
+            states (list): Estados creados por la búsqueda.
+            state (int): Índice del estado final.
+
+        Returns:
+            list, list: Posiciones del agente y del pozo en cada turno de la ruta.
+        """
+        size = self.board.size
+        path = []
+        pit_path = []
+        while state != -1:
+            current, pit, _, _, state = states[state]
+            path.append(divmod(current, size))
+            pit_path.append(divmod(pit, size))
+        return path[::-1], pit_path[::-1]
+
     def get_neighbors(self, pos: tuple):
         """
         Devuelve las posiciones vecinas a una posición dada.
@@ -129,93 +757,62 @@ class AStarPlayer:
         """
         Calcula el coste de moverse a una posición dada.
 
+        Las celdas con percepciones son mucho más caras, las peligrosas no se
+        pueden atravesar y el coste baja al acercarse al oro (ver `CostGrid`).
+
         Args:
             pos (tuple): Posición a la que se quiere mover (x, y).
 
         Returns:
             float: Coste de moverse a la posición dada.
         """
-        cell = self.board.board[pos[0]][pos[1]]
-        base_cost = 1
-
-        # Aumentar significativamente el coste para celdas peligrosas
-        if "W" in cell or "O" in cell:
-            return float("inf")
-        elif "b" and "s" in cell:
-            base_cost *= 150
-        elif "b" in cell:
-            base_cost *= 50
-        elif "s" in cell:
-            base_cost *= 100
-
-        # Reducir el coste para celdas más cercanas al oro
-        distance_to_gold = self.board.heuristic(pos, self.board.gold_pos)
-        gold_factor = max(1, self.board.size - distance_to_gold)
+        return self.cost_grid.cost(pos)
 
-        return base_cost / gold_factor
-
-    def reconstruct_path(self, came_from: dict, current: tuple):
+    def reconstruct_path(self, came_from: list, current: int):
         """
         Reconstruye la ruta óptima a partir de los nodos visitados.
 
         Args:
-            came_from (dict): Diccionario con los nodos visitados.
-            current (tuple): Posición actual (x, y).
+            came_from (list): Índice de la celda desde la que se llegó a cada celda (-1 si ninguna).
+            current (int): Índice de la celda final.
 
         Returns:
             list: Lista de posiciones que forman la ruta óptima."""
-        path = [current]
-        while current in came_from:
+        size = self.board.size
+        path = []
+        while current != -1:
+            path.append(divmod(current, size))
             current = came_from[current]
-            path.append(current)
         return path[::-1]
 
     def run(self):
         """
         Ejecuta el juego y el algoritmo A* para encontrar la ruta óptima hacia el oro.
         """
+        from src.ui.game_loop import GameLoop
+
         running = True
         while running:
             self.board.reset()
-            self.path = None
-            self.calculate_path()
-
-            game_running = True
-            while game_running:
-                for event in self.game.get_events():
-                    if event.type == pygame.QUIT:
-                        game_running = False
-                        running = False
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            game_running = False
-                            running = False
-
-                move = self.get_best_move()
-                if move:
-                    self.board.move_agent(move)
-                self.game.draw_board()
-
-                game_over, message = self.board.check_game_over()
-                if game_over:
-                    print(message)
-                    self.game.draw_board()
-                    # Mostrar mensaje y opciones
-                    restart = self.game.show_game_over_screen(message)
-                    if restart:
-                        game_running = False
-                    else:
-                        game_running = False
-                        running = False
-                    break  # Salir del bucle interno
-
-                time.sleep(0.7)
+            self.new_game()
+
+            loop = GameLoop(self, step_seconds=0.7, speed=self.speed, fps=self.fps)
+            try:
+                running = loop.play()
+            finally:
+                loop.close()
+
+            if self.stats is not None:
+                self.stats.write(
+                    player=type(self).__name__,
+                    planner=self.planner,
+                    size=self.board.size,
+                    result=loop.message,
+                )
 
             if running and not self.board.custom_board:
                 print("Generando un nuevo tablero aleatorio...")
             elif running:
                 print("Reiniciando el tablero personalizado...")
 
-            pygame.time.wait(1000)  # Esperar 1 segundo antes de reiniciar
-
         self.game.quit()
@@ -0,0 +1,212 @@
+from array import array
+
+from ..cells import BREEZE, HAZARD, STENCH
+from ..sparse_board import SparseBoard
+
+# Coste base de entrar en una celda según sus percepciones
+BASE_COST = 1
+BREEZE_COST = 50
+STENCH_COST = 100
+BREEZE_STENCH_COST = 150
+
+
+def base_cost(flags: int):
+    """
+    Devuelve el coste base de una celda a partir de sus bits.
+
+    Args:
+        flags (int): Bits de la celda definidos en `cells`.
+
+    Returns:
+        float: Coste base, o infinito si la celda es peligrosa.
+    """
+    if flags & HAZARD:
+        return float("inf")
+    if flags & BREEZE and flags & STENCH:
+        return BREEZE_STENCH_COST
+    if flags & BREEZE:
+        return BREEZE_COST
+    if flags & STENCH:
+        return STENCH_COST
+    return BASE_COST
+
+
+# Coste base de cada combinación de bits de una celda
+BASE_COSTS = tuple(base_cost(flags) for flags in range(256))
+
+
+class LazyCosts(dict):
+    """
+    Costes de las celdas de un `SparseBoard`, calculados la primera vez que se leen.
+
+    Se indexa igual que la rejilla densa (`x * size + y`), pero solo guarda las
+    celdas que han consultado los planificadores.
+    """
+
+    def __init__(self, cost_fn, size: int):
+        """
+        Args:
+            cost_fn (callable): Función que recibe una posición (x, y) y
+                devuelve el coste de entrar en ella.
+            size (int): Tamaño del tablero.
+        """
+        super().__init__()
+        self.cost_fn = cost_fn
+        self.size = size
+
+    def __missing__(self, index: int):
+        cost = self[index] = self.cost_fn(divmod(index, self.size))
+        return cost
+
+
+class CostGrid:
+    """
+    Coste de entrar en cada celda del tablero para los planificadores de `AStarPlayer`.
+
+    El coste de una celda es su coste base (1, o el de la brisa, el hedor o
+    ambos) multiplicado por `size + d`, donde `d` es la distancia de Manhattan
+    al oro: las celdas cercanas al oro son más baratas, pero ningún paso cuesta
+    menos de `size`. Así la distancia de Manhattan por `size` (o la cota más
+    ajustada de `heuristic`) nunca sobrestima lo que falta y es consistente,
+    de modo que las celdas cerradas de A* no se vuelven a abrir. Los costes
+    son enteros, lo que evita empates rotos por errores de redondeo.
+
+    La rejilla se calcula entera la primera vez a partir de los bits del
+    tablero, sin NumPy, y después solo se actualizan las celdas que indica
+    `Board.changes_since`. Los costes se guardan en un `array` de dobles por
+    índice `x * size + y`. En un `SparseBoard` no se reserva la rejilla
+    completa: `LazyCosts` calcula cada celda al consultarla.
+    """
+
+    def __init__(self, board):
+        """
+        Inicializa la rejilla sin calcular ningún coste.
+
+        Args:
+            board (Board): Tablero cuyos costes se calculan.
+        """
+        self.board = board
+        self.size = board.size
+        self.revision = None
+        self.costs = None
+
+    def update(self):
+        """
+        Pone al día los costes con los cambios del tablero desde la última consulta.
+
+        Returns:
+            array: Coste de cada celda por índice `x * size + y` (`LazyCosts`
+            si el tablero es disperso).
+        """
+        board = self.board
+        if self.revision == board.revision:
+            return self.costs
+        changes = None if self.revision is None else board.changes_since(self.revision)
+        if changes is None:
+            self.costs = self.build()
+        else:
+            size = self.size
+            for x, y in changes:
+                self.costs[x * size + y] = self.cell_cost(x, y)
+        self.revision = board.revision
+        return self.costs
+
+    def build(self):
+        """
+        Calcula los costes de todas las celdas a partir de los bits del tablero.
+
+        Returns:
+            array: Coste de cada celda por índice `x * size + y`, o `LazyCosts`
+            si el tablero es disperso.
+        """
+        board = self.board
+        size = self.size = board.size
+        if isinstance(board, SparseBoard):
+            return LazyCosts(self.position_cost, size)
+
+        gold_x, gold_y = board.gold_pos
+        cells = board._cells
+        # `size` más la distancia al oro en columnas; se suma la de filas en cada fila
+        columns = [size + abs(y - gold_y) for y in range(size)]
+        costs = array("d")
+        for x in range(size):
+            dx = abs(x - gold_x)
+            row = cells[x * size : (x + 1) * size]
+            costs.extend([BASE_COSTS[value] * (column + dx) for value, column in zip(row, columns)])
+        return costs
+
+    def cell_cost(self, x: int, y: int, ignore: int = 0):
+        """
+        Calcula el coste de una sola celda, igual que `build`.
+
+        Args:
+            x (int): Fila de la celda.
+            y (int): Columna de la celda.
+            ignore (int): Bits de la celda que no se tienen en cuenta, por
+                ejemplo `PIT` para la celda que deja libre el pozo móvil.
+
+        Returns:
+            float: Coste de entrar en la celda.
+        """
+        board = self.board
+        gold_x, gold_y = board.gold_pos
+        distance = abs(x - gold_x) + abs(y - gold_y)
+        flags = board.cell_flags(x, y) & ~ignore
+        if ignore & HAZARD:
+            # Sin el peligro, la celda muestra las percepciones de sus vecinas
+            flags |= board.perception_flags(x, y)
+        return float(BASE_COSTS[flags] * (self.size + distance))
+
+    def position_cost(self, pos: tuple):
+        """
+        Calcula el coste de una posición con `cell_cost`, sin consultar la rejilla.
+
+        Args:
+            pos (tuple): Posición (x, y).
+
+        Returns:
+            float: Coste de entrar en la celda.
+        """
+        return self.cell_cost(pos[0], pos[1])
+
+    def cost(self, pos: tuple):
+        """
+        Devuelve el coste de entrar en una posición.
+
+        Args:
+            pos (tuple): Posición (x, y).
+
+        Returns:
+            float: Coste de entrar en la celda.
+        """
+        return self.update()[pos[0] * self.size + pos[1]]
+
+    def min_cost(self):
+        """
+        Devuelve el menor coste posible de un paso.
+
+        Returns:
+            int: Coste de una celda sin percepciones junto al oro.
+        """
+        return BASE_COST * self.board.size
+
+    def heuristic(self, pos: tuple, goal: tuple):
+        """
+        Estimación consistente del coste de ir de una posición a otra.
+
+        Hacia el oro, el camino más barato a distancia `d` entra en celdas a
+        distancia `d - 1`, ..., 0 del oro, así que cuesta al menos
+        `d * size + d * (d - 1) / 2`. Hacia otro destino solo se sabe que
+        cada paso cuesta al menos `size`.
+
+        Args:
+            pos (tuple): Posición de partida (x, y).
+            goal (tuple): Posición de destino (x, y).
+
+        Returns:
+            int: Cota inferior del coste entre las dos posiciones.
+        """
+        d = abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
+        if goal == self.board.gold_pos:
+            return BASE_COST * (d * self.board.size + d * (d - 1) // 2)
+        return d * self.min_cost()
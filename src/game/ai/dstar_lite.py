@@ -0,0 +1,204 @@
+from .costs import LazyCosts
+from .indexed_heap import IndexedMinHeap
+from .search_state import cell_values
+
+
+class DStarLite:
+    """
+    Planificador incremental D* Lite sobre las celdas del tablero.
+
+    Busca hacia atrás desde el destino, de modo que `g` guarda el coste de ir
+    de cada celda al destino. Cuando cambia el coste de algunas celdas solo se
+    reparan los valores afectados en lugar de repetir la búsqueda completa, y
+    el agente puede avanzar sin perder el trabajo hecho.
+
+    El coste de moverse a una celda lo da `cost_fn`, igual que en
+    `AStarPlayer.get_cost`. La heurística es la distancia de Manhattan
+    multiplicada por `min_cost`, que debe ser el menor coste posible de un paso
+    para que sea consistente.
+
+    Con `sparse`, `g`, `rhs`, los costes y la cola se guardan en diccionarios
+    y solo ocupan memoria por las celdas que visita la búsqueda.
+    """
+
+    def __init__(self, size: int, cost_fn, min_cost: float = 1.0, sparse: bool = False):
+        """
+        Inicializa el planificador.
+
+        Args:
+            size (int): Tamaño del tablero.
+            cost_fn (callable): Función que recibe una posición (x, y) y devuelve el coste de entrar en ella.
+            min_cost (float): Menor coste posible de entrar en una celda.
+            sparse (bool): Si es True no se preasigna el estado de todas las celdas.
+        """
+        self.size = size
+        self.cost_fn = cost_fn
+        self.min_cost = min_cost
+        self.sparse = sparse
+        self.start = None
+        self.goal = None
+
+    def initialize(self, start: tuple, goal: tuple):
+        """
+        Prepara una búsqueda nueva desde `start` hasta `goal`.
+
+        Args:
+            start (tuple): Posición inicial (x, y).
+            goal (tuple): Posición de destino (x, y).
+        """
+        size = self.size
+        cells = size * size
+        self.g = cell_values(cells, float("inf"), self.sparse)
+        self.rhs = cell_values(cells, float("inf"), self.sparse)
+        if self.sparse:
+            self.costs = LazyCosts(self.cost_fn, size)
+            self.queue = IndexedMinHeap()
+        else:
+            self.costs = [self.cost_fn(divmod(index, size)) for index in range(cells)]
+            self.queue = IndexedMinHeap(cells)
+        self.km = 0
+        self.start = start[0] * size + start[1]
+        self.last_start = self.start
+        self.goal = goal[0] * size + goal[1]
+        self.expansions = 0
+
+        self.rhs[self.goal] = 0
+        self.queue.push(self.goal, self.calculate_key(self.goal))
+
+    def heuristic(self, a: int, b: int):
+        """
+        Estimación del coste entre dos celdas.
+
+        Args:
+            a (int): Índice de la primera celda.
+            b (int): Índice de la segunda celda.
+
+        Returns:
+            float: Distancia de Manhattan multiplicada por el coste mínimo de un paso.
+        """
+        ax, ay = divmod(a, self.size)
+        bx, by = divmod(b, self.size)
+        return (abs(ax - bx) + abs(ay - by)) * self.min_cost
+
+    def calculate_key(self, index: int):
+        value = min(self.g[index], self.rhs[index])
+        return (value + self.heuristic(self.start, index) + self.km, value, index)
+
+    def neighbors(self, index: int):
+        """
+        Devuelve los índices de las celdas vecinas dentro del tablero.
+
+        Args:
+            index (int): Índice de la celda.
+
+        Returns:
+            list: Índices vecinos en el orden arriba, abajo, izquierda, derecha.
+        """
+        size = self.size
+        x, y = divmod(index, size)
+        result = []
+        if x > 0:
+            result.append(index - size)
+        if x < size - 1:
+            result.append(index + size)
+        if y > 0:
+            result.append(index - 1)
+        if y < size - 1:
+            result.append(index + 1)
+        return result
+
+    def update_vertex(self, index: int):
+        if index != self.goal:
+            g, costs = self.g, self.costs
+            self.rhs[index] = min(
+                [costs[neighbor] + g[neighbor] for neighbor in self.neighbors(index)]
+            )
+        in_queue = index in self.queue
+        if self.g[index] != self.rhs[index]:
+            if in_queue:
+                self.queue.update(index, self.calculate_key(index))
+            else:
+                self.queue.push(index, self.calculate_key(index))
+        elif in_queue:
+            self.queue.remove(index)
+
+    def compute_shortest_path(self):
+        """
+        Expande celdas hasta que el coste desde el inicio es correcto.
+        """
+        queue, g, rhs = self.queue, self.g, self.rhs
+        start = self.start
+        while queue:
+            index, old_key = queue.peek()
+            start_key = self.calculate_key(start)
+            if not (old_key[:2] < start_key[:2] or rhs[start] != g[start]):
+                break
+
+            self.expansions += 1
+            new_key = self.calculate_key(index)
+            if old_key[:2] < new_key[:2]:
+                queue.update(index, new_key)
+            elif g[index] > rhs[index]:
+                g[index] = rhs[index]
+                queue.remove(index)
+                for neighbor in self.neighbors(index):
+                    self.update_vertex(neighbor)
+            else:
+                g[index] = float("inf")
+                self.update_vertex(index)
+                for neighbor in self.neighbors(index):
+                    self.update_vertex(neighbor)
+
+    def move_start(self, start: tuple):
+        """
+        Actualiza la posición del agente sin descartar la búsqueda.
+
+        Args:
+            start (tuple): Nueva posición inicial (x, y).
+        """
+        self.start = start[0] * self.size + start[1]
+        self.km += self.heuristic(self.last_start, self.start)
+        self.last_start = self.start
+
+    def update_cells(self, positions):
+        """
+        Vuelve a leer el coste de unas celdas y repara las celdas afectadas.
+
+        Args:
+            positions (iterable): Posiciones (x, y) cuyo coste puede haber cambiado.
+        """
+        size = self.size
+        for x, y in positions:
+            index = x * size + y
+            cost = self.cost_fn((x, y))
+            if cost == self.costs[index]:
+                continue
+            self.costs[index] = cost
+            # El coste de una celda afecta a los arcos que entran en ella
+            for neighbor in self.neighbors(index):
+                self.update_vertex(neighbor)
+
+    def extract_path(self):
+        """
+        Sigue los menores costes desde el inicio hasta el destino.
+
+        Returns:
+            list: Posiciones (x, y) de la ruta, o None si el destino no es alcanzable.
+        """
+        if self.g[self.start] == float("inf"):
+            return None
+
+        size = self.size
+        g, costs = self.g, self.costs
+        current = self.start
+        path = [divmod(current, size)]
+        while current != self.goal:
+            if len(path) > size * size:
+                return None
+            current = min(
+                self.neighbors(current), key=lambda neighbor: costs[neighbor] + g[neighbor]
+            )
+            if g[current] == float("inf"):
+                return None
+            path.append(divmod(current, size))
+        return path
@@ -0,0 +1,415 @@
+import heapq
+from collections import Counter
+
+# Lado de los clústeres en celdas
+CLUSTER_SIZE = 16
+# Las entradas de al menos esta longitud tienen una transición en cada extremo
+# en lugar de una sola en el centro
+LONG_ENTRANCE = 6
+
+NEIGHBOR_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class Cluster:
+    """
+    Bloque del tablero con las celdas `x0 <= x < x1` y `y0 <= y < y1`.
+
+    Guarda el coste de entrar en cada una de sus celdas, sus nodos abstractos
+    (las celdas de transición de sus bordes) y, para cada nodo ya expandido,
+    las aristas abstractas que salen de él.
+    """
+
+    def __init__(self, x0: int, x1: int, y0: int, y1: int, costs: list):
+        self.x0 = x0
+        self.x1 = x1
+        self.y0 = y0
+        self.y1 = y1
+        self.width = y1 - y0
+        self.costs = costs
+        # Vecinos transitables de cada celda, por índice local
+        height = x1 - x0
+        self.adjacency = []
+        for index in range(len(costs)):
+            x, y = divmod(index, self.width)
+            self.adjacency.append(
+                [
+                    (x + dx) * self.width + y + dy
+                    for dx, dy in NEIGHBOR_DELTAS
+                    if 0 <= x + dx < height
+                    and 0 <= y + dy < self.width
+                    and costs[(x + dx) * self.width + y + dy] != float("inf")
+                ]
+            )
+        # Nodo -> celdas de otros clústeres a las que se pasa desde él
+        self.exits = {}
+        # Nodo -> lista de (nodo, coste) dentro del clúster y hacia otros clústeres
+        self.edges = {}
+
+    def index(self, pos: tuple):
+        return (pos[0] - self.x0) * self.width + pos[1] - self.y0
+
+    def position(self, index: int):
+        x, y = divmod(index, self.width)
+        return x + self.x0, y + self.y0
+
+    def cost(self, pos: tuple):
+        return self.costs[self.index(pos)]
+
+
+class HierarchicalPlanner:
+    """
+    Planificador jerárquico HPA* sobre las celdas del tablero.
+
+    El tablero se divide en clústeres de `cluster_size` x `cluster_size`
+    celdas. Cada tramo de borde transitable entre dos clústeres vecinos es una
+    entrada con una o dos celdas de transición a cada lado, que son los nodos
+    del grafo abstracto. Las aristas entre nodos del mismo clúster llevan el
+    coste del mejor camino dentro del clúster y las aristas entre clústeres,
+    el coste de entrar en la celda vecina.
+
+    Las rutas se buscan primero en el grafo abstracto y luego se refinan
+    solo los tramos de los clústeres por los que pasan. Los clústeres se
+    abstraen la primera vez que la búsqueda llega a ellos y las aristas de
+    cada nodo, la primera vez que se expande, así que el trabajo depende de la
+    zona explorada y no del tamaño del tablero.
+
+    El coste de moverse a una celda lo da `cost_fn`, igual que en
+    `AStarPlayer.get_cost`, y la heurística es la distancia de Manhattan
+    multiplicada por `min_cost`, como en `DStarLite`.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        cost_fn,
+        min_cost: float = 1.0,
+        cluster_size: int = CLUSTER_SIZE,
+        counters: Counter = None,
+    ):
+        """
+        Inicializa el planificador sin ningún clúster abstraído.
+
+        Args:
+            size (int): Tamaño del tablero.
+            cost_fn (callable): Función que recibe una posición (x, y) y devuelve
+                el coste de entrar en ella.
+            min_cost (float): Menor coste posible de entrar en una celda.
+            cluster_size (int): Lado de los clústeres en celdas.
+            counters (Counter): Contadores de las estadísticas del jugador, si están activas.
+        """
+        self.size = size
+        self.cost_fn = cost_fn
+        self.min_cost = min_cost
+        self.cluster_size = cluster_size
+        self.counters = counters
+        self.clusters = {}
+        # (clúster, clúster vecino) -> pares de celdas de transición del borde común
+        self.borders = {}
+
+    def cluster_of(self, pos: tuple):
+        return pos[0] // self.cluster_size, pos[1] // self.cluster_size
+
+    def get_cluster(self, key: tuple):
+        """
+        Devuelve un clúster, abstrayéndolo si todavía no lo está.
+
+        Args:
+            key (tuple): Coordenadas (fila, columna) del clúster.
+
+        Returns:
+            Cluster: Clúster con sus costes y nodos abstractos.
+        """
+        cluster = self.clusters.get(key)
+        if cluster is not None:
+            return cluster
+
+        cx, cy = key
+        x0, y0 = cx * self.cluster_size, cy * self.cluster_size
+        x1, y1 = min(x0 + self.cluster_size, self.size), min(y0 + self.cluster_size, self.size)
+        costs = [self.cost_fn((x, y)) for x in range(x0, x1) for y in range(y0, y1)]
+        cluster = Cluster(x0, x1, y0, y1, costs)
+        clusters = (self.size + self.cluster_size - 1) // self.cluster_size
+        for dx, dy in NEIGHBOR_DELTAS:
+            neighbor = (cx + dx, cy + dy)
+            if not (0 <= neighbor[0] < clusters and 0 <= neighbor[1] < clusters):
+                continue
+            for inside, outside in self.border(key, neighbor):
+                cluster.exits.setdefault(inside, []).append(outside)
+        self.clusters[key] = cluster
+        if self.counters is not None:
+            self.counters["hpa_clusters"] += 1
+        return cluster
+
+    def border(self, key: tuple, neighbor: tuple):
+        """
+        Calcula las transiciones del borde entre dos clústeres vecinos.
+
+        Args:
+            key (tuple): Clúster desde el que se mira.
+            neighbor (tuple): Clúster vecino.
+
+        Returns:
+            list: Pares (celda de `key`, celda de `neighbor`) de cada transición.
+        """
+        cached = self.borders.get((key, neighbor))
+        if cached is not None:
+            return cached
+
+        size = self.cluster_size
+        dx, dy = neighbor[0] - key[0], neighbor[1] - key[1]
+        x0, y0 = key[0] * size, key[1] * size
+        x1, y1 = min(x0 + size, self.size), min(y0 + size, self.size)
+        # Celdas del clúster pegadas al vecino
+        if dx:
+            row = x1 - 1 if dx > 0 else x0
+            edge = [(row, y) for y in range(y0, y1)]
+        else:
+            column = y1 - 1 if dy > 0 else y0
+            edge = [(x, column) for x in range(x0, x1)]
+
+        # Tramos de celdas transitables a ambos lados del borde
+        runs = [[]]
+        for inside in edge:
+            outside = (inside[0] + dx, inside[1] + dy)
+            if self.cost_fn(inside) != float("inf") and self.cost_fn(outside) != float("inf"):
+                runs[-1].append((inside, outside))
+            elif runs[-1]:
+                runs.append([])
+
+        transitions = []
+        for run in runs:
+            if len(run) >= LONG_ENTRANCE:
+                transitions.extend((run[0], run[-1]))
+            elif run:
+                transitions.append(run[len(run) // 2])
+
+        self.borders[(key, neighbor)] = transitions
+        self.borders[(neighbor, key)] = [(outside, inside) for inside, outside in transitions]
+        return transitions
+
+    def invalidate(self, positions):
+        """
+        Descarta la abstracción de los clústeres afectados por celdas que han cambiado.
+
+        Se vuelve a abstraer el clúster de cada celda y, si la celda está en un
+        borde, también el borde y el clúster del otro lado, porque sus
+        transiciones pueden haber cambiado.
+
+        Args:
+            positions: Posiciones (x, y) de las celdas que han cambiado.
+        """
+        size = self.cluster_size
+        for pos in positions:
+            key = self.cluster_of(pos)
+            self.clusters.pop(key, None)
+            for dx, dy in NEIGHBOR_DELTAS:
+                other = (pos[0] + dx, pos[1] + dy)
+                if not (0 <= other[0] < self.size and 0 <= other[1] < self.size):
+                    continue
+                neighbor = (other[0] // size, other[1] // size)
+                if neighbor != key:
+                    self.borders.pop((key, neighbor), None)
+                    self.borders.pop((neighbor, key), None)
+                    self.clusters.pop(neighbor, None)
+            # Las aristas de los clústeres vecinos que apuntan a este se recalculan al expandirlas
+            for dx, dy in NEIGHBOR_DELTAS:
+                neighbor = self.clusters.get((key[0] + dx, key[1] + dy))
+                if neighbor is not None:
+                    neighbor.edges = {
+                        node: edges
+                        for node, edges in neighbor.edges.items()
+                        if all(self.cluster_of(target) != key for target, _ in edges)
+                    }
+
+    def local_search(self, cluster: Cluster, source: tuple, targets=(), reverse: bool = False):
+        """
+        Búsqueda de Dijkstra limitada a las celdas de un clúster.
+
+        Las búsquedas son pequeñas (como mucho `cluster_size`² celdas), así
+        que usan `heapq` con entradas repetidas en lugar de un montículo
+        indexado.
+
+        Args:
+            cluster (Cluster): Clúster en el que se busca.
+            source (tuple): Celda de partida.
+            targets: Celdas a las que hay que llegar; la búsqueda se detiene al
+                cerrarlas todas. Sin celdas, recorre todo el clúster.
+            reverse (bool): Si es True, calcula el coste de ir de cada celda a `source`.
+
+        Returns:
+            list, list: Coste de cada celda del clúster (por índice local) y
+            celda anterior en el camino (-1 si ninguna).
+        """
+        costs = cluster.costs
+        adjacency = cluster.adjacency
+        cells = len(costs)
+        distance = [float("inf")] * cells
+        came_from = [-1] * cells
+        closed = bytearray(cells)
+        start = cluster.index(source)
+        remaining = {cluster.index(target) for target in targets}
+        distance[start] = 0
+        heap = [(0, start)]
+
+        while heap:
+            value, current = heapq.heappop(heap)
+            if closed[current]:
+                continue
+            closed[current] = 1
+            remaining.discard(current)
+            if targets and not remaining:
+                break
+            # Al buscar hacia atrás, ir del vecino a `current` cuesta entrar en `current`
+            step = costs[current]
+            for neighbor in adjacency[current]:
+                new_value = value + (step if reverse else costs[neighbor])
+                if new_value < distance[neighbor]:
+                    distance[neighbor] = new_value
+                    came_from[neighbor] = current
+                    heapq.heappush(heap, (new_value, neighbor))
+
+        return distance, came_from
+
+    def node_edges(self, node: tuple):
+        """
+        Devuelve las aristas abstractas que salen de un nodo, calculándolas la primera vez.
+
+        Args:
+            node (tuple): Celda de transición (x, y).
+
+        Returns:
+            list: Pares (nodo destino, coste).
+        """
+        cluster = self.get_cluster(self.cluster_of(node))
+        edges = cluster.edges.get(node)
+        if edges is not None:
+            return edges
+
+        distance, _ = self.local_search(cluster, node, cluster.exits)
+        edges = [
+            (other, distance[cluster.index(other)])
+            for other in cluster.exits
+            if other != node and distance[cluster.index(other)] != float("inf")
+        ]
+        for outside in cluster.exits.get(node, ()):
+            edges.append((outside, self.get_cluster(self.cluster_of(outside)).cost(outside)))
+        cluster.edges[node] = edges
+        return edges
+
+    def find_path(self, start: tuple, goal: tuple):
+        """
+        Busca una ruta en el grafo abstracto y la refina celda a celda.
+
+        Args:
+            start (tuple): Posición inicial (x, y).
+            goal (tuple): Posición de destino (x, y).
+
+        Returns:
+            list: Lista de posiciones de la ruta, o None si no hay ruta.
+        """
+        start_cluster = self.get_cluster(self.cluster_of(start))
+        goal_cluster = self.get_cluster(self.cluster_of(goal))
+
+        # Conectar el inicio y el destino con los nodos de sus clústeres
+        targets = list(start_cluster.exits)
+        if start_cluster is goal_cluster:
+            targets.append(goal)
+        distance, _ = self.local_search(start_cluster, start, targets)
+        start_edges = [
+            (node, distance[start_cluster.index(node)])
+            for node in start_cluster.exits
+            if distance[start_cluster.index(node)] != float("inf")
+        ]
+        if start_cluster is goal_cluster and distance[start_cluster.index(goal)] != float("inf"):
+            start_edges.append((goal, distance[start_cluster.index(goal)]))
+        distance, _ = self.local_search(goal_cluster, goal, goal_cluster.exits, reverse=True)
+        to_goal = {
+            node: distance[goal_cluster.index(node)]
+            for node in goal_cluster.exits
+            if distance[goal_cluster.index(node)] != float("inf")
+        }
+
+        abstract_path = self.abstract_search(start, goal, start_edges, to_goal)
+        if abstract_path is None:
+            return None
+        return self.refine(abstract_path)
+
+    def abstract_search(self, start: tuple, goal: tuple, start_edges: list, to_goal: dict):
+        """
+        A* sobre el grafo abstracto.
+
+        Args:
+            start (tuple): Posición inicial.
+            goal (tuple): Posición de destino.
+            start_edges (list): Aristas (nodo, coste) desde el inicio.
+            to_goal (dict): Coste de ir al destino desde cada nodo de su clúster.
+
+        Returns:
+            list: Nodos abstractos desde `start` hasta `goal`, o None si no hay ruta.
+        """
+        goal_x, goal_y = goal
+        min_cost = self.min_cost
+        g_score = {start: 0}
+        came_from = {start: None}
+        closed = set()
+        heap = [((abs(start[0] - goal_x) + abs(start[1] - goal_y)) * min_cost, start)]
+
+        while heap:
+            _, current = heapq.heappop(heap)
+            if current in closed:
+                continue
+            if current == goal:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = came_from[current]
+                return path[::-1]
+            closed.add(current)
+            if self.counters is not None:
+                self.counters["hpa_expansions"] += 1
+
+            edges = start_edges if current == start else self.node_edges(current)
+            if current in to_goal:
+                edges = edges + [(goal, to_goal[current])]
+            for neighbor, cost in edges:
+                tentative_g_score = g_score[current] + cost
+                if neighbor in closed or tentative_g_score >= g_score.get(neighbor, float("inf")):
+                    continue
+                g_score[neighbor] = tentative_g_score
+                came_from[neighbor] = current
+                distance = abs(neighbor[0] - goal_x) + abs(neighbor[1] - goal_y)
+                f_score = tentative_g_score + distance * min_cost
+                heapq.heappush(heap, (f_score, neighbor))
+
+        return None
+
+    def refine(self, abstract_path: list):
+        """
+        Convierte una ruta abstracta en la lista de celdas que recorre.
+
+        Los pasos entre clústeres vecinos ya son movimientos de una celda; los
+        tramos dentro de un clúster se buscan solo en ese clúster.
+
+        Args:
+            abstract_path (list): Nodos abstractos de la ruta.
+
+        Returns:
+            list: Lista de posiciones de la ruta.
+        """
+        path = [abstract_path[0]]
+        for source, target in zip(abstract_path, abstract_path[1:]):
+            if source == target:
+                continue
+            key = self.cluster_of(source)
+            if key != self.cluster_of(target):
+                path.append(target)
+                continue
+            cluster = self.get_cluster(key)
+            _, came_from = self.local_search(cluster, source, (target,))
+            segment = []
+            current = cluster.index(target)
+            while current != cluster.index(source):
+                segment.append(cluster.position(current))
+                current = came_from[current]
+            path.extend(reversed(segment))
+        return path
@@ -0,0 +1,186 @@
+from .search_state import DefaultMap
+
+
+class IndexedMinHeap:
+    """
+    Montículo binario de mínimos sobre elementos enteros `0..capacity - 1`.
+
+    Guarda la posición de cada elemento dentro del montículo, por lo que
+    comprobar si un elemento está en él es O(1) y reducir su prioridad es
+    O(log n). Las prioridades pueden ser cualquier valor comparable, por
+    ejemplo tuplas `(f, índice)` para desempatar de forma determinista.
+
+    Sin `capacity`, las prioridades y posiciones se guardan en diccionarios
+    en lugar de listas preasignadas, para los tableros dispersos en los que
+    solo se visita una parte de las celdas.
+    """
+
+    def __init__(self, capacity: int = None):
+        """
+        Inicializa el montículo vacío.
+
+        Args:
+            capacity (int): Número de elementos distintos que puede contener,
+                o None si no se conoce de antemano.
+        """
+        self.heap = []
+        if capacity is None:
+            self.keys = {}
+            self.position = DefaultMap(-1)
+        else:
+            self.keys = [None] * capacity
+            self.position = [-1] * capacity
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item: int):
+        return self.position[item] != -1
+
+    def push(self, item: int, key):
+        """
+        Añade un elemento que no está en el montículo.
+
+        Args:
+            item (int): Elemento a añadir.
+            key: Prioridad del elemento.
+        """
+        self.keys[item] = key
+        self.position[item] = len(self.heap)
+        self.heap.append(item)
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item: int, key):
+        """
+        Reduce la prioridad de un elemento que ya está en el montículo.
+
+        Args:
+            item (int): Elemento a actualizar.
+            key: Nueva prioridad, menor o igual que la actual.
+        """
+        self.keys[item] = key
+        self._sift_up(self.position[item])
+
+    def update(self, item: int, key):
+        """
+        Cambia la prioridad de un elemento que ya está en el montículo.
+
+        Args:
+            item (int): Elemento a actualizar.
+            key: Nueva prioridad, mayor o menor que la actual.
+        """
+        self.keys[item] = key
+        index = self.position[item]
+        self._sift_up(index)
+        self._sift_down(self.position[item])
+
+    def remove(self, item: int):
+        """
+        Elimina un elemento del montículo.
+
+        Args:
+            item (int): Elemento a eliminar.
+        """
+        heap = self.heap
+        index = self.position[item]
+        last = heap.pop()
+        self.position[item] = -1
+        if index < len(heap):
+            heap[index] = last
+            self.position[last] = index
+            self._sift_up(index)
+            self._sift_down(self.position[last])
+
+    def peek(self):
+        """
+        Devuelve el elemento de menor prioridad sin extraerlo.
+
+        Returns:
+            int, object: Elemento y su prioridad.
+        """
+        item = self.heap[0]
+        return item, self.keys[item]
+
+    def pop(self):
+        """
+        Extrae el elemento de menor prioridad.
+
+        Returns:
+            int, object: Elemento extraído y su prioridad.
+        """
+        heap = self.heap
+        item = heap[0]
+        last = heap.pop()
+        self.position[item] = -1
+        if heap:
+            heap[0] = last
+            self.position[last] = 0
+            self._sift_down(0)
+        return item, self.keys[item]
+
+    def _sift_up(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        item = heap[index]
+        key = keys[item]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if not key < keys[parent]:
+                break
+            heap[index] = parent
+            position[parent] = index
+            index = parent_index
+        heap[index] = item
+        position[item] = index
+
+    def _sift_down(self, index: int):
+        heap, keys, position = self.heap, self.keys, self.position
+        size = len(heap)
+        item = heap[index]
+        key = keys[item]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            right_index = child_index + 1
+            if right_index < size and keys[heap[right_index]] < keys[heap[child_index]]:
+                child_index = right_index
+            child = heap[child_index]
+            if not keys[child] < key:
+                break
+            heap[index] = child
+            position[child] = index
+            index = child_index
+        heap[index] = item
+        position[item] = index
+
+
+class CountingMinHeap(IndexedMinHeap):
+    """
+    `IndexedMinHeap` que cuenta sus operaciones en un `Counter`.
+
+    Solo se usa con las estadísticas activadas, así el montículo normal no
+    paga el coste de contar.
+    """
+
+    def __init__(self, capacity: int, counters):
+        """
+        Args:
+            capacity (int): Número de elementos distintos que puede contener,
+                o None si no se conoce de antemano.
+            counters (collections.Counter): Contadores donde se suman las operaciones.
+        """
+        super().__init__(capacity)
+        self.counters = counters
+
+    def push(self, item: int, key):
+        self.counters["heap_pushes"] += 1
+        super().push(item, key)
+
+    def decrease_key(self, item: int, key):
+        self.counters["heap_decrease_keys"] += 1
+        super().decrease_key(item, key)
+
+    def pop(self):
+        self.counters["heap_pops"] += 1
+        return super().pop()
@@ -1,86 +1,501 @@
 import math
 import sys
-import pygame
 import time
 import os
-from copy import deepcopy
 
-from ..utils import get_agent_moves
+from ..cells import HAZARD
+from ..utils import DIRECTION_DELTAS, get_agent_moves
+from .stats import GameStats, timed
+from .transposition import (
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+    ZobristHasher,
+)
 
 # Ajustar el sys.path para permitir imports relativos
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
 sys.path.append(project_root)
 
-from src.ui.pygame_mode import PygameMode
+
+class SearchTimeout(Exception):
+    """
+    Se lanza cuando una búsqueda agota el tiempo asignado a la jugada.
+    """
+
 
 class MinMaxPlayer:
-    def __init__(self, board, depth_limit=6):
+    def __init__(
+        self,
+        board,
+        depth_limit=6,
+        tt_size=1 << 16,
+        time_budget_ms=None,
+        max_depth=32,
+        headless=False,
+        search_workers=1,
+        split_depth=2,
+        adversary="agent",
+        speed=1.0,
+        fps=30,
+        stats_path=None,
+        profile_turn=None,
+    ):
+        if adversary not in ("agent", "pit"):
+            raise ValueError(f"Modelo de adversario desconocido: {adversary}")
         self.board = board
         self.depth_limit = depth_limit
-        self.game = PygameMode(board)
+        # Con un presupuesto en milisegundos se usa profundización iterativa
+        self.time_budget_ms = time_budget_ms
+        self.max_depth = max_depth
+        # Sin ventana para las simulaciones por lotes
+        self.game = None
+        if not headless:
+            # pygame solo se carga si hay ventana
+            from src.ui.pygame_mode import PygameMode
+
+            self.game = PygameMode(board)
+        # Multiplicador de velocidad de la partida (0 para ir lo más rápido posible)
+        self.speed = speed
+        self.fps = fps
         self.recent_moves = []  # Lista para almacenar los movimientos recientes
+        # La tabla de transposición se conserva entre turnos de una misma partida
+        self.hasher = ZobristHasher(board.size)
+        self.tt = TranspositionTable(tt_size)
+        self.history = {}
+        self.pv_moves = {}
+        self.deadline = None
+        self.nodes = 0
+        self.completed_depth = 0
+        # Búsqueda en paralelo: procesos y número de niveles en los que se reparten los hermanos
+        self.search_workers = search_workers
+        self.split_depth = split_depth
+        self.executor = None
+        # En los nodos min juega el propio agente ("agent") o responde el pozo móvil ("pit")
+        self.adversary = adversary
+        # Estadísticas internas, solo si se piden (informe en `stats_path`, perfil de un turno)
+        self.stats = None
+        if stats_path is not None or profile_turn is not None:
+            self.stats = GameStats(stats_path, profile_turn)
+
+    def new_game(self):
+        """
+        Olvida la información de búsqueda de la partida anterior.
+        """
+        if self.hasher.size != self.board.size:
+            self.hasher = ZobristHasher(self.board.size)
+        self.tt.clear()
+        self.history = {}
+        self.pv_moves = {}
+        self.recent_moves = []
+        if self.stats is not None:
+            self.stats.reset()
+            # La búsqueda secuencial deshace los movimientos y no copia nunca el tablero
+            self.stats.counters["board_copies"] = 0
 
     def is_move_against_wall(self, board, move):
-        previous_pos = board.agent_pos
-        new_board = self.simulate_move(board, move)
-        new_pos = new_board.agent_pos
-        if previous_pos == new_pos:
-            return True
-        return False
+        dx, dy = DIRECTION_DELTAS[move]
+        new_x, new_y = board.agent_pos[0] + dx, board.agent_pos[1] + dy
+        return not (0 <= new_x < board.size and 0 <= new_y < board.size)
 
     def get_best_move(self):
-        best_move, _ = self.alphabeta(self.board, 0, True, -math.inf, math.inf)
+        if self.hasher.size != self.board.size:
+            self.new_game()
+        self.tt.new_search()
+        if self.time_budget_ms is not None:
+            return self.iterative_deepening(self.time_budget_ms)
+        best_move, _ = self.timed_search(self.depth_limit)
+        self.completed_depth = self.depth_limit
         return best_move
 
+    def timed_search(self, depth):
+        """
+        Llama a `search` y, con las estadísticas activas, guarda su tiempo y sus nodos.
+
+        Args:
+            depth (int): Profundidad de la búsqueda (`depth_limit`).
+
+        Returns:
+            str, float: Mejor movimiento y su valor.
+        """
+        if self.stats is None:
+            return self.search(self.board)
+        start = time.perf_counter()
+        nodes = self.nodes
+        try:
+            return self.search(self.board)
+        finally:
+            self.stats.add_depth(depth, time.perf_counter() - start, self.nodes - nodes)
+
+    def iterative_deepening(self, time_budget_ms):
+        """
+        Busca a profundidades crecientes hasta agotar el tiempo de la jugada.
+
+        Cada iteración ordena los movimientos con la variante principal de la
+        anterior y con la heurística de historia. La profundidad 1 se completa
+        siempre para tener un movimiento que devolver.
+
+        Args:
+            time_budget_ms (float): Tiempo máximo de la jugada en milisegundos.
+
+        Returns:
+            str: Mejor movimiento de la iteración más profunda completada.
+        """
+        start = time.perf_counter()
+        depth_limit = self.depth_limit
+        best_move = None
+        self.completed_depth = 0
+        try:
+            for depth in range(1, self.max_depth + 1):
+                self.depth_limit = depth
+                # La primera iteración no se interrumpe
+                self.deadline = start + time_budget_ms / 1000 if depth > 1 else None
+                move, _ = self.timed_search(depth)
+                best_move = move
+                self.completed_depth = depth
+                self.pv_moves = self.principal_variation(depth)
+                if time.perf_counter() - start >= time_budget_ms / 1000:
+                    break
+        except SearchTimeout:
+            pass
+        finally:
+            self.depth_limit = depth_limit
+            self.deadline = None
+        return best_move
+
+    def search(self, board):
+        """
+        Busca el mejor movimiento desde la raíz, en paralelo si hay varios procesos.
+
+        Args:
+            board (Board): Tablero en la posición actual.
+
+        Returns:
+            str, float: Mejor movimiento y su valor.
+        """
+        if self.search_workers > 1:
+            return self.parallel_alphabeta(board, 0, True, -math.inf, math.inf)
+        return self.alphabeta(board, 0, True, -math.inf, math.inf)
+
+    def parallel_alphabeta(self, board, depth, is_maximizing, alpha, beta):
+        """
+        Búsqueda alfa-beta que reparte los hermanos entre procesos (Young Brothers Wait).
+
+        En los primeros `split_depth` niveles de la variante principal se busca
+        primero el hermano mayor en este proceso y, con la cota que devuelve,
+        el resto de hermanos a la vez en el conjunto de procesos. Cada proceso
+        recibe el estado del tablero con `to_state` y su clase.
+
+        Los hermanos se comparan en el mismo orden y con la misma regla que en
+        `alphabeta` y cada proceso empieza con la tabla de transposición vacía.
+        Por eso, si la tabla de este jugador también está vacía (un jugador
+        nuevo o tras `new_game`), en la raíz se elige el mismo movimiento y con
+        el mismo valor que en la búsqueda secuencial a la misma profundidad.
+        En una partida la búsqueda secuencial conserva la tabla entre turnos y
+        sus cotas pueden llevarla a otro movimiento.
+        """
+        remaining = self.depth_limit - depth
+        game_over, _ = board.check_game_over()
+        if game_over or depth >= self.split_depth or remaining <= 1:
+            return self.alphabeta(board, depth, is_maximizing, alpha, beta)
+
+        self.nodes += 1
+        if not is_maximizing and self.adversary == "pit":
+            return None, self.forced_reply(board, depth, alpha, beta, self.parallel_alphabeta)
+
+        key = self.hasher.hash(board, is_maximizing)
+        entry = self.tt.probe(key)
+        first_move = self.pv_moves.get(key) or (entry.move if entry is not None else None)
+        moves = [
+            move
+            for move in self.ordered_moves(first_move, board.agent_pos)
+            if not self.is_move_against_wall(board, move)
+        ]
+        original_alpha, original_beta = alpha, beta
+
+        # El hermano mayor se busca primero para obtener la cota de los demás
+        best_move = moves[0]
+        record = board.apply_move(best_move)
+        try:
+            _, best_value = self.parallel_alphabeta(board, depth + 1, not is_maximizing, alpha, beta)
+        finally:
+            board.undo_move(record)
+        if is_maximizing:
+            alpha = max(alpha, best_value)
+        else:
+            beta = min(beta, best_value)
+
+        if alpha < beta and len(moves) > 1:
+            if self.executor is None:
+                # multiprocessing solo se carga si la búsqueda es paralela
+                from concurrent.futures import ProcessPoolExecutor
+
+                self.executor = ProcessPoolExecutor(max_workers=self.search_workers)
+            state = board.to_state()
+            if self.stats is not None:
+                # La instantánea y el tablero que reconstruye cada proceso
+                self.stats.counters["board_copies"] += len(moves)
+            time_left = None
+            if self.deadline is not None:
+                time_left = self.deadline - time.perf_counter()
+            futures = [
+                self.executor.submit(
+                    _search_child,
+                    type(board),
+                    state,
+                    move,
+                    depth + 1,
+                    not is_maximizing,
+                    alpha,
+                    beta,
+                    self.worker_options(),
+                    time_left,
+                )
+                for move in moves[1:]
+            ]
+            results = []
+            for future in futures:
+                value, nodes = future.result()
+                self.nodes += nodes
+                results.append(value)
+            if any(value is None for value in results):
+                raise SearchTimeout()
+            for move, value in zip(moves[1:], results):
+                if (value > best_value) if is_maximizing else (value < best_value):
+                    best_value = value
+                    best_move = move
+
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= original_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.tt.store(key, remaining, flag, best_value, best_move)
+        return (best_move if is_maximizing else None), best_value
+
+    def worker_options(self):
+        """
+        Opciones con las que se crea el jugador de cada proceso de búsqueda.
+
+        Returns:
+            dict: Atributos de `MinMaxPlayer` que deben coincidir con los de este jugador.
+        """
+        return {"depth_limit": self.depth_limit, "adversary": self.adversary}
+
+    def close(self):
+        """
+        Termina los procesos de la búsqueda en paralelo, si se han creado.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def principal_variation(self, depth):
+        """
+        Recorre la tabla de transposición desde la posición actual siguiendo los mejores movimientos.
+
+        Con el modelo de adversario "pit", en los nodos min se aplica la única
+        respuesta del pozo, igual que en `forced_reply`. Los movimientos se
+        deshacen en orden inverso al terminar.
+
+        Args:
+            depth (int): Número máximo de movimientos a recorrer.
+
+        Returns:
+            dict: Mejor movimiento de cada posición de la variante, por clave Zobrist.
+        """
+        pv_moves = {}
+        records = []
+        is_maximizing = True
+        for _ in range(depth):
+            if self.board.check_game_over()[0]:
+                break
+            if not is_maximizing and self.adversary == "pit":
+                record = self.board.apply_hazard_move()
+                if record is not None:
+                    records.append(record)
+                is_maximizing = True
+                continue
+            key = self.hasher.hash(self.board, is_maximizing)
+            entry = self.tt.probe(key)
+            if entry is None or entry.move is None or key in pv_moves:
+                break
+            pv_moves[key] = entry.move
+            record = self.board.apply_move(entry.move)
+            if record is None:
+                break
+            records.append(record)
+            is_maximizing = not is_maximizing
+        for record in reversed(records):
+            self.board.undo_move(record)
+        return pv_moves
+
+    def ordered_moves(self, first_move, pos=None):
+        """
+        Devuelve los movimientos del agente en el orden en que se deben explorar.
+
+        Primero va el movimiento indicado y después el resto según la
+        heurística de historia de la casilla `pos`.
+
+        Args:
+            first_move (str): Movimiento a probar primero (por ejemplo, el de la tabla de transposición).
+            pos (tuple): Posición del agente para consultar la historia.
+
+        Returns:
+            list: Movimientos en el orden en que se deben explorar.
+        """
+        moves = get_agent_moves()
+        if pos is not None and self.history:
+            moves.sort(key=lambda move: -self.history.get((pos, move), 0))
+        if first_move is not None:
+            moves.remove(first_move)
+            moves.insert(0, first_move)
+        return moves
+
     def alphabeta(self, board, depth, is_maximizing, alpha, beta):
+        """
+        Búsqueda alfa-beta sobre el propio tablero.
+
+        Cada movimiento se aplica con `Board.apply_move` y se deshace con
+        `Board.undo_move` al volver de la recursión, por lo que el tablero
+        queda igual que estaba al terminar. Los resultados se guardan en la
+        tabla de transposición para no repetir posiciones ya buscadas.
+        """
+        self.nodes += 1
+        if (
+            self.deadline is not None
+            and not self.nodes & 255
+            and time.perf_counter() > self.deadline
+        ):
+            raise SearchTimeout()
+
         game_over, message = board.check_game_over()
         if game_over or depth == self.depth_limit:
             return None, self.evaluate(board)
 
+        remaining = self.depth_limit - depth
+        key = self.hasher.hash(board, is_maximizing)
+        entry = self.tt.probe(key)
+        first_move = self.pv_moves.get(key)
+        if entry is not None:
+            first_move = first_move or entry.move
+            # En la raíz siempre se busca para obtener un movimiento
+            if depth > 0 and entry.depth >= remaining:
+                if (
+                    entry.flag == EXACT
+                    or (entry.flag == LOWER_BOUND and entry.value >= beta)
+                    or (entry.flag == UPPER_BOUND and entry.value <= alpha)
+                ):
+                    self.tt.cutoffs += 1
+                    return (entry.move if is_maximizing else None), entry.value
+
+        original_alpha, original_beta = alpha, beta
+        agent_pos = board.agent_pos
+        best_move = None
+
         if is_maximizing:
             best_value = float("-inf")
-            best_move = None
-            for move in get_agent_moves():
-                if self.is_move_against_wall(board, move):
+            for move in self.ordered_moves(first_move, agent_pos):
+                record = board.apply_move(move)
+                if record is None:
                     continue
-                new_board = self.simulate_move(board, move)
-                _, value = self.alphabeta(new_board, depth + 1, False, alpha, beta)
+                try:
+                    _, value = self.alphabeta(board, depth + 1, False, alpha, beta)
+                finally:
+                    board.undo_move(record)
                 if value > best_value:
                     best_value = value
                     best_move = move
                 alpha = max(alpha, best_value)
                 if beta <= alpha:
+                    self.record_cutoff(agent_pos, move, remaining)
                     break
-            return best_move, best_value
+        elif self.adversary == "pit":
+            best_value = self.forced_reply(board, depth, alpha, beta, self.alphabeta)
         else:
             best_value = float("inf")
-            for move in get_agent_moves():
-                if self.is_move_against_wall(board, move):
+            for move in self.ordered_moves(first_move, agent_pos):
+                record = board.apply_move(move)
+                if record is None:
                     continue
-                new_board = self.simulate_move(board, move)
-                _, value = self.alphabeta(new_board, depth + 1, True, alpha, beta)
+                try:
+                    _, value = self.alphabeta(board, depth + 1, True, alpha, beta)
+                finally:
+                    board.undo_move(record)
                 if value < best_value:
                     best_value = value
+                    best_move = move
                 beta = min(beta, best_value)
                 if beta <= alpha:
+                    self.record_cutoff(agent_pos, move, remaining)
                     break
-            return None, best_value
+
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= original_beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.tt.store(key, remaining, flag, best_value, best_move)
+
+        return (best_move if is_maximizing else None), best_value
+
+    def forced_reply(self, board, depth, alpha, beta, search):
+        """
+        Nodo min con el modelo de adversario "pit": el pozo móvil hace su único movimiento.
+
+        El pozo sigue la misma política que `Board.move_dangerous_object`, así
+        que el nodo tiene un solo sucesor en lugar de los cuatro movimientos
+        del agente. Si el pozo no puede moverse, vuelve a jugar el agente.
+
+        Args:
+            board (Board): Tablero en la posición del nodo.
+            depth (int): Profundidad del nodo.
+            alpha (float): Cota inferior.
+            beta (float): Cota superior.
+            search (callable): Búsqueda con la que se evalúa el sucesor.
+
+        Returns:
+            float: Valor del nodo.
+        """
+        record = board.apply_hazard_move()
+        try:
+            _, value = search(board, depth + 1, True, alpha, beta)
+        finally:
+            if record is not None:
+                board.undo_move(record)
+        return value
+
+    def record_cutoff(self, pos, move, remaining):
+        """
+        Premia en la heurística de historia un movimiento que ha producido un corte.
+
+        Args:
+            pos (tuple): Posición del agente antes del movimiento.
+            move (str): Movimiento que ha producido el corte.
+            remaining (int): Profundidad restante del nodo.
+        """
+        self.history[(pos, move)] = self.history.get((pos, move), 0) + remaining * remaining
+        if self.stats is not None:
+            self.stats.counters["cutoffs"] += 1
 
     def is_safe_move(self, board, move):
         """
         Verifica si un movimiento es seguro.
         Solo evita casillas con peligros reales ('W' o 'O').
         """
-        new_board = self.simulate_move(board, move)
-        agent_pos = new_board.agent_pos
-
-        # Evitar casillas con peligros reales
-        cell = new_board.board[agent_pos[0]][agent_pos[1]]
-        if "W" in cell or "O" in cell:
-            return False
+        record = board.apply_move(move)
+        if record is None:
+            return True  # Chocar con una pared no mueve al agente
+        agent_pos = board.agent_pos
+        is_safe = not board.cell_flags(agent_pos[0], agent_pos[1]) & HAZARD
+        board.undo_move(record)
 
-        return True  # Permitir movimientos a otras casillas
+        # Evitar casillas con peligros reales y permitir el resto
+        return is_safe
 
     def evaluate(self, board):
         """
@@ -90,8 +505,11 @@ class MinMaxPlayer:
         agent_pos = board.agent_pos
         gold_pos = board.gold_pos
 
-        # Distancia de Manhattan al oro (priorizar acercarse al oro)
-        distance = abs(agent_pos[0] - gold_pos[0]) + abs(agent_pos[1] - gold_pos[1])
+        # Pasos hasta el oro rodeando los peligros (priorizar acercarse al oro)
+        distance = board.distance_to_gold(agent_pos)
+        if distance == math.inf:
+            # Sin camino hasta el oro se usa la distancia de Manhattan
+            distance = abs(agent_pos[0] - gold_pos[0]) + abs(agent_pos[1] - gold_pos[1])
         score -= distance * 100  # Multiplicar por 10 para dar más peso
 
         # Si el agente está en el oro, dar una puntuación alta
@@ -99,17 +517,60 @@ class MinMaxPlayer:
             score += 1000
 
         # Penalización por morir (entrar en un pozo o Wumpus)
-        cell = board.board[agent_pos[0]][agent_pos[1]]
-        if "W" in cell or "O" in cell:
+        if board.cell_flags(agent_pos[0], agent_pos[1]) & HAZARD:
             score -= 1000  # Penalización alta por morir
 
         return score
 
-    def simulate_move(self, board, move):
-        new_board = deepcopy(board)
-        new_board.verbose = False  # Desactivar los prints durante la simulación
-        new_board.move_agent(move)
-        return new_board
+    def decide(self):
+        """
+        Elige el movimiento del agente. El tablero queda como estaba.
+
+        Si el mejor movimiento choca con una pared se usa el primer movimiento posible.
+
+        Returns:
+            str: Movimiento elegido.
+        """
+        if self.stats is None:
+            move = self.get_best_move()
+        else:
+            nodes, tt_cutoffs = self.nodes, self.tt.cutoffs
+            move = self.stats.timed("think", self.get_best_move)
+            self.stats.counters["nodes"] += self.nodes - nodes
+            self.stats.counters["tt_cutoffs"] += self.tt.cutoffs - tt_cutoffs
+        if not move or self.is_move_against_wall(self.board, move):
+            move = next(
+                move
+                for move in get_agent_moves()
+                if not self.is_move_against_wall(self.board, move)
+            )
+        return move
+
+    def apply_turn(self, move):
+        """
+        Mueve el agente y, si la partida sigue, el pozo móvil.
+
+        Args:
+            move (str): Movimiento devuelto por `decide`.
+        """
+        timed(self.stats, "move", self.board.move_agent, move)
+        # Agregar el movimiento a la lista de movimientos recientes
+        self.recent_moves.append(move)
+        if len(self.recent_moves) > 6:
+            self.recent_moves.pop(0)
+        if not self.check_for_loop() and not self.board.check_game_over()[0]:
+            timed(self.stats, "hazard", self.board.move_dangerous_object)
+
+    def play_turn(self):
+        """
+        Juega un turno completo: mueve el agente y, si la partida sigue, el pozo móvil.
+
+        Returns:
+            str: Movimiento realizado por el agente.
+        """
+        move = self.decide()
+        self.apply_turn(move)
+        return move
 
     def check_for_loop(self):
         """
@@ -126,87 +587,72 @@ class MinMaxPlayer:
         return True
 
     def run(self):
+        from src.ui.game_loop import GameLoop
+
         running = True
         while running:
             self.board.reset()
-            self.recent_moves = []  # Reiniciar la lista de movimientos
-            game_running = True
-            while game_running:
-                for event in self.game.get_events():
-                    if event.type == pygame.QUIT:
-                        game_running = False
-                        running = False
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            game_running = False
-                            running = False
-
-                move = self.get_best_move()
-                if move and not self.is_move_against_wall(self.board, move):
-                    self.board.move_agent(move)
-                    # Agregar el movimiento a la lista de movimientos recientes
-                    self.recent_moves.append(move)
-                    if len(self.recent_moves) > 6:
-                        self.recent_moves.pop(0)
-                else:
-                    for move in get_agent_moves():
-                        if not self.is_move_against_wall(self.board, move):
-                            self.board.move_agent(move)
-                            # Agregar el movimiento a la lista de movimientos recientes
-                            self.recent_moves.append(move)
-                            if len(self.recent_moves) > 6:
-                                self.recent_moves.pop(0)
-                            break
-                print(f"El agente se mueve hacia {move}")
-                self.game.draw_board()
-                time.sleep(0.5)
-
-                # Comprobar si el agente está en un bucle
-                if self.check_for_loop():
-                    print("El agente se ha estancado en un bucle.")
-                    # Mostrar mensaje y opciones
-                    restart = self.game.show_game_over_screen("El agente se ha estancado en un bucle.")
-                    if restart:
-                        game_running = False
-                    else:
-                        game_running = False
-                        running = False
-                    break
+            self.new_game()  # Las posiciones y movimientos de la partida anterior ya no sirven
 
-                game_over, message = self.board.check_game_over()
-                if game_over:
-                    print(message)
-                    # Mostrar mensaje y opciones
-                    restart = self.game.show_game_over_screen(message)
-                    if restart:
-                        game_running = False
-                    else:
-                        game_running = False
-                        running = False
-                    break
-                else:
-                    self.board.move_dangerous_object()
-
-                self.game.draw_board()
-                time.sleep(0.5)
-
-                game_over, message = self.board.check_game_over()
-                if game_over:
-                    print(message)
-                    # Mostrar mensaje y opciones
-                    restart = self.game.show_game_over_screen(message)
-                    if restart:
-                        game_running = False
-                    else:
-                        game_running = False
-                        running = False
-                    break
+            loop = GameLoop(
+                self,
+                step_seconds=1.0,
+                speed=self.speed,
+                fps=self.fps,
+                on_turn=lambda move: print(f"El agente se mueve hacia {move}"),
+            )
+            try:
+                running = loop.play()
+            finally:
+                loop.close()
+
+            print(self.tt.report())
+            if self.stats is not None:
+                self.stats.write(
+                    player=type(self).__name__,
+                    adversary=self.adversary,
+                    size=self.board.size,
+                    result=loop.message,
+                )
 
             if running and not self.board.custom_board:
                 print("Generando un nuevo tablero aleatorio...")
             elif running:
                 print("Reiniciando el tablero personalizado...")
 
-            pygame.time.wait(1000)
+        self.close()
+        self.game.quit()
+
+
+# Jugador que reutiliza cada proceso de la búsqueda en paralelo
+_worker_player = None
+
+
+def _search_child(board_class, state, move, depth, is_maximizing, alpha, beta, options, time_left):
+    """
+    Busca un hermano de `MinMaxPlayer.parallel_alphabeta` en un proceso del conjunto.
+
+    Returns:
+        float, int: Valor del hijo (None si se agota el tiempo) y nodos visitados.
+    """
+    global _worker_player
+    board = board_class.from_state(state)
+    if _worker_player is None:
+        _worker_player = MinMaxPlayer(board, headless=True, **options)
+    player = _worker_player
+    player.board = board
+    for name, value in options.items():
+        setattr(player, name, value)
+    # Cada hijo empieza con una tabla vacía para que el resultado no dependa del reparto
+    player.new_game()
+    player.nodes = 0
+    player.deadline = None if time_left is None else time.perf_counter() + time_left
 
-        self.game.quit()
\ No newline at end of file
+    record = board.apply_move(move)
+    try:
+        _, value = player.alphabeta(board, depth, is_maximizing, alpha, beta)
+    except SearchTimeout:
+        value = None
+    finally:
+        board.undo_move(record)
+    return value, player.nodes
@@ -0,0 +1,53 @@
+class DefaultMap(dict):
+    """
+    Diccionario que devuelve un valor por defecto para las claves que no tiene.
+
+    El valor por defecto no se guarda al consultarlo, así que solo ocupa
+    memoria por las celdas a las que la búsqueda asigna un valor.
+    """
+
+    def __init__(self, default):
+        """
+        Args:
+            default: Valor de las claves que no se han asignado.
+        """
+        super().__init__()
+        self.default = default
+
+    def __missing__(self, key):
+        return self.default
+
+
+def cell_values(cells: int, default, sparse: bool = False):
+    """
+    Crea el valor de cada celda de una búsqueda, indexado por `x * size + y`.
+
+    Args:
+        cells (int): Número de celdas del tablero.
+        default: Valor inicial de cada celda.
+        sparse (bool): Si es True se usa un `DefaultMap` en lugar de una lista
+            preasignada, para los tableros dispersos en los que la búsqueda
+            solo visita una parte de las celdas.
+
+    Returns:
+        list: Lista de `cells` valores, o `DefaultMap` si `sparse`.
+    """
+    if sparse:
+        return DefaultMap(default)
+    return [default] * cells
+
+
+def cell_flags(cells: int, sparse: bool = False):
+    """
+    Crea una marca de un byte por celda, inicialmente 0, como `cell_values`.
+
+    Args:
+        cells (int): Número de celdas del tablero.
+        sparse (bool): Si es True se usa un `DefaultMap` en lugar de un `bytearray`.
+
+    Returns:
+        bytearray: Marca de cada celda, o `DefaultMap` si `sparse`.
+    """
+    if sparse:
+        return DefaultMap(0)
+    return bytearray(cells)
@@ -0,0 +1,172 @@
+import cProfile
+import json
+import pstats
+import time
+from collections import Counter
+
+# Fases de un turno de los jugadores automáticos
+PHASES = ("think", "move", "hazard", "draw")
+# Funciones del perfil que se guardan en el informe, por tiempo acumulado
+PROFILE_TOP = 25
+
+
+class GameStats:
+    """
+    Contadores y tiempos internos de un jugador automático durante una partida.
+
+    Solo existe si se activa al crear el jugador (`stats_path` o
+    `profile_turn`); si no, el jugador tiene `stats = None` y las búsquedas
+    solo comprueban eso fuera de sus bucles internos.
+    """
+
+    def __init__(self, path: str = None, profile_turn: int = None):
+        """
+        Args:
+            path (str): Archivo JSON lines al que se añade el informe de cada
+                partida. Sin archivo, el informe se muestra por pantalla.
+            profile_turn (int): Turno (desde 1) cuya decisión se ejecuta con `cProfile`.
+        """
+        self.path = path
+        self.profile_turn = profile_turn
+        self.reset()
+
+    def reset(self):
+        """
+        Vacía los contadores para empezar una partida nueva.
+        """
+        self.counters = Counter()
+        self.depths = {}
+        self.phases = {phase: [] for phase in PHASES}
+        self.decisions = 0
+        self.profile = None
+
+    def timed(self, phase: str, function, *args):
+        """
+        Ejecuta una fase del turno y guarda su duración.
+
+        La decisión número `profile_turn` de la partida se ejecuta además con
+        `cProfile`.
+
+        Args:
+            phase (str): Fase de `PHASES`.
+            function (callable): Función de la fase.
+            *args: Argumentos de la función.
+
+        Returns:
+            Lo que devuelva la función.
+        """
+        profiler = None
+        if phase == "think":
+            self.decisions += 1
+            if self.decisions == self.profile_turn:
+                profiler = cProfile.Profile()
+                function, args = profiler.runcall, (function, *args)
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.phases[phase].append((time.perf_counter() - start) * 1000)
+            if profiler is not None:
+                self.profile = profile_entries(profiler)
+
+    def add_depth(self, depth: int, seconds: float, nodes: int):
+        """
+        Acumula una búsqueda de MinMax a una profundidad.
+
+        Args:
+            depth (int): Profundidad de la búsqueda.
+            seconds (float): Duración de la búsqueda, completa o interrumpida.
+            nodes (int): Nodos visitados.
+        """
+        searches, total_ms, total_nodes = self.depths.get(depth, (0, 0.0, 0))
+        self.depths[depth] = (searches + 1, total_ms + seconds * 1000, total_nodes + nodes)
+
+    def report(self, **info):
+        """
+        Devuelve el informe de la partida.
+
+        Args:
+            **info: Datos de la partida que se añaden al informe (resultado, tamaño...).
+
+        Returns:
+            dict: Informe serializable a JSON.
+        """
+        phases = {}
+        for phase, times in self.phases.items():
+            if times:
+                phases[phase] = {
+                    "count": len(times),
+                    "total_ms": round(sum(times), 4),
+                    "mean_ms": round(sum(times) / len(times), 4),
+                    "max_ms": round(max(times), 4),
+                }
+        report = dict(info)
+        report["turns"] = self.decisions
+        report["counters"] = dict(sorted(self.counters.items()))
+        if self.depths:
+            report["depths"] = {
+                str(depth): {"searches": searches, "total_ms": round(total_ms, 4), "nodes": nodes}
+                for depth, (searches, total_ms, nodes) in sorted(self.depths.items())
+            }
+        report["phases"] = phases
+        if self.profile is not None:
+            report["profile_turn"] = self.profile_turn
+            report["profile"] = self.profile
+        return report
+
+    def write(self, **info):
+        """
+        Añade el informe de la partida a `path` o lo muestra si no hay archivo.
+
+        Args:
+            **info: Datos de la partida que se añaden al informe.
+        """
+        report = self.report(**info)
+        if self.path is None:
+            print(json.dumps(report, indent=2, ensure_ascii=False))
+            return
+        with open(self.path, "a") as file:
+            file.write(json.dumps(report, ensure_ascii=False) + "\n")
+
+
+def profile_entries(profiler: cProfile.Profile):
+    """
+    Resume un perfil en las funciones con más tiempo acumulado.
+
+    Args:
+        profiler (cProfile.Profile): Perfil de una decisión.
+
+    Returns:
+        list: Función, llamadas y tiempos propio y acumulado en milisegundos.
+    """
+    stats = pstats.Stats(profiler)
+    entries = []
+    for (file_name, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        entries.append(
+            {
+                "function": f"{file_name}:{line}({name})",
+                "calls": calls,
+                "own_ms": round(own * 1000, 4),
+                "cumulative_ms": round(cumulative * 1000, 4),
+            }
+        )
+    entries.sort(key=lambda entry: -entry["cumulative_ms"])
+    return entries[:PROFILE_TOP]
+
+
+def timed(stats: GameStats, phase: str, function, *args):
+    """
+    Ejecuta una fase del turno, midiéndola solo si las estadísticas están activas.
+
+    Args:
+        stats (GameStats): Estadísticas del jugador o None.
+        phase (str): Fase de `PHASES`.
+        function (callable): Función de la fase.
+        *args: Argumentos de la función.
+
+    Returns:
+        Lo que devuelva la función.
+    """
+    if stats is None:
+        return function(*args)
+    return stats.timed(phase, function, *args)
@@ -0,0 +1,206 @@
+import random
+from collections import namedtuple
+
+# Tipos de cota guardados en la tabla de transposición
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# A partir de este número de celdas las claves se calculan al pedirlas en lugar
+# de guardarlas en listas (tableros dispersos grandes)
+LAZY_KEY_CELLS = 1 << 16
+MASK_64 = (1 << 64) - 1
+
+TTEntry = namedtuple("TTEntry", ["key", "depth", "flag", "value", "move", "generation"])
+
+
+class ZobristHasher:
+    """
+    Calcula claves Zobrist de 64 bits para las posiciones de la búsqueda.
+
+    La clave combina la posición del agente, la del pozo móvil, la disponibilidad
+    de la flecha, el estado del Wumpus y el jugador al que le toca mover.
+    """
+
+    def __init__(self, size: int, seed: int = 0):
+        """
+        Genera las claves aleatorias para un tablero de un tamaño dado.
+
+        Args:
+            size (int): Tamaño del tablero.
+            seed (int): Semilla para que las claves sean reproducibles.
+        """
+        rng = random.Random(seed)
+        cells = size * size
+        self.size = size
+        if cells > LAZY_KEY_CELLS:
+            self.agent_keys = HashedKeys(rng.getrandbits(64))
+            self.pit_keys = HashedKeys(rng.getrandbits(64))
+            self.wumpus_keys = HashedKeys(rng.getrandbits(64))
+        else:
+            self.agent_keys = [rng.getrandbits(64) for _ in range(cells)]
+            self.pit_keys = [rng.getrandbits(64) for _ in range(cells)]
+            self.wumpus_keys = [rng.getrandbits(64) for _ in range(cells)]
+        self.dead_wumpus_key = rng.getrandbits(64)
+        self.arrow_key = rng.getrandbits(64)
+        self.maximizing_key = rng.getrandbits(64)
+
+    def hash(self, board, is_maximizing: bool):
+        """
+        Calcula la clave de la posición actual del tablero.
+
+        Args:
+            board (Board): Tablero a codificar.
+            is_maximizing (bool): True si le toca mover al jugador maximizador.
+
+        Returns:
+            int: Clave Zobrist de la posición.
+        """
+        size = self.size
+        x, y = board.agent_pos
+        key = self.agent_keys[x * size + y]
+        if board.moving_pit is not None:
+            x, y = board.moving_pit
+            key ^= self.pit_keys[x * size + y]
+        if board.wumpus_pos is not None:
+            x, y = board.wumpus_pos
+            key ^= self.wumpus_keys[x * size + y]
+        else:
+            key ^= self.dead_wumpus_key
+        if board.arrowAvailable:
+            key ^= self.arrow_key
+        if is_maximizing:
+            key ^= self.maximizing_key
+        return key
+
+
+class HashedKeys:
+    """
+    Claves de 64 bits por celda calculadas al pedirlas con SplitMix64.
+
+    Sustituye a la lista de claves en tableros grandes, donde guardar una
+    clave por celda ocuparía memoria proporcional al número de celdas.
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed
+
+    def __getitem__(self, index: int):
+        key = (self.seed + (index + 1) * 0x9E3779B97F4A7C15) & MASK_64
+        key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+        key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & MASK_64
+        return key ^ (key >> 31)
+
+
+class TranspositionTable:
+    """
+    Tabla de transposición de tamaño fijo indexada por clave Zobrist.
+
+    Cada posición de la tabla guarda una entrada. Una entrada nueva sustituye a
+    la existente si esta es de una búsqueda anterior o si la nueva se ha
+    calculado con una profundidad igual o mayor.
+    """
+
+    def __init__(self, max_entries: int = 1 << 16):
+        """
+        Inicializa la tabla vacía.
+
+        Args:
+            max_entries (int): Número máximo de entradas. Se redondea a una potencia de dos.
+        """
+        size = 1
+        while size < max_entries:
+            size <<= 1
+        self.mask = size - 1
+        self.entries = [None] * size
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        Pone a cero los contadores de uso de la tabla.
+        """
+        self.probes = 0
+        self.hits = 0
+        self.cutoffs = 0
+        self.stores = 0
+        self.replacements = 0
+
+    def clear(self):
+        """
+        Vacía la tabla y sus contadores, por ejemplo al empezar una partida nueva.
+        """
+        self.entries = [None] * (self.mask + 1)
+        self.generation = 0
+        self.reset_stats()
+
+    def new_search(self):
+        """
+        Marca el comienzo de una búsqueda nueva para envejecer las entradas anteriores.
+        """
+        self.generation += 1
+
+    def probe(self, key: int):
+        """
+        Busca la entrada de una posición.
+
+        Args:
+            key (int): Clave Zobrist de la posición.
+
+        Returns:
+            TTEntry: Entrada guardada o None si no hay ninguna para esa clave.
+        """
+        self.probes += 1
+        entry = self.entries[key & self.mask]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, flag: int, value: float, move: str):
+        """
+        Guarda el resultado de buscar una posición.
+
+        Args:
+            key (int): Clave Zobrist de la posición.
+            depth (int): Profundidad restante con la que se ha buscado.
+            flag (int): Tipo de cota del valor (EXACT, LOWER_BOUND o UPPER_BOUND).
+            value (float): Valor obtenido.
+            move (str): Mejor movimiento encontrado.
+        """
+        index = key & self.mask
+        current = self.entries[index]
+        if current is not None:
+            if current.generation == self.generation and current.depth > depth:
+                return
+            self.replacements += 1
+        self.entries[index] = TTEntry(key, depth, flag, value, move, self.generation)
+        self.stores += 1
+
+    def stats(self):
+        """
+        Devuelve los contadores de uso de la tabla.
+
+        Returns:
+            dict: Consultas, aciertos, cortes, escrituras y sustituciones.
+        """
+        return {
+            "probes": self.probes,
+            "hits": self.hits,
+            "cutoffs": self.cutoffs,
+            "stores": self.stores,
+            "replacements": self.replacements,
+        }
+
+    def report(self):
+        """
+        Devuelve un resumen legible de los contadores de la tabla.
+
+        Returns:
+            str: Resumen de aciertos y cortes.
+        """
+        hit_rate = self.hits / self.probes * 100 if self.probes else 0.0
+        return (
+            f"Tabla de transposición: {self.probes} consultas, {self.hits} aciertos "
+            f"({hit_rate:.1f}%), {self.cutoffs} cortes, {self.stores} escrituras"
+        )
@@ -1,6 +1,39 @@
 import random
-
-from .utils import manhattan_distance
+from collections import deque, namedtuple
+
+from .cells import (
+    AGENT,
+    BREEZE,
+    CELL_CHARS,
+    CHAR_TO_FLAG,
+    DEAD_WUMPUS,
+    GOLD,
+    HAZARD,
+    PIT,
+    STENCH,
+    WUMPUS,
+    BoardView,
+)
+from .flow_field import DIRECTION_NAMES, NO_DIRECTION, compute_flow_field
+from .utils import DIRECTION_DELTAS, manhattan_distance, num_pits, valid_cells
+
+# Registro con lo necesario para deshacer un movimiento aplicado con
+# `Board.apply_move`, `Board.apply_hazard_move` o `Board.apply_shot`.
+MoveUndo = namedtuple(
+    "MoveUndo",
+    [
+        "agent_pos",
+        "moving_pit",
+        "pit_index",
+        "wumpus_pos",
+        "arrow_available",
+        "cells",
+        "revision",
+    ],
+)
+
+# Número de cambios que se guardan para `Board.changes_since`
+CHANGE_LOG_SIZE = 256
 
 
 class Board:
@@ -8,7 +41,16 @@ class Board:
     Clase que representa el tablero del juego.
     """
 
-    def __init__(self, size: int = 6, custom_board: list = None, verbose: bool = True):
+    # Campos de distancias que se guardan, uno por posición de los peligros
+    FLOW_FIELD_CACHE_SIZE = 16
+
+    def __init__(
+        self,
+        size: int = 6,
+        custom_board: list = None,
+        verbose: bool = True,
+        seed: int = None,
+    ):
         """
         Inicializa el tablero con un tamaño y un tablero personalizado opcional.
 
@@ -16,22 +58,179 @@ class Board:
             size (int): Tamaño del tablero.
             custom_board (list): Tablero personalizado.
             verbose (bool): Controla la impresión de percepciones.
+            seed (int): Semilla del generador aleatorio del tablero.
         """
         self.size = size
         self.custom_board = custom_board
+        self.seed = seed
+        self.rng = random.Random(seed)
         self.arrowAvailable = True
         self.verbose = verbose
+        # Registro de las celdas cuyos peligros o percepciones han cambiado
+        self.revision = 0
+        self._changes = deque()
+        self._changes_start = 0
+        # Revisión del último cambio completo y campos de distancias calculados desde él
+        self._layout_revision = 0
+        self._flow_fields = {}
         self.reset()
 
+    @classmethod
+    def from_grid(cls, grid, verbose: bool = True, seed: int = None):
+        """
+        Crea un tablero personalizado a partir de los bits de sus celdas.
+
+        Solo se usan el agente, el Wumpus, los pozos y el oro; las percepciones
+        se vuelven a calcular.
+
+        Args:
+            grid: Matriz cuadrada con los bits de cada celda (por ejemplo, de `generate_boards`).
+            verbose (bool): Controla la impresión de percepciones.
+            seed (int): Semilla del generador aleatorio del tablero.
+
+        Returns:
+            Board: Tablero con ese contenido.
+        """
+        custom_board = [
+            ["".join(CELL_CHARS[int(value)]) for value in row] for row in grid
+        ]
+        return cls(len(custom_board), custom_board=custom_board, verbose=verbose, seed=seed)
+
+    def to_state(self):
+        """
+        Devuelve el estado de la partida en una tupla pequeña y fácil de enviar a otro proceso.
+
+        A diferencia de copiar el tablero entero, no incluye el generador
+        aleatorio, el registro de cambios ni el campo de flujo.
+
+        Returns:
+            tuple: Estado que acepta `Board.from_state`.
+        """
+        return (
+            self.size,
+            bytes(self._cells),
+            bytes(self._pit_count),
+            bytes(self._wumpus_count),
+            self.agent_pos,
+            self.wumpus_pos,
+            self.gold_pos,
+            tuple(self.pits),
+            self.moving_pit,
+            self.arrowAvailable,
+        )
+
+    @classmethod
+    def from_state(cls, state: tuple):
+        """
+        Reconstruye un tablero a partir de `to_state`, sin percepciones impresas.
+
+        Args:
+            state (tuple): Estado devuelto por `Board.to_state`.
+
+        Returns:
+            Board: Tablero en el mismo estado de la partida.
+        """
+        board = cls.__new__(cls)
+        (
+            board.size,
+            cells,
+            pit_count,
+            wumpus_count,
+            board.agent_pos,
+            board.wumpus_pos,
+            board.gold_pos,
+            pits,
+            board.moving_pit,
+            board.arrowAvailable,
+        ) = state
+        board.custom_board = None
+        board.seed = None
+        board.rng = random.Random()
+        board.verbose = False
+        board.revision = 0
+        board._changes = deque()
+        board._changes_start = 0
+        board._layout_revision = 0
+        board._flow_fields = {}
+        board._cells = bytearray(cells)
+        board._pit_count = bytearray(pit_count)
+        board._wumpus_count = bytearray(wumpus_count)
+        board.pits = list(pits)
+        return board
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_flow_fields"] = {}
+        return state
+
+    @property
+    def grid(self):
+        """
+        Matriz de NumPy con los bits de las celdas que comparte memoria con `_cells`.
+
+        NumPy solo se importa al usarla, para que el modo texto y las partidas
+        sin ventana no tengan que cargarlo.
+        """
+        import numpy as np
+
+        return np.frombuffer(self._cells, dtype=np.uint8).reshape(self.size, self.size)
+
+    @property
+    def board(self):
+        """
+        Vista de solo lectura del tablero como listas de letras.
+        """
+        return BoardView(self._cells, self.size)
+
+    def cell_flags(self, x: int, y: int):
+        """
+        Devuelve los bits de una celda.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
+
+        Returns:
+            int: Combinación de los bits definidos en `cells`.
+        """
+        return self._cells[x * self.size + y]
+
+    def set_flag(self, x: int, y: int, flag: int):
+        """
+        Activa un bit en una celda.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
+            flag (int): Bit a activar.
+        """
+        self._cells[x * self.size + y] |= flag
+
+    def clear_flag(self, x: int, y: int, flag: int):
+        """
+        Desactiva un bit en una celda.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
+            flag (int): Bit a desactivar.
+        """
+        self._cells[x * self.size + y] &= ~flag
+
     def reset(self):
         """
         Reinicia el tablero una vez que se ha terminado una partida.
         """
-        self.board = [[[] for _ in range(self.size)] for _ in range(self.size)]
+        self._cells = bytearray(self.size * self.size)
+        # Número de pozos y de Wumpus vivos adyacentes a cada celda. La brisa y
+        # el hedor de una celda están activos mientras su contador sea mayor que 0.
+        self._pit_count = bytearray(self.size * self.size)
+        self._wumpus_count = bytearray(self.size * self.size)
         self.agent_pos = None
         self.wumpus_pos = None
         self.gold_pos = None
         self.pits = []
+        self.moving_pit = None
         self.arrowAvailable = True
 
         if self.custom_board:
@@ -41,7 +240,49 @@ class Board:
 
         # Seleccionar aleatoriamente uno de los pozos
         if self.pits:
-            self.moving_pit = random.choice(self.pits)
+            self.moving_pit = self.pits[self.rng.randrange(len(self.pits))]
+
+        self.record_change()
+
+    def record_change(self, positions=None):
+        """
+        Anota que han cambiado los peligros o las percepciones de unas celdas.
+
+        Args:
+            positions (iterable): Posiciones (x, y) modificadas. None indica que
+                ha cambiado todo el tablero.
+        """
+        self.revision += 1
+        if positions is None:
+            self._changes.clear()
+            self._changes_start = self.revision
+            self._layout_revision = self.revision
+            self._flow_fields.clear()
+            return
+
+        self._changes.append((self.revision, tuple(positions)))
+        if len(self._changes) > CHANGE_LOG_SIZE:
+            self._changes_start = self._changes.popleft()[0]
+
+    def changes_since(self, revision: int):
+        """
+        Devuelve las celdas cuyos peligros o percepciones han cambiado desde una revisión.
+
+        Args:
+            revision (int): Valor de `revision` en la última consulta.
+
+        Returns:
+            set: Posiciones (x, y) modificadas, o None si hay que volver a leer
+            el tablero completo (reinicio, disparo o registro demasiado antiguo).
+        """
+        if revision < self._changes_start:
+            return None
+        positions = set()
+        for change_revision, cells in reversed(self._changes):
+            if change_revision <= revision:
+                break
+            positions.update(cells)
+        return positions
 
     def load_custom_board(self, custom_board: list):
         """
@@ -66,20 +307,19 @@ class Board:
                 for char in cell_content:
                     if char == "A":
                         self.agent_pos = (i, j)
-                        self.board[i][j].append("A")
+                        self.set_flag(i, j, AGENT)
                     elif char == "W":
                         self.wumpus_pos = (i, j)
-                        self.board[i][j].append("W")
+                        self.set_flag(i, j, WUMPUS)
                     elif char == "O":
                         self.pits.append((i, j))
-                        self.board[i][j].append("O")
+                        self.set_flag(i, j, PIT)
                     elif char == "G":
                         self.gold_pos = (i, j)
-                        self.board[i][j].append("G")
-                    elif char == "b":
-                        self.board[i][j].append("b")
-                    elif char == "s":
-                        self.board[i][j].append("s")
+                        self.set_flag(i, j, GOLD)
+
+        # La brisa y el hedor del archivo se deducen de los pozos y del Wumpus
+        self.place_breezes_and_stenches()
 
         if not self.agent_pos:
             raise ValueError("El tablero personalizado debe contener un agente (A)")
@@ -105,29 +345,23 @@ class Board:
         Coloca el agente en la esquina inferior izquierda del tablero.
         """
         self.agent_pos = (self.size - 1, 0)
-        self.board[self.agent_pos[0]][self.agent_pos[1]].append("A")
+        self.set_flag(self.agent_pos[0], self.agent_pos[1], AGENT)
 
     def place_wumpus(self):
         """
         Coloca el Wumpus en una celda aleatoria del tablero.
         """
-        while True:
-            x, y = random.randint(0, self.size - 1), random.randint(0, self.size - 1)
-            if self.is_valid_placement(x, y):
-                self.wumpus_pos = (x, y)
-                self.board[x][y].append("W")
-                break
+        (x, y), = self.sample_valid_cells(1)
+        self.wumpus_pos = (x, y)
+        self.set_flag(x, y, WUMPUS)
 
     def place_gold(self):
         """
         Coloca el oro en una celda aleatoria del tablero.
         """
-        while True:
-            x, y = random.randint(0, self.size - 1), random.randint(0, self.size - 1)
-            if self.is_valid_placement(x, y):
-                self.gold_pos = (x, y)
-                self.board[x][y].append("G")
-                break
+        (x, y), = self.sample_valid_cells(1)
+        self.gold_pos = (x, y)
+        self.set_flag(x, y, GOLD)
 
     def place_pits(self):
         """
@@ -136,16 +370,32 @@ class Board:
         El número de pozos se calcula como el 10% del tamaño del tablero.
         Es decir, si el tablero es de 6x6, se colocarán 3 pozos.
         """
-        num_pits = self.size * self.size // 10
-        for _ in range(num_pits):
-            while True:
-                x, y = random.randint(0, self.size - 1), random.randint(
-                    0, self.size - 1
-                )
-                if self.is_valid_placement(x, y) and not self.is_wumpus_or_pit(x, y):
-                    self.pits.append((x, y))
-                    self.board[x][y].append("O")
-                    break
+        for x, y in self.sample_valid_cells(num_pits(self.size)):
+            self.pits.append((x, y))
+            self.set_flag(x, y, PIT)
+
+    def sample_valid_cells(self, count: int):
+        """
+        Elige al azar, sin repetir, celdas válidas y libres para colocar objetos.
+
+        Args:
+            count (int): Número de celdas a elegir.
+
+        Returns:
+            list: Posiciones (x, y) elegidas.
+
+        Raises:
+            ValueError: Si no quedan celdas libres suficientes.
+        """
+        cells = self._cells
+        free = [
+            index for index in valid_cells(self.size) if not cells[index] & (AGENT | HAZARD | GOLD)
+        ]
+        if count > len(free):
+            raise ValueError(
+                f"No hay celdas libres suficientes en un tablero de {self.size}x{self.size}"
+            )
+        return [divmod(index, self.size) for index in self.rng.sample(free, count)]
 
     def is_valid_placement(self, x: int, y: int):
         """
@@ -155,12 +405,7 @@ class Board:
             x (int): Coordenada x de la celda.
             y (int): Coordenada y de la celda.
         """
-        if (
-            (x, y) == self.agent_pos
-            or (x, y) in self.pits
-            or (x, y) == self.wumpus_pos
-            or (x, y) == self.gold_pos
-        ):
+        if (x, y) == self.agent_pos or self.cell_flags(x, y) & (HAZARD | GOLD):
             return False
         return manhattan_distance(x, y, self.agent_pos[0], self.agent_pos[1]) > 2
 
@@ -175,18 +420,16 @@ class Board:
         Returns:
             bool: True si la celda contiene el Wumpus o un pozo, False en caso contrario.
         """
-        return "W" in self.board[x][y] or "O" in self.board[x][y]
+        return bool(self.cell_flags(x, y) & HAZARD)
 
     def place_breezes_and_stenches(self):
         """
         Coloca las percepciones de brisa y hedor en las celdas adyacentes a los pozos y al Wumpus.
         """
-        for x in range(self.size):
-            for y in range(self.size):
-                if "O" in self.board[x][y]:
-                    self.place_perception(x, y, "b")
-                elif "W" in self.board[x][y]:
-                    self.place_perception(x, y, "s")
+        for x, y in self.pits:
+            self.place_perception(x, y, "b")
+        if self.wumpus_pos is not None:
+            self.place_perception(self.wumpus_pos[0], self.wumpus_pos[1], "s")
 
     def place_perception(self, x: int, y: int, perception: str):
         """
@@ -197,19 +440,14 @@ class Board:
             y (int): Coordenada y de la celda.
             perception (str): Percepción a colocar (brisa o hedor).
         """
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.size and 0 <= ny < self.size:
-                if (
-                    perception not in self.board[nx][ny]
-                    and "O" not in self.board[nx][ny]
-                    and "W" not in self.board[nx][ny]
-                ):
-                    self.board[nx][ny].append(perception)
+        self.add_perceptions(x, y, "O" if perception == "b" else "W")
 
     def get_board(self):
         """
-        Devuelve el tablero actual.
+        Devuelve una vista de solo lectura del tablero actual.
+
+        Returns:
+            BoardView: Tablero como filas de tuplas de letras.
         """
         return self.board
 
@@ -223,16 +461,14 @@ class Board:
         Returns:
             bool: True si el movimiento es válido, False en caso contrario.
         """
-        dx, dy = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}.get(direction)
+        dx, dy = DIRECTION_DELTAS.get(direction)
 
         new_x, new_y = self.agent_pos[0] + dx, self.agent_pos[1] + dy
 
         if 0 <= new_x < self.size and 0 <= new_y < self.size:
-            if "A" in self.board[self.agent_pos[0]][self.agent_pos[1]]:
-                self.board[self.agent_pos[0]][self.agent_pos[1]].remove("A")
+            self.clear_flag(self.agent_pos[0], self.agent_pos[1], AGENT)
             self.agent_pos = (new_x, new_y)
-            if "A" not in self.board[new_x][new_y]:
-                self.board[new_x][new_y].append("A")
+            self.set_flag(new_x, new_y, AGENT)
             self.check_perceptions()
             return True
         return False
@@ -241,22 +477,24 @@ class Board:
         """
         Comprueba las percepciones en la celda actual del agente.
         """
-        x, y = self.agent_pos
+        flags = self.cell_flags(*self.agent_pos)
         perceptions = []
-        if "b" in self.board[x][y]:
+        if flags & BREEZE:
             perceptions.append("Sientes una brisa. Debe haber un hoyo cerca.")
-        if "s" in self.board[x][y]:
+        if flags & STENCH:
             perceptions.append("Percibes un hedor. El Wumpus debe estar cerca.")
 
         if perceptions and self.verbose:
             print("\n".join(perceptions))
 
-    def shoot_arrow(self, direction: str):
+    def shoot_arrow(self, direction: str, record: bool = True):
         """
         Dispara una flecha en una dirección dada.
 
         Args:
             direction (str): Dirección en la que disparar la flecha.
+            record (bool): Si se anota el cambio con `record_change`. Los disparos
+                de prueba de `apply_shot` no lo anotan porque se deshacen.
 
         Returns:
             bool: True si se ha matado al Wumpus, False en caso contrario.
@@ -264,9 +502,7 @@ class Board:
         if not self.arrowAvailable:
             return False, "No tienes flechas disponibles."
 
-        dx, dy = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}[
-            direction
-        ]
+        dx, dy = DIRECTION_DELTAS[direction]
 
         # Si la dirección no es válida, no se dispara la flecha
         if not (0 <= self.agent_pos[0] + dx < self.size and 0 <= self.agent_pos[1] + dy < self.size):
@@ -275,19 +511,23 @@ class Board:
         self.arrowAvailable = False
         
         x, y = self.agent_pos[0] + dx, self.agent_pos[1] + dy
-        if "W" in self.board[x][y]:
-            self.board[x][y].remove("W")
-            self.board[x][y].append("X")  # X represents dead Wumpus
-            self.wumpus_pos = None
+        if self.cell_flags(x, y) & WUMPUS:
             self.remove_stench()
+            self.clear_flag(x, y, WUMPUS)
+            self.set_flag(x, y, DEAD_WUMPUS)
+            self._refresh_perceptions(x, y)
+            self.wumpus_pos = None
+            if record:
+                self.record_change(self._with_neighbors(((x, y),)))
             return True, "¡Has matado al Wumpus!"
         return False, "Has fallado."
 
     def remove_stench(self):
-        for x in range(self.size):
-            for y in range(self.size):
-                if "s" in self.board[x][y]:
-                    self.board[x][y].remove("s")
+        """
+        Elimina el hedor que produce el Wumpus en sus celdas adyacentes.
+        """
+        if self.wumpus_pos is not None:
+            self.remove_perceptions(self.wumpus_pos[0], self.wumpus_pos[1], "W")
 
     def check_game_over(self):
         """
@@ -296,12 +536,12 @@ class Board:
         Returns:
             bool, str: True si el juego ha terminado, mensaje de finalización en caso contrario.
         """
-        x, y = self.agent_pos
-        if "W" in self.board[x][y]:
+        flags = self.cell_flags(*self.agent_pos)
+        if flags & WUMPUS:
             return True, "¡El Wumpus te ha atrapado!"
-        if "O" in self.board[x][y]:
+        if flags & PIT:
             return True, "¡Has caído en un hoyo!"
-        if "G" in self.board[x][y]:
+        if flags & GOLD:
             return True, "¡Has encontrado el oro! ¡Ganaste!"
         return False, None
 
@@ -318,6 +558,81 @@ class Board:
         """
         return manhattan_distance(a[0], a[1], b[0], b[1])
 
+    def flow_field(self):
+        """
+        Devuelve el campo de distancias al oro del tablero actual.
+
+        El campo se calcula con una búsqueda en anchura desde el oro que rodea
+        los Wumpus y los pozos. Entre dos cambios completos del tablero solo se
+        mueven el pozo móvil y el Wumpus, así que los campos se guardan por su
+        posición: los movimientos de prueba de MinMax, que no cambian
+        `revision`, reutilizan el campo de cada posición del pozo.
+
+        Returns:
+            FlowField: Distancia al oro y dirección del siguiente paso de cada celda.
+        """
+        key = (self._layout_revision, self.moving_pit, self.wumpus_pos)
+        field = self._flow_fields.get(key)
+        if field is None:
+            if len(self._flow_fields) >= self.FLOW_FIELD_CACHE_SIZE:
+                del self._flow_fields[next(iter(self._flow_fields))]
+            field = compute_flow_field(self._flow_cells(), self.size, self.gold_pos)
+            field = self._flow_fields[key] = field._replace(key=key)
+        return field
+
+    def _flow_cells(self):
+        """
+        Devuelve los bits de todas las celdas para calcular el campo de distancias.
+
+        Returns:
+            bytearray: Bits de las celdas por índice `x * size + y`.
+        """
+        return self._cells
+
+    def distance_to_gold(self, pos: tuple):
+        """
+        Devuelve el número de pasos hasta el oro sin atravesar peligros.
+
+        Args:
+            pos (tuple): Posición (x, y) de la celda.
+
+        Returns:
+            float: Distancia al oro, o inf si no se puede llegar desde la celda.
+        """
+        return float(self.flow_field().distance[pos[0] * self.size + pos[1]])
+
+    def next_step_to_gold(self, pos: tuple):
+        """
+        Devuelve la dirección del paso que acerca una celda al oro.
+
+        Args:
+            pos (tuple): Posición (x, y) de la celda.
+
+        Returns:
+            str: Dirección del movimiento o None si no se puede llegar al oro.
+        """
+        code = self.flow_field().direction[pos[0] * self.size + pos[1]]
+        if code == NO_DIRECTION:
+            return None
+        return DIRECTION_NAMES[code]
+
+    def gold_distances(self, x0: int, x1: int, y0: int, y1: int):
+        """
+        Devuelve la distancia al oro de las celdas de un rectángulo del tablero.
+
+        Args:
+            x0 (int): Primera fila.
+            x1 (int): Fila siguiente a la última.
+            y0 (int): Primera columna.
+            y1 (int): Columna siguiente a la última.
+
+        Returns:
+            list: Una lista de distancias por fila, como `distance_to_gold`.
+        """
+        distance = self.flow_field().distance
+        size = self.size
+        return [distance[x * size + y0 : x * size + y1] for x in range(x0, x1)]
+
     def move_dangerous_object(self):
         """
         Mueve el Wumpus o el pozo seleccionado a una nueva posición en el tablero.
@@ -325,15 +640,14 @@ class Board:
             bool: True si se ha movido un objeto, False en caso contrario.
         """
 
-        obj_type, obj_pos = ("O", self.moving_pit)
+        if self.moving_pit is None:
+            return False
 
-        possible_moves = self.get_possible_moves(obj_pos)
-        agent_pos = self.agent_pos
+        obj_type, obj_pos = ("O", self.moving_pit)
 
-        if agent_pos in possible_moves:
-            new_pos = agent_pos
-        else:
-            new_pos = self.get_best_move_for_object(possible_moves)
+        new_pos = self.get_next_object_position(obj_pos)
+        if new_pos is None:
+            return False
 
         self.move_object(obj_type, obj_pos, new_pos)
 
@@ -342,26 +656,55 @@ class Board:
 
         return True
 
-    def get_best_move_for_object(self, possible_moves: list):
+    def get_next_object_position(
+        self, obj_pos: tuple, agent_pos: tuple = None, vacated: tuple = None
+    ):
+        """
+        Calcula la posición a la que se movería un objeto peligroso.
+
+        El objeto salta sobre el agente si lo tiene al lado y, si no, se acerca a él.
+
+        Args:
+            obj_pos (tuple): Posición actual del objeto.
+            agent_pos (tuple): Posición del agente. Por defecto, la actual.
+            vacated (tuple): Celda que se considera libre aunque tenga un peligro;
+                al simular varios movimientos del pozo, la celda en la que está
+                el pozo en el tablero.
+
+        Returns:
+            tuple: Nueva posición del objeto o None si no puede moverse.
+        """
+        if agent_pos is None:
+            agent_pos = self.agent_pos
+        possible_moves = self.get_possible_moves(obj_pos, vacated)
+
+        if agent_pos in possible_moves:
+            return agent_pos
+        return self.get_best_move_for_object(possible_moves, agent_pos)
+
+    def get_best_move_for_object(self, possible_moves: list, agent_pos: tuple = None):
         """
         Devuelve el mejor movimiento para un objeto en una posición dada.
 
         Args:
             possible_moves (list): Lista de movimientos posibles.
+            agent_pos (tuple): Posición del agente. Por defecto, la actual.
 
         Returns:
             tuple: Mejor movimiento para el objeto.
         """
+        if agent_pos is None:
+            agent_pos = self.agent_pos
         best_move = None
         best_value = float("inf")
         for move in possible_moves:
-            value = self.heuristic(move, self.agent_pos)
+            value = self.heuristic(move, agent_pos)
             if value < best_value:
                 best_value = value
                 best_move = move
         return best_move
 
-    def move_object(self, obj_type: str, old_pos: tuple, new_pos: tuple):
+    def move_object(self, obj_type: str, old_pos: tuple, new_pos: tuple, record: bool = True):
         """
         Mueve un objeto a una nueva posición en el tablero.
 
@@ -369,15 +712,17 @@ class Board:
             obj_type (str): Tipo de objeto a mover (Wumpus o pozo).
             old_pos (tuple): Posición actual del objeto.
             new_pos (tuple): Nueva posición del objeto.
+            record (bool): Si se anota el cambio con `record_change`. Los
+                movimientos de prueba de `apply_hazard_move` no lo anotan.
         """
         x, y = old_pos
         new_x, new_y = new_pos
+        flag = CHAR_TO_FLAG[obj_type]
 
-        if obj_type in self.board[x][y]:
-            self.board[x][y].remove(obj_type)
+        self.clear_flag(x, y, flag)
         self.remove_perceptions(x, y, obj_type)
 
-        self.board[new_x][new_y].append(obj_type)
+        self.set_flag(new_x, new_y, flag)
 
         if obj_type == "W":
             self.wumpus_pos = new_pos
@@ -386,6 +731,12 @@ class Board:
             self.pits.append(new_pos)
 
         self.add_perceptions(new_x, new_y, obj_type)
+        # La celda que deja el objeto puede volver a tener percepciones y la
+        # que ocupa deja de mostrarlas
+        self._refresh_perceptions(x, y)
+        self._refresh_perceptions(new_x, new_y)
+        if record:
+            self.record_change(self._with_neighbors((old_pos, new_pos)))
 
     def remove_perceptions(self, x: int, y: int, obj_type: str):
         """
@@ -396,16 +747,7 @@ class Board:
             y (int): Coordenada y de la celda.
             obj_type (str): Tipo de objeto a mover (Wumpus o pozo).
         """
-        perception = "s" if obj_type == "W" else "b"
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < self.size and 0 <= ny < self.size:
-                if perception in self.board[nx][ny]:
-                    self.board[nx][ny].remove(perception)
-                    if perception == "b" and "O" in self.board[nx][ny]:
-                        self.board[nx][ny].append("b")
-                    if perception == "s" and "W" in self.board[nx][ny]:
-                        self.board[nx][ny].append("s")
+        self._update_perceptions(x, y, obj_type, -1)
 
     def add_perceptions(self, x: int, y: int, obj_type: str):
         """
@@ -416,19 +758,78 @@ class Board:
             y (int): Coordenada y de la celda.
             obj_type (str): Tipo de objeto a mover (Wumpus o pozo).
         """
-        perception = "s" if obj_type == "W" else "b"
+        self._update_perceptions(x, y, obj_type, 1)
+
+    def _update_perceptions(self, x: int, y: int, obj_type: str, delta: int):
+        """
+        Suma `delta` al contador de pozos o de Wumpus de las celdas adyacentes.
+
+        La brisa o el hedor de cada celda se activa o desactiva según su contador,
+        por lo que una celda junto a dos pozos conserva la brisa si se mueve uno.
+        Las celdas con un pozo o con el Wumpus no muestran percepciones.
+
+        Args:
+            x (int): Coordenada x del objeto.
+            y (int): Coordenada y del objeto.
+            obj_type (str): Tipo de objeto (Wumpus o pozo).
+            delta (int): 1 al colocar el objeto y -1 al quitarlo.
+        """
+        if obj_type == "W":
+            counts, perception = self._wumpus_count, STENCH
+        else:
+            counts, perception = self._pit_count, BREEZE
+        cells = self._cells
+        size = self.size
         for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
             nx, ny = x + dx, y + dy
-            if 0 <= nx < self.size and 0 <= ny < self.size:
-                if perception not in self.board[nx][ny]:
-                    self.board[nx][ny].append(perception)
+            if 0 <= nx < size and 0 <= ny < size:
+                index = nx * size + ny
+                counts[index] += delta
+                if counts[index] and not cells[index] & HAZARD:
+                    cells[index] |= perception
+                else:
+                    cells[index] &= ~perception
+
+    def _refresh_perceptions(self, x: int, y: int):
+        """
+        Vuelve a calcular la brisa y el hedor de una celda cuando entra o sale un peligro.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
+        """
+        index = x * self.size + y
+        value = self._cells[index] & ~(BREEZE | STENCH)
+        if not value & HAZARD:
+            value |= self.perception_flags(x, y)
+        self._cells[index] = value
+
+    def perception_flags(self, x: int, y: int):
+        """
+        Devuelve la brisa y el hedor que llegan a una celda, aunque tenga un peligro.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
 
-    def get_possible_moves(self, pos: tuple):
+        Returns:
+            int: Combinación de `BREEZE` y `STENCH`.
+        """
+        index = x * self.size + y
+        flags = 0
+        if self._pit_count[index]:
+            flags |= BREEZE
+        if self._wumpus_count[index]:
+            flags |= STENCH
+        return flags
+
+    def get_possible_moves(self, pos: tuple, vacated: tuple = None):
         """
         Devuelve los movimientos posibles para un objeto en una posición dada.
 
         Args:
             pos (tuple): Posición actual del objeto.
+            vacated (tuple): Celda que se considera libre aunque tenga un peligro.
 
         Returns:
             list: Lista de movimientos posibles.
@@ -440,9 +841,147 @@ class Board:
             if (
                 0 <= nx < self.size
                 and 0 <= ny < self.size
-                and "W" not in self.board[nx][ny]
-                and "O" not in self.board[nx][ny]
-                and "G" not in self.board[nx][ny]
+                and ((nx, ny) == vacated or not self.cell_flags(nx, ny) & (HAZARD | GOLD))
             ):
                 moves.append((nx, ny))
         return moves
+
+    def apply_move(self, direction: str):
+        """
+        Mueve el agente de forma reversible y sin mostrar percepciones.
+
+        Args:
+            direction (str): Dirección en la que mover el agente.
+
+        Returns:
+            MoveUndo: Registro para `undo_move` o None si el movimiento choca con una pared.
+        """
+        dx, dy = DIRECTION_DELTAS[direction]
+        x, y = self.agent_pos
+        new_x, new_y = x + dx, y + dy
+
+        if not (0 <= new_x < self.size and 0 <= new_y < self.size):
+            return None
+
+        record = self._undo_record(((x, y), (new_x, new_y)))
+        self.clear_flag(x, y, AGENT)
+        self.agent_pos = (new_x, new_y)
+        self.set_flag(new_x, new_y, AGENT)
+        return record
+
+    def apply_hazard_move(self):
+        """
+        Aplica de forma reversible el movimiento del pozo móvil.
+
+        Returns:
+            MoveUndo: Registro para `undo_move` o None si el pozo no se ha movido.
+        """
+        if self.moving_pit is None:
+            return None
+
+        old_pos = self.moving_pit
+        new_pos = self.get_next_object_position(old_pos)
+        if new_pos is None:
+            return None
+
+        record = self._undo_record(
+            self._with_neighbors((old_pos, new_pos)), pit_index=self.pits.index(old_pos)
+        )
+        self.move_object("O", old_pos, new_pos, record=False)
+        self.moving_pit = new_pos
+        return record
+
+    def apply_shot(self, direction: str):
+        """
+        Dispara la flecha de forma reversible.
+
+        Args:
+            direction (str): Dirección en la que disparar la flecha.
+
+        Returns:
+            MoveUndo, bool, str: Registro para `undo_move` (None si no se ha disparado),
+            si se ha matado al Wumpus y mensaje del resultado.
+        """
+        dx, dy = DIRECTION_DELTAS[direction]
+        target = (self.agent_pos[0] + dx, self.agent_pos[1] + dy)
+
+        record = self._undo_record(self._with_neighbors((target,)))
+        arrow_available = self.arrowAvailable
+        hit, message = self.shoot_arrow(direction, record=False)
+        if arrow_available == self.arrowAvailable:
+            return None, hit, message
+        return record, hit, message
+
+    def undo_move(self, record: MoveUndo):
+        """
+        Deshace un movimiento aplicado con `apply_move`, `apply_hazard_move` o `apply_shot`.
+
+        Los movimientos deben deshacerse en orden inverso al que se aplicaron.
+        Ni aplicarlos ni deshacerlos anota cambios con `record_change`, así que
+        `revision` vuelve a ser la de antes del movimiento.
+
+        Args:
+            record (MoveUndo): Registro devuelto al aplicar el movimiento.
+        """
+        for index, value, pit_count, wumpus_count in record.cells:
+            self._cells[index] = value
+            self._pit_count[index] = pit_count
+            self._wumpus_count[index] = wumpus_count
+
+        if record.pit_index is not None:
+            self.pits.pop()
+            self.pits.insert(record.pit_index, record.moving_pit)
+
+        self.agent_pos = record.agent_pos
+        self.moving_pit = record.moving_pit
+        self.wumpus_pos = record.wumpus_pos
+        self.arrowAvailable = record.arrow_available
+        self.revision = record.revision
+
+    def _with_neighbors(self, positions: tuple):
+        """
+        Devuelve las posiciones dadas junto con sus vecinas dentro del tablero.
+
+        Args:
+            positions (tuple): Posiciones (x, y) de partida.
+
+        Returns:
+            list: Posiciones sin repetir.
+        """
+        result = []
+        for x, y in positions:
+            for dx, dy in [(0, 0), (-1, 0), (1, 0), (0, -1), (0, 1)]:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.size and 0 <= ny < self.size and (nx, ny) not in result:
+                    result.append((nx, ny))
+        return result
+
+    def _undo_record(self, positions, pit_index: int = None):
+        """
+        Guarda el estado actual de las celdas indicadas y de los datos del tablero.
+
+        Args:
+            positions (iterable): Posiciones (x, y) que el movimiento puede modificar.
+            pit_index (int): Índice del pozo móvil en `pits` si el movimiento lo desplaza.
+
+        Returns:
+            MoveUndo: Registro para `undo_move`.
+        """
+        cells = tuple(
+            (
+                index,
+                self._cells[index],
+                self._pit_count[index],
+                self._wumpus_count[index],
+            )
+            for index in (x * self.size + y for x, y in positions)
+        )
+        return MoveUndo(
+            self.agent_pos,
+            self.moving_pit,
+            pit_index,
+            self.wumpus_pos,
+            self.arrowAvailable,
+            cells,
+            self.revision,
+        )
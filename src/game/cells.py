@@ -0,0 +1,93 @@
+"""
+Codificación de las celdas del tablero como bits de un byte.
+
+Cada celda del tablero se guarda en un único entero sin signo de 8 bits en el
+que cada bit indica la presencia de un elemento del juego. La vista
+`BoardView` traduce esos bits a las letras que usaban las interfaces.
+"""
+
+AGENT = 0x01
+WUMPUS = 0x02
+PIT = 0x04
+GOLD = 0x08
+BREEZE = 0x10
+STENCH = 0x20
+DEAD_WUMPUS = 0x40
+
+HAZARD = WUMPUS | PIT
+
+# Orden en el que se listan las letras de una celda (y en el que se dibujan):
+# primero las percepciones, después los objetos y por último el agente.
+FLAG_CHARS = (
+    ("b", BREEZE),
+    ("s", STENCH),
+    ("O", PIT),
+    ("W", WUMPUS),
+    ("X", DEAD_WUMPUS),
+    ("G", GOLD),
+    ("A", AGENT),
+)
+
+CHAR_TO_FLAG = {char: flag for char, flag in FLAG_CHARS}
+
+# Tupla de letras precalculada para cada combinación posible de bits
+CELL_CHARS = tuple(
+    tuple(char for char, flag in FLAG_CHARS if value & flag) for value in range(256)
+)
+
+
+class BoardView:
+    """
+    Vista de solo lectura del tablero con el formato antiguo de listas de letras.
+
+    `view[x][y]` devuelve una tupla con las letras de la celda, por lo que el
+    código que usaba `"W" in board[x][y]` o iteraba sobre las filas sigue
+    funcionando sin poder modificar el tablero.
+    """
+
+    def __init__(self, cells: bytearray, size: int):
+        """
+        Inicializa la vista sobre los bytes del tablero.
+
+        Args:
+            cells (bytearray): Bits de cada celda, fila a fila.
+            size (int): Tamaño del tablero.
+        """
+        self._cells = cells
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, x: int):
+        if not -self._size <= x < self._size:
+            raise IndexError("Fila fuera del tablero")
+        x %= self._size
+        return _RowView(self._cells, x * self._size, self._size)
+
+    def __iter__(self):
+        for x in range(self._size):
+            yield _RowView(self._cells, x * self._size, self._size)
+
+
+class _RowView:
+    """
+    Fila de solo lectura de una `BoardView`.
+    """
+
+    def __init__(self, cells: bytearray, offset: int, size: int):
+        self._cells = cells
+        self._offset = offset
+        self._size = size
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, y: int):
+        if not -self._size <= y < self._size:
+            raise IndexError("Columna fuera del tablero")
+        return CELL_CHARS[self._cells[self._offset + y % self._size]]
+
+    def __iter__(self):
+        for y in range(self._size):
+            yield CELL_CHARS[self._cells[self._offset + y]]
@@ -0,0 +1,282 @@
+"""
+Formato binario para guardar muchos tableros en un único archivo.
+
+Estructura del archivo (enteros little-endian):
+
+- Cabecera de 32 bytes: firma `WUMPCORP`, versión, reservado, número de
+  tableros y posición del índice.
+- Un registro por tablero: cabecera de 16 bytes (tamaño, indicadores,
+  reservado, semilla) seguida de las celdas empaquetadas de dos en dos
+  (4 bits por celda: agente, Wumpus, pozo y oro).
+- Índice final con la posición de cada registro como `uint64`.
+
+El archivo se abre con `numpy.memmap`, así que leer el tablero `k` no
+requiere analizar el resto del archivo.
+"""
+
+import argparse
+import os
+import struct
+
+import numpy as np
+
+from .board import Board
+from .cells import AGENT, CHAR_TO_FLAG, GOLD, PIT, WUMPUS
+from .utils import read_text_board
+
+MAGIC = b"WUMPCORP"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")
+RECORD_HEADER = struct.Struct("<HHIQ")
+
+# Bits que se guardan de cada celda; las percepciones se recalculan al cargar
+STORED_FLAGS = AGENT | WUMPUS | PIT | GOLD
+# Indicadores del registro
+HAS_SEED = 0x01
+
+
+def text_board_to_grid(custom_board: list):
+    """
+    Convierte un tablero de texto en una matriz con los bits de cada celda.
+
+    Args:
+        custom_board (list): Filas del tablero con el contenido de cada celda.
+
+    Returns:
+        np.ndarray: Matriz cuadrada de `uint8`.
+    """
+    size = len(custom_board)
+    grid = np.zeros((size, size), dtype=np.uint8)
+    for i, row in enumerate(custom_board):
+        for j, cell_content in enumerate(row):
+            for char in cell_content:
+                grid[i, j] |= CHAR_TO_FLAG.get(char, 0) & STORED_FLAGS
+    return grid
+
+
+def pack_cells(grid: np.ndarray):
+    """
+    Empaqueta las celdas de un tablero a razón de dos celdas por byte.
+
+    Args:
+        grid (np.ndarray): Matriz cuadrada con los bits de cada celda.
+
+    Returns:
+        bytes: Celdas empaquetadas.
+    """
+    cells = np.asarray(grid, dtype=np.uint8).ravel() & STORED_FLAGS
+    if len(cells) % 2:
+        cells = np.append(cells, np.uint8(0))
+    return (cells[0::2] | (cells[1::2] << 4)).tobytes()
+
+
+def unpack_cells(packed: np.ndarray, size: int):
+    """
+    Desempaqueta las celdas guardadas con `pack_cells`.
+
+    Args:
+        packed (np.ndarray): Bytes empaquetados.
+        size (int): Tamaño del tablero.
+
+    Returns:
+        np.ndarray: Matriz (size, size) con los bits de cada celda.
+    """
+    cells = np.empty(len(packed) * 2, dtype=np.uint8)
+    cells[0::2] = packed & 0x0F
+    cells[1::2] = packed >> 4
+    return cells[: size * size].reshape(size, size)
+
+
+class CorpusWriter:
+    """
+    Escribe tableros en un archivo de corpus binario.
+
+    Se usa como gestor de contexto para que el índice se escriba al cerrar::
+
+        with CorpusWriter("tableros.wcorp") as writer:
+            writer.add(grid, seed)
+    """
+
+    def __init__(self, path: str):
+        """
+        Crea el archivo y reserva espacio para la cabecera.
+
+        Args:
+            path (str): Ruta del archivo de salida.
+        """
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        self.offsets = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, grid: np.ndarray, seed: int = None):
+        """
+        Añade un tablero al corpus.
+
+        Args:
+            grid (np.ndarray): Matriz cuadrada con los bits de cada celda.
+            seed (int): Semilla del tablero, si tiene.
+        """
+        size = len(grid)
+        flags = HAS_SEED if seed is not None else 0
+        self.offsets.append(self.file.tell())
+        self.file.write(RECORD_HEADER.pack(size, flags, 0, int(seed or 0)))
+        self.file.write(pack_cells(grid))
+
+    def close(self):
+        """
+        Escribe el índice y la cabecera definitiva y cierra el archivo.
+        """
+        if self.file.closed:
+            return
+        # El índice se alinea a 8 bytes para poder leerlo como `uint64`
+        padding = -self.file.tell() % 8
+        self.file.write(b"\0" * padding)
+        index_offset = self.file.tell()
+        self.file.write(np.asarray(self.offsets, dtype="<u8").tobytes())
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, 0, len(self.offsets), index_offset))
+        self.file.close()
+
+
+class BoardCorpus:
+    """
+    Acceso de solo lectura a un corpus binario de tableros mediante `numpy.memmap`.
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre el corpus y lee su cabecera e índice.
+
+        Args:
+            path (str): Ruta del archivo de corpus.
+
+        Raises:
+            ValueError: Si el archivo no es un corpus válido.
+        """
+        self.path = path
+        self.data = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(self.data) < HEADER.size:
+            raise ValueError("El archivo de corpus está incompleto")
+        magic, version, _, count, index_offset = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError("El archivo no es un corpus de tableros")
+        if version != VERSION:
+            raise ValueError(f"Versión de corpus no soportada: {version}")
+        self.offsets = np.ndarray(
+            (count,), dtype="<u8", buffer=self.data, offset=index_offset
+        )
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def _record(self, index: int):
+        if not -len(self) <= index < len(self):
+            raise IndexError("Tablero fuera del corpus")
+        offset = int(self.offsets[index])
+        size, flags, _, seed = RECORD_HEADER.unpack_from(self.data, offset)
+        start = offset + RECORD_HEADER.size
+        packed = self.data[start : start + (size * size + 1) // 2]
+        return size, (seed if flags & HAS_SEED else None), packed
+
+    def grid(self, index: int):
+        """
+        Devuelve los bits de las celdas de un tablero.
+
+        Args:
+            index (int): Posición del tablero en el corpus.
+
+        Returns:
+            np.ndarray: Matriz (size, size) de `uint8`.
+        """
+        size, _, packed = self._record(index)
+        return unpack_cells(packed, size)
+
+    def seed(self, index: int):
+        """
+        Devuelve la semilla guardada con un tablero.
+
+        Args:
+            index (int): Posición del tablero en el corpus.
+
+        Returns:
+            int: Semilla del tablero o None si no tiene.
+        """
+        return self._record(index)[1]
+
+    def board(self, index: int, verbose: bool = True):
+        """
+        Crea un `Board` con el contenido de un tablero del corpus.
+
+        Args:
+            index (int): Posición del tablero en el corpus.
+            verbose (bool): Controla la impresión de percepciones.
+
+        Returns:
+            Board: Tablero listo para jugar.
+        """
+        size, seed, packed = self._record(index)
+        return Board.from_grid(unpack_cells(packed, size), verbose=verbose, seed=seed)
+
+
+def convert_text_boards(directory: str, writer: CorpusWriter):
+    """
+    Añade al corpus los tableros de texto válidos de una carpeta.
+
+    Se descartan los tableros que no son cuadrados o que no tienen agente u oro.
+
+    Args:
+        directory (str): Carpeta con archivos `.txt` (por ejemplo, `tableros/`).
+        writer (CorpusWriter): Corpus de destino.
+
+    Returns:
+        list: Nombres de los archivos añadidos, en el orden en que se han guardado.
+    """
+    added = []
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".txt"):
+            continue
+        custom_board, size = read_text_board(os.path.join(directory, file_name))
+        if not all(len(row) == size for row in custom_board):
+            print(f"Se omite {file_name}: el tablero no es cuadrado")
+            continue
+        grid = text_board_to_grid(custom_board)
+        if not (grid & AGENT).any() or not (grid & GOLD).any():
+            print(f"Se omite {file_name}: falta el agente o el oro")
+            continue
+        writer.add(grid)
+        added.append(file_name)
+    return added
+
+
+def main():
+    """
+    Crea un corpus binario a partir de tableros de texto y archivos `.npz`.
+    """
+    from .generator import load_npz
+
+    parser = argparse.ArgumentParser(description="Crea un corpus binario de tableros")
+    parser.add_argument("-tableros", type=str, help="Carpeta con tableros de texto")
+    parser.add_argument("-npz", type=str, nargs="*", default=[], help="Corpus .npz generados")
+    parser.add_argument("-o", type=str, required=True, help="Archivo de corpus de salida")
+    args = parser.parse_args()
+
+    with CorpusWriter(args.o) as writer:
+        if args.tableros:
+            convert_text_boards(args.tableros, writer)
+        for path in args.npz:
+            grids, seeds = load_npz(path)
+            for grid, seed in zip(grids, seeds):
+                writer.add(grid, int(seed))
+        count = len(writer.offsets)
+    print(f"{count} tableros guardados en {args.o}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+import heapq
+from collections import deque, namedtuple
+
+from .cells import HAZARD
+from .utils import get_agent_moves
+
+# Códigos de `FlowField.direction`, en el orden de `get_agent_moves`
+NO_DIRECTION = -1
+DIRECTION_NAMES = tuple(get_agent_moves())
+
+# `key` identifica la posición de los peligros con la que se ha calculado el campo
+FlowField = namedtuple("FlowField", ["distance", "direction", "key"])
+
+
+def compute_flow_field(cells, size: int, goal: tuple, cost_grid=None):
+    """
+    Calcula la distancia de cada celda al objetivo y el paso que acerca a él.
+
+    Hace una única búsqueda inversa desde el objetivo: en anchura si todos los
+    pasos cuestan lo mismo o Dijkstra si se indica `cost_grid`. Las celdas con
+    Wumpus o pozo no se pueden atravesar.
+
+    No usa NumPy, así que el modo texto y las partidas sin ventana no tienen
+    que cargarlo.
+
+    Args:
+        cells: Bits de las celdas del tablero por filas (`x * size + y`).
+        size (int): Tamaño del tablero.
+        goal (tuple): Posición (x, y) del objetivo, normalmente el oro.
+        cost_grid: Coste de entrar en cada celda, por filas o como matriz de
+            NumPy. Por defecto, 1.
+
+    Returns:
+        FlowField: Lista `distance` (inf si no se puede llegar) y lista
+        `direction` con el índice en `DIRECTION_NAMES` del paso a dar desde
+        cada celda (`NO_DIRECTION` si no hay ninguno), ambas indexadas por
+        `x * size + y`.
+    """
+    total = size * size
+    blocked = [(value & HAZARD) != 0 for value in cells]
+    distance = [float("inf")] * total
+    direction = [NO_DIRECTION] * total
+    goal_index = goal[0] * size + goal[1]
+    distance[goal_index] = 0
+
+    # Desde la vecina (índice - delta) hay que moverse en la dirección indicada
+    steps = ((size, 0), (-size, 1), (1, 2), (-1, 3))
+
+    if cost_grid is None:
+        queue = deque([goal_index])
+        while queue:
+            current = queue.popleft()
+            y = current % size
+            next_distance = distance[current] + 1
+            for delta, code in steps:
+                if (delta == 1 and y == size - 1) or (delta == -1 and y == 0):
+                    continue
+                neighbor = current + delta
+                if not 0 <= neighbor < total:
+                    continue
+                if blocked[neighbor] or distance[neighbor] != float("inf"):
+                    continue
+                distance[neighbor] = next_distance
+                direction[neighbor] = code
+                queue.append(neighbor)
+    else:
+        # Moverse de la vecina a `current` cuesta lo que cuesta entrar en `current`
+        costs = cost_grid.ravel().tolist() if hasattr(cost_grid, "ravel") else list(cost_grid)
+        heap = [(0, goal_index)]
+        while heap:
+            current_distance, current = heapq.heappop(heap)
+            if current_distance > distance[current]:
+                continue
+            y = current % size
+            next_distance = current_distance + costs[current]
+            for delta, code in steps:
+                if (delta == 1 and y == size - 1) or (delta == -1 and y == 0):
+                    continue
+                neighbor = current + delta
+                if not 0 <= neighbor < total or blocked[neighbor]:
+                    continue
+                if next_distance < distance[neighbor]:
+                    distance[neighbor] = next_distance
+                    direction[neighbor] = code
+                    heapq.heappush(heap, (next_distance, neighbor))
+
+    return FlowField(distance, direction, None)
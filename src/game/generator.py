@@ -0,0 +1,119 @@
+import argparse
+
+import numpy as np
+
+from .cells import AGENT, GOLD, PIT, WUMPUS
+from .utils import agent_start, num_pits, valid_cells
+
+# Número de tableros que se generan a la vez para limitar la memoria usada
+CHUNK_SIZE = 4096
+
+
+def valid_cell_indices(size: int):
+    """
+    Devuelve las celdas en las que se puede colocar un objeto (ver `utils.valid_cells`).
+
+    Args:
+        size (int): Tamaño del tablero.
+
+    Returns:
+        np.ndarray: Índices `x * size + y` de las celdas válidas.
+    """
+    return np.array(valid_cells(size), dtype=np.intp)
+
+
+def generate_boards(count: int, size: int, seed: int = None):
+    """
+    Genera muchos tableros aleatorios a la vez.
+
+    Para cada tablero se eligen sin reemplazo, entre las celdas válidas, la
+    del Wumpus, la del oro y las de los pozos. Además se genera una semilla
+    por tablero para el resto de decisiones aleatorias de la partida (por
+    ejemplo, qué pozo se mueve).
+
+    Args:
+        count (int): Número de tableros.
+        size (int): Tamaño de los tableros.
+        seed (int): Semilla del generador.
+
+    Returns:
+        np.ndarray, np.ndarray: Bits de las celdas con forma (count, size, size)
+        y semilla de cada tablero.
+
+    Raises:
+        ValueError: Si no hay celdas suficientes para colocar todos los objetos.
+    """
+    rng = np.random.default_rng(seed)
+    candidates = valid_cell_indices(size)
+    objects = 2 + num_pits(size)
+    if objects > len(candidates):
+        raise ValueError(f"No caben {objects} objetos en un tablero de {size}x{size}")
+
+    agent_x, agent_y = agent_start(size)
+    grids = np.zeros((count, size * size), dtype=np.uint8)
+    grids[:, agent_x * size + agent_y] = AGENT
+
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = min(CHUNK_SIZE, count - start)
+        keys = rng.random((chunk, len(candidates)))
+        # Las `objects` claves más pequeñas, ordenadas, dan una muestra sin reemplazo
+        if objects < len(candidates):
+            chosen = np.argpartition(keys, objects - 1, axis=1)[:, :objects]
+        else:
+            chosen = np.tile(np.arange(objects), (chunk, 1))
+        order = np.argsort(np.take_along_axis(keys, chosen, axis=1), axis=1)
+        cells = candidates[np.take_along_axis(chosen, order, axis=1)]
+
+        rows = np.arange(start, start + chunk)
+        grids[rows, cells[:, 0]] |= WUMPUS
+        grids[rows, cells[:, 1]] |= GOLD
+        grids[rows[:, None], cells[:, 2:]] |= PIT
+
+    seeds = rng.integers(0, 2**63, size=count, dtype=np.uint64)
+    return grids.reshape(count, size, size), seeds
+
+
+def save_npz(path: str, grids: np.ndarray, seeds: np.ndarray):
+    """
+    Guarda tableros generados en un archivo `.npz` comprimido.
+
+    Args:
+        path (str): Ruta del archivo.
+        grids (np.ndarray): Bits de las celdas con forma (count, size, size).
+        seeds (np.ndarray): Semilla de cada tablero.
+    """
+    np.savez_compressed(path, grids=grids, seeds=seeds)
+
+
+def load_npz(path: str):
+    """
+    Carga tableros guardados con `save_npz`.
+
+    Args:
+        path (str): Ruta del archivo.
+
+    Returns:
+        np.ndarray, np.ndarray: Bits de las celdas y semilla de cada tablero.
+    """
+    with np.load(path) as data:
+        return data["grids"], data["seeds"]
+
+
+def main():
+    """
+    Genera un corpus de tableros aleatorios desde la línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Genera tableros aleatorios en un .npz")
+    parser.add_argument("-n", type=int, required=True, help="Número de tableros")
+    parser.add_argument("-board", type=int, default=6, help="Tamaño de los tableros")
+    parser.add_argument("-seed", type=int, default=None, help="Semilla del generador")
+    parser.add_argument("-o", type=str, required=True, help="Archivo .npz de salida")
+    args = parser.parse_args()
+
+    grids, seeds = generate_boards(args.n, args.board, args.seed)
+    save_npz(args.o, grids, seeds)
+    print(f"{args.n} tableros de {args.board}x{args.board} guardados en {args.o}")
+
+
+if __name__ == "__main__":
+    main()
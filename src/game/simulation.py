@@ -0,0 +1,238 @@
+"""
+Simulación por lotes de los jugadores automáticos sin ventana ni esperas.
+
+Cada partida usa la misma lógica de decisión que los modos gráficos
+(`play_turn`, que a su vez llama a `get_best_move`, `move_agent` y
+`move_dangerous_object`) y termina con `check_game_over`, pero sin dibujar
+el tablero ni esperar entre turnos.
+"""
+
+import time
+from collections import Counter, namedtuple
+
+from .board import Board
+from .cells import GOLD, PIT, WUMPUS
+
+# Resultados posibles de una partida
+WIN = "oro"
+CAUGHT = "wumpus"
+FELL = "pozo"
+LOOP = "bucle"
+NO_PATH = "sin ruta"
+STEP_LIMIT = "limite"
+
+GameResult = namedtuple("GameResult", ["index", "seed", "outcome", "steps", "latencies"])
+
+
+def player_class(name: str):
+    """
+    Devuelve la clase del jugador automático con ese nombre.
+
+    Args:
+        name (str): "astar" o "minmax".
+
+    Returns:
+        type: Clase del jugador.
+
+    Raises:
+        ValueError: Si el jugador no existe.
+    """
+    if name == "astar":
+        from .ai.astar import AStarPlayer
+
+        return AStarPlayer
+    if name == "minmax":
+        from .ai.minmax import MinMaxPlayer
+
+        return MinMaxPlayer
+    raise ValueError(f"Jugador desconocido: {name}")
+
+
+def outcome_of(board: Board):
+    """
+    Clasifica una partida terminada según lo que hay en la celda del agente.
+
+    Args:
+        board (Board): Tablero con la partida terminada.
+
+    Returns:
+        str: WIN, CAUGHT o FELL.
+    """
+    flags = board.cell_flags(*board.agent_pos)
+    if flags & WUMPUS:
+        return CAUGHT
+    if flags & PIT:
+        return FELL
+    if flags & GOLD:
+        return WIN
+    return None
+
+
+def play_game(player, max_steps: int):
+    """
+    Juega una partida completa con un jugador ya creado sobre su tablero.
+
+    Si el jugador tiene las estadísticas activas, al terminar se escribe su
+    informe de la partida.
+
+    Args:
+        player: Jugador automático creado con `headless=True`.
+        max_steps (int): Número máximo de turnos antes de abandonar la partida.
+
+    Returns:
+        str, int, list: Resultado, número de turnos y duración de cada turno en milisegundos.
+    """
+    board = player.board
+    check_for_loop = getattr(player, "check_for_loop", None)
+    # Sin pozo móvil, un jugador sin ruta no puede volver a encontrarla
+    hazards_move = getattr(player, "moving_pit", True)
+    player.new_game()
+
+    latencies = []
+    outcome = STEP_LIMIT
+    for _ in range(max_steps):
+        start = time.perf_counter()
+        move = player.play_turn()
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        if board.check_game_over()[0]:
+            outcome = outcome_of(board)
+            break
+        if check_for_loop is not None and check_for_loop():
+            outcome = LOOP
+            break
+        if move is None and not hazards_move:
+            outcome = NO_PATH
+            break
+
+    stats = getattr(player, "stats", None)
+    if stats is not None:
+        stats.write(player=type(player).__name__, size=board.size, seed=board.seed, result=outcome)
+    return outcome, len(latencies), latencies
+
+
+def play_board(player_name: str, grid, seed: int, max_steps: int = None, **options):
+    """
+    Juega una partida de un jugador automático sobre un tablero dado por sus celdas.
+
+    Args:
+        player_name (str): "astar" o "minmax".
+        grid: Matriz cuadrada con los bits de cada celda.
+        seed (int): Semilla del tablero.
+        max_steps (int): Turnos máximos. Por defecto, 4 veces el número de celdas.
+        **options: Opciones adicionales del jugador.
+
+    Returns:
+        str, int, list: Resultado, número de turnos y duración de cada turno en milisegundos.
+    """
+    board = Board.from_grid(grid, verbose=False, seed=seed)
+    player = player_class(player_name)(board, headless=True, **options)
+    if max_steps is None:
+        max_steps = 4 * board.size * board.size
+    return play_game(player, max_steps)
+
+
+def _play_boards(player_name, grids, seeds, first_index, max_steps, options):
+    results = []
+    for offset, (grid, seed) in enumerate(zip(grids, seeds)):
+        outcome, steps, latencies = play_board(
+            player_name, grid, int(seed), max_steps, **options
+        )
+        results.append(GameResult(first_index + offset, int(seed), outcome, steps, latencies))
+    return results
+
+
+def run_batch(
+    player_name: str,
+    count: int,
+    size: int,
+    seed: int = None,
+    workers: int = 1,
+    max_steps: int = None,
+    **options,
+):
+    """
+    Juega un lote de partidas sobre tableros aleatorios reproducibles.
+
+    Los tableros se generan de una vez con `generate_boards`, así que el
+    mismo `seed` da siempre los mismos tableros con cualquier número de
+    procesos.
+
+    Args:
+        player_name (str): "astar" o "minmax".
+        count (int): Número de partidas.
+        size (int): Tamaño de los tableros.
+        seed (int): Semilla de los tableros.
+        workers (int): Número de procesos que juegan partidas en paralelo.
+        max_steps (int): Turnos máximos por partida. Por defecto, 4 veces el número de celdas.
+        **options: Opciones adicionales del jugador (por ejemplo, `planner` o `time_budget_ms`).
+
+    Returns:
+        list: Un `GameResult` por partida, en el orden de los tableros.
+    """
+    # El generador usa NumPy, que las partidas en sí no necesitan
+    from .generator import generate_boards
+
+    player_class(player_name)
+    if max_steps is None:
+        max_steps = 4 * size * size
+    grids, seeds = generate_boards(count, size, seed)
+    # Como listas, los procesos no tienen que importar NumPy para recibir los tableros
+    grids, seeds = grids.tolist(), seeds.tolist()
+
+    if workers <= 1:
+        return _play_boards(player_name, grids, seeds, 0, max_steps, options)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Varios bloques por proceso para repartir mejor las partidas largas
+    chunk = max(1, -(-count // (workers * 4)))
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                _play_boards,
+                player_name,
+                grids[start : start + chunk],
+                seeds[start : start + chunk],
+                start,
+                max_steps,
+                options,
+            )
+            for start in range(0, count, chunk)
+        ]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+
+def summarize(results: list, elapsed: float = None):
+    """
+    Resume los resultados de un lote de partidas.
+
+    Args:
+        results (list): Resultados devueltos por `run_batch`.
+        elapsed (float): Tiempo total del lote en segundos, si se conoce.
+
+    Returns:
+        str: Resumen legible del lote.
+    """
+    games = len(results)
+    if not games:
+        return "No se ha jugado ninguna partida."
+    outcomes = Counter(result.outcome for result in results)
+    steps = sum(result.steps for result in results)
+    latencies = [latency for result in results for latency in result.latencies]
+
+    lines = [f"Partidas: {games}"]
+    for outcome, total in outcomes.most_common():
+        lines.append(f"  {outcome}: {total} ({100 * total / games:.1f}%)")
+    lines.append(f"Turnos por partida: {steps / games:.1f}")
+    if latencies:
+        lines.append(
+            f"Tiempo por turno: media {sum(latencies) / len(latencies):.3f} ms, "
+            f"máximo {max(latencies):.3f} ms"
+        )
+    if elapsed:
+        lines.append(f"Tiempo total: {elapsed:.2f} s ({games / elapsed:.1f} partidas/s)")
+    return "\n".join(lines)
@@ -0,0 +1,480 @@
+"""
+Tablero para mapas grandes que solo guarda los objetos del juego.
+
+`Board` guarda tres bytes por celda, así que su memoria crece con el
+cuadrado del tamaño. `SparseBoard` guarda únicamente las posiciones del
+agente, el Wumpus y el oro y un conjunto con los pozos, y calcula los bits
+de cada celda (incluidas la brisa y el hedor) al consultarla. Su memoria
+crece con el número de pozos, lo que permite tableros de 500x500 a
+2000x2000.
+"""
+
+import random
+from collections import deque
+
+from .board import Board, MoveUndo
+from .cells import AGENT, BREEZE, CELL_CHARS, DEAD_WUMPUS, GOLD, HAZARD, PIT, STENCH, WUMPUS
+from .utils import DIRECTION_DELTAS, agent_start, manhattan_distance, num_pits
+
+# A partir de este tamaño `main.py` usa `SparseBoard` aunque no se pida
+SPARSE_MIN_SIZE = 100
+
+NEIGHBOR_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class PitSet(set):
+    """
+    Conjunto de las posiciones de los pozos.
+
+    Tiene `append` para que los métodos de `Board` que añaden pozos a la
+    lista `pits` funcionen igual sobre el conjunto.
+    """
+
+    append = set.add
+
+
+class SparseBoard(Board):
+    """
+    Tablero con almacenamiento disperso para mapas grandes.
+
+    Ofrece la misma interfaz que `Board`. Las diferencias son:
+    - `pits` es un conjunto en lugar de una lista;
+    - `distance_to_gold` y `next_step_to_gold` usan la distancia de Manhattan
+      a través de celdas sin peligros en lugar del campo de flujo, que
+      recorre todo el tablero;
+    - `grid` y `flow_field` construyen el tablero denso completo y solo
+      conviene usarlos en tableros pequeños.
+    """
+
+    # El campo de distancias ocupa todo el tablero denso: solo se guarda el último
+    FLOW_FIELD_CACHE_SIZE = 1
+
+    def __init__(
+        self,
+        size: int = 6,
+        custom_board: list = None,
+        verbose: bool = True,
+        seed: int = None,
+        pit_count: int = None,
+    ):
+        """
+        Args:
+            size (int): Tamaño del tablero.
+            custom_board (list): Tablero personalizado.
+            verbose (bool): Controla la impresión de percepciones.
+            seed (int): Semilla del generador aleatorio del tablero.
+            pit_count (int): Número de pozos de los tableros aleatorios. Por
+                defecto, el 10% de las celdas, como en `Board`.
+        """
+        self.pit_count = num_pits(size) if pit_count is None else pit_count
+        self._dead_wumpus = None
+        super().__init__(size, custom_board=custom_board, verbose=verbose, seed=seed)
+
+    def to_state(self):
+        return (
+            self.size,
+            self.agent_pos,
+            self.wumpus_pos,
+            self.gold_pos,
+            tuple(self.pits),
+            self.moving_pit,
+            self.arrowAvailable,
+            self._dead_wumpus,
+        )
+
+    @classmethod
+    def from_state(cls, state: tuple):
+        """
+        Reconstruye un tablero a partir de `to_state`, sin percepciones impresas.
+
+        Args:
+            state (tuple): Estado devuelto por `SparseBoard.to_state`.
+
+        Returns:
+            SparseBoard: Tablero en el mismo estado de la partida.
+        """
+        board = cls.__new__(cls)
+        (
+            board.size,
+            board.agent_pos,
+            board.wumpus_pos,
+            board.gold_pos,
+            pits,
+            board.moving_pit,
+            board.arrowAvailable,
+            board._dead_wumpus,
+        ) = state
+        board.custom_board = None
+        board.seed = None
+        board.rng = random.Random()
+        board.verbose = False
+        board.revision = 0
+        board._changes = deque()
+        board._changes_start = 0
+        board._layout_revision = 0
+        board._flow_fields = {}
+        board.pits = PitSet(pits)
+        board.pit_count = len(board.pits)
+        return board
+
+    @property
+    def grid(self):
+        """
+        Matriz de NumPy con los bits de todas las celdas (se construye al consultarla).
+        """
+        import numpy as np
+
+        return np.frombuffer(self.dense_cells(), dtype=np.uint8).reshape(self.size, self.size)
+
+    @property
+    def board(self):
+        """
+        Vista de solo lectura del tablero como listas de letras.
+        """
+        return SparseBoardView(self)
+
+    def dense_cells(self):
+        """
+        Construye los bits de todas las celdas, fila a fila, como en `Board`.
+
+        Returns:
+            bytearray: Bits de cada celda (`x * size + y`).
+        """
+        size = self.size
+        cells = bytearray(size * size)
+        for x, y in self.pits:
+            cells[x * size + y] |= PIT
+            for nx, ny in self.neighbors(x, y):
+                cells[nx * size + ny] |= BREEZE
+        if self.wumpus_pos is not None:
+            x, y = self.wumpus_pos
+            cells[x * size + y] |= WUMPUS
+            for nx, ny in self.neighbors(x, y):
+                cells[nx * size + ny] |= STENCH
+        for pos, flag in ((self.agent_pos, AGENT), (self.gold_pos, GOLD), (self._dead_wumpus, DEAD_WUMPUS)):
+            if pos is not None:
+                cells[pos[0] * size + pos[1]] |= flag
+        # Las celdas con un peligro no muestran percepciones
+        hazards = list(self.pits)
+        if self.wumpus_pos is not None:
+            hazards.append(self.wumpus_pos)
+        for x, y in hazards:
+            cells[x * size + y] &= ~(BREEZE | STENCH)
+        return cells
+
+    def neighbors(self, x: int, y: int):
+        """
+        Devuelve las celdas vecinas dentro del tablero.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
+
+        Returns:
+            list: Posiciones (x, y) de las vecinas.
+        """
+        size = self.size
+        return [
+            (x + dx, y + dy)
+            for dx, dy in NEIGHBOR_DELTAS
+            if 0 <= x + dx < size and 0 <= y + dy < size
+        ]
+
+    def cell_flags(self, x: int, y: int):
+        """
+        Calcula los bits de una celda a partir de los objetos del tablero.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
+
+        Returns:
+            int: Combinación de los bits definidos en `cells`.
+        """
+        pos = (x, y)
+        pits = self.pits
+        wumpus_pos = self.wumpus_pos
+        flags = 0
+        if pos in pits:
+            flags |= PIT
+        if pos == wumpus_pos:
+            flags |= WUMPUS
+        if pos == self.agent_pos:
+            flags |= AGENT
+        if pos == self.gold_pos:
+            flags |= GOLD
+        if pos == self._dead_wumpus:
+            flags |= DEAD_WUMPUS
+        if flags & HAZARD:
+            return flags
+        return flags | self.perception_flags(x, y)
+
+    def perception_flags(self, x: int, y: int):
+        """
+        Devuelve la brisa y el hedor que llegan a una celda, aunque tenga un peligro.
+
+        Args:
+            x (int): Coordenada x de la celda.
+            y (int): Coordenada y de la celda.
+
+        Returns:
+            int: Combinación de `BREEZE` y `STENCH`.
+        """
+        pits = self.pits
+        wumpus_pos = self.wumpus_pos
+        flags = 0
+        for dx, dy in NEIGHBOR_DELTAS:
+            neighbor = (x + dx, y + dy)
+            if neighbor in pits:
+                flags |= BREEZE
+            if neighbor == wumpus_pos:
+                flags |= STENCH
+        return flags
+
+    def set_flag(self, x: int, y: int, flag: int):
+        # El agente, el Wumpus, el oro y los pozos se deducen de sus posiciones
+        if flag & DEAD_WUMPUS:
+            self._dead_wumpus = (x, y)
+
+    def clear_flag(self, x: int, y: int, flag: int):
+        if flag & DEAD_WUMPUS and self._dead_wumpus == (x, y):
+            self._dead_wumpus = None
+
+    def _update_perceptions(self, x: int, y: int, obj_type: str, delta: int):
+        # La brisa y el hedor se calculan en `cell_flags`
+        pass
+
+    def _refresh_perceptions(self, x: int, y: int):
+        pass
+
+    def place_breezes_and_stenches(self):
+        pass
+
+    def reset(self):
+        """
+        Reinicia el tablero una vez que se ha terminado una partida.
+        """
+        self.agent_pos = None
+        self.wumpus_pos = None
+        self.gold_pos = None
+        self.pits = PitSet()
+        self.moving_pit = None
+        self.arrowAvailable = True
+        self._dead_wumpus = None
+
+        if self.custom_board:
+            self.load_custom_board(self.custom_board)
+        else:
+            self.initialize_board()
+
+        # Seleccionar aleatoriamente uno de los pozos. El orden de un conjunto
+        # de tuplas de enteros no depende de la ejecución, así que la semilla
+        # elige siempre el mismo pozo.
+        if self.pits:
+            pits = tuple(self.pits)
+            self.moving_pit = pits[self.rng.randrange(len(pits))]
+
+        self.record_change()
+
+    def place_pits(self):
+        """
+        Coloca `pit_count` pozos en celdas aleatorias del tablero.
+        """
+        self.pits.update(self.sample_valid_cells(self.pit_count))
+
+    def sample_valid_cells(self, count: int):
+        """
+        Elige al azar, sin repetir, celdas válidas y libres para colocar objetos.
+
+        Sortea celdas de todo el tablero y descarta las que no sirven, así que
+        no necesita la lista de todas las celdas válidas.
+
+        Args:
+            count (int): Número de celdas a elegir.
+
+        Returns:
+            list: Posiciones (x, y) elegidas.
+
+        Raises:
+            ValueError: Si no quedan celdas libres suficientes.
+        """
+        size = self.size
+        agent_x, agent_y = agent_start(size)
+        near_agent = sum(
+            1
+            for x in range(max(0, agent_x - 2), agent_x + 1)
+            for y in range(agent_y, min(size, agent_y + 3))
+            if manhattan_distance(x, y, agent_x, agent_y) <= 2
+        )
+        occupied = {self.wumpus_pos, self.gold_pos} - {None}
+        taken = self.pits | occupied
+        free = size * size - near_agent - sum(
+            1 for x, y in taken if manhattan_distance(x, y, agent_x, agent_y) > 2
+        )
+        if count > free:
+            raise ValueError(f"No hay celdas libres suficientes en un tablero de {size}x{size}")
+
+        # Diccionario para conservar el orden del sorteo sin repetir celdas
+        chosen = {}
+        randrange = self.rng.randrange
+        cells = size * size
+        while len(chosen) < count:
+            x, y = pos = divmod(randrange(cells), size)
+            if abs(x - agent_x) + abs(y - agent_y) > 2 and pos not in taken:
+                chosen[pos] = None
+        return list(chosen)
+
+    def _flow_cells(self):
+        """
+        Bits de todas las celdas para el campo de distancias al oro.
+
+        Recorre el tablero denso completo; en tableros grandes conviene usar
+        `distance_to_gold`, que no necesita el campo.
+        """
+        return self.dense_cells()
+
+    def distance_to_gold(self, pos: tuple):
+        """
+        Devuelve la distancia de Manhattan al oro, o inf si la celda tiene un peligro.
+
+        Es una cota inferior del número de pasos, que no tiene en cuenta los
+        rodeos alrededor de los peligros.
+
+        Args:
+            pos (tuple): Posición (x, y) de la celda.
+
+        Returns:
+            float: Distancia al oro.
+        """
+        if pos in self.pits or pos == self.wumpus_pos:
+            return float("inf")
+        return float(manhattan_distance(pos[0], pos[1], self.gold_pos[0], self.gold_pos[1]))
+
+    def gold_distances(self, x0: int, x1: int, y0: int, y1: int):
+        return [
+            [self.distance_to_gold((x, y)) for y in range(y0, y1)] for x in range(x0, x1)
+        ]
+
+    def next_step_to_gold(self, pos: tuple):
+        """
+        Devuelve una dirección que acerca la celda al oro sin pisar un peligro.
+
+        Args:
+            pos (tuple): Posición (x, y) de la celda.
+
+        Returns:
+            str: Dirección del movimiento o None si ningún vecino acerca al oro.
+        """
+        current = self.distance_to_gold(pos)
+        for direction, (dx, dy) in DIRECTION_DELTAS.items():
+            neighbor = (pos[0] + dx, pos[1] + dy)
+            if not (0 <= neighbor[0] < self.size and 0 <= neighbor[1] < self.size):
+                continue
+            if self.distance_to_gold(neighbor) < current:
+                return direction
+        return None
+
+    def apply_hazard_move(self):
+        """
+        Aplica de forma reversible el movimiento del pozo móvil.
+
+        Returns:
+            MoveUndo: Registro para `undo_move` o None si el pozo no se ha movido.
+        """
+        if self.moving_pit is None:
+            return None
+
+        old_pos = self.moving_pit
+        new_pos = self.get_next_object_position(old_pos)
+        if new_pos is None:
+            return None
+
+        # Los pozos no tienen orden: cualquier `pit_index` indica que se ha movido el pozo
+        record = self._undo_record(self._with_neighbors((old_pos, new_pos)), pit_index=0)
+        self.move_object("O", old_pos, new_pos, record=False)
+        self.moving_pit = new_pos
+        return record
+
+    def undo_move(self, record: MoveUndo):
+        """
+        Deshace un movimiento aplicado con `apply_move`, `apply_hazard_move` o `apply_shot`.
+
+        Args:
+            record (MoveUndo): Registro devuelto al aplicar el movimiento.
+        """
+        if record.pit_index is not None:
+            self.pits.discard(self.moving_pit)
+            self.pits.add(record.moving_pit)
+        if record.wumpus_pos != self.wumpus_pos:
+            self._dead_wumpus = None
+
+        self.agent_pos = record.agent_pos
+        self.moving_pit = record.moving_pit
+        self.wumpus_pos = record.wumpus_pos
+        self.arrowAvailable = record.arrow_available
+        self.revision = record.revision
+
+    def _undo_record(self, positions, pit_index: int = None):
+        """
+        Guarda los datos del tablero que puede cambiar un movimiento.
+
+        Las celdas no se copian porque se deducen de los objetos; `cells`
+        guarda las posiciones que el movimiento puede modificar.
+
+        Returns:
+            MoveUndo: Registro para `undo_move`.
+        """
+        return MoveUndo(
+            self.agent_pos,
+            self.moving_pit,
+            pit_index,
+            self.wumpus_pos,
+            self.arrowAvailable,
+            tuple(positions),
+            self.revision,
+        )
+
+
+class SparseBoardView:
+    """
+    Vista de solo lectura de un `SparseBoard` con el formato de `BoardView`.
+    """
+
+    def __init__(self, board: SparseBoard):
+        self._board = board
+
+    def __len__(self):
+        return self._board.size
+
+    def __getitem__(self, x: int):
+        size = self._board.size
+        if not -size <= x < size:
+            raise IndexError("Fila fuera del tablero")
+        return _SparseRowView(self._board, x % size)
+
+    def __iter__(self):
+        for x in range(self._board.size):
+            yield _SparseRowView(self._board, x)
+
+
+class _SparseRowView:
+    """
+    Fila de solo lectura de una `SparseBoardView`.
+    """
+
+    def __init__(self, board: SparseBoard, x: int):
+        self._board = board
+        self._x = x
+
+    def __len__(self):
+        return self._board.size
+
+    def __getitem__(self, y: int):
+        size = self._board.size
+        if not -size <= y < size:
+            raise IndexError("Columna fuera del tablero")
+        return CELL_CHARS[self._board.cell_flags(self._x, y % size)]
+
+    def __iter__(self):
+        for y in range(self._board.size):
+            yield CELL_CHARS[self._board.cell_flags(self._x, y)]
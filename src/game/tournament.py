@@ -0,0 +1,240 @@
+"""
+Torneo entre los jugadores automáticos sobre los mismos tableros.
+
+Se generan tableros aleatorios reproducibles de tamaños entre 3 y 20 y se
+añaden todos los tableros válidos de `tableros/`. Cada agente registrado
+juega cada tablero en un `ProcessPoolExecutor` y los resultados se escriben
+en CSV o JSON lines según van terminando.
+"""
+
+import csv
+import json
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .cells import AGENT, GOLD
+from .corpus import read_text_board, text_board_to_grid
+from .generator import generate_boards
+from .simulation import CAUGHT, FELL, LOOP, NO_PATH, STEP_LIMIT, WIN, play_board
+
+MIN_SIZE = 3
+MAX_SIZE = 20
+# Partidas que juega un proceso en cada tarea
+CHUNK_SIZE = 8
+
+BoardSpec = namedtuple("BoardSpec", ["index", "name", "grid", "seed"])
+TournamentResult = namedtuple(
+    "TournamentResult",
+    ["board", "name", "size", "seed", "agent", "outcome", "steps", "latencies"],
+)
+
+# Agentes del torneo: nombre -> (jugador, opciones del jugador). Todos juegan
+# con las mismas reglas: el pozo móvil se mueve después de cada turno, como en
+# MinMax, para que los resultados de cada tablero sean comparables
+AGENTS = {
+    "astar": ("astar", {"moving_pit": True}),
+    "minmax": ("minmax", {}),
+    "minmax_pit": ("minmax", {"adversary": "pit"}),
+}
+
+FIELDS = ["board", "name", "size", "seed", "agent", "outcome", "steps", "mean_ms", "max_ms"]
+
+
+def register_agent(name: str, player_name: str, **options):
+    """
+    Añade un agente al torneo.
+
+    Args:
+        name (str): Nombre del agente en los resultados.
+        player_name (str): Jugador que usa ("astar" o "minmax").
+        **options: Opciones del jugador (por ejemplo, `planner="dstar"`).
+    """
+    AGENTS[name] = (player_name, options)
+
+
+def tournament_boards(count: int, seed: int = None, boards_dir: str = None):
+    """
+    Prepara los tableros del torneo.
+
+    Args:
+        count (int): Número de tableros aleatorios.
+        seed (int): Semilla del torneo.
+        boards_dir (str): Carpeta con tableros de texto que se añaden al final.
+
+    Returns:
+        list: Un `BoardSpec` por tablero.
+    """
+    rng = np.random.default_rng(seed)
+    sizes = rng.integers(MIN_SIZE, MAX_SIZE + 1, size=count)
+    board_seeds = rng.integers(0, 2**31, size=count)
+    boards = []
+    for size in np.unique(sizes):
+        positions = np.flatnonzero(sizes == size)
+        grids, seeds = generate_boards(len(positions), int(size), int(board_seeds[positions[0]]))
+        for position, grid, board_seed in zip(positions, grids, seeds):
+            boards.append((int(position), grid, int(board_seed)))
+    specs = [
+        BoardSpec(position, "aleatorio", grid, board_seed)
+        for position, grid, board_seed in sorted(boards, key=lambda item: item[0])
+    ]
+
+    if boards_dir is not None:
+        for file_name in sorted(os.listdir(boards_dir)):
+            if not file_name.endswith(".txt"):
+                continue
+            custom_board, size = read_text_board(os.path.join(boards_dir, file_name))
+            if not all(len(row) == size for row in custom_board):
+                continue
+            grid = text_board_to_grid(custom_board)
+            if not (grid & AGENT).any() or not (grid & GOLD).any():
+                continue
+            # Misma semilla para todos los agentes, así el pozo móvil es el mismo
+            specs.append(BoardSpec(len(specs), file_name, grid, int(rng.integers(0, 2**31))))
+    return specs
+
+
+def _play_chunk(games):
+    results = []
+    for spec, (agent, (player_name, options)) in games:
+        outcome, steps, latencies = play_board(player_name, spec.grid, spec.seed, **options)
+        results.append(
+            TournamentResult(
+                spec.index, spec.name, len(spec.grid), spec.seed, agent, outcome, steps, latencies
+            )
+        )
+    return results
+
+
+def result_row(result: TournamentResult):
+    """
+    Convierte el resultado de una partida en una fila de `FIELDS`.
+
+    Args:
+        result (TournamentResult): Resultado de la partida.
+
+    Returns:
+        dict: Valores de la fila.
+    """
+    latencies = result.latencies
+    return {
+        "board": result.board,
+        "name": result.name,
+        "size": result.size,
+        "seed": result.seed,
+        "agent": result.agent,
+        "outcome": result.outcome,
+        "steps": result.steps,
+        "mean_ms": round(sum(latencies) / len(latencies), 4) if latencies else 0,
+        "max_ms": round(max(latencies), 4) if latencies else 0,
+    }
+
+
+class ResultWriter:
+    """
+    Escribe los resultados en CSV o, si la ruta termina en `.jsonl`, en JSON lines.
+    """
+
+    def __init__(self, path: str):
+        self.file = open(path, "w", newline="")
+        self.jsonl = path.endswith(".jsonl")
+        if not self.jsonl:
+            self.writer = csv.DictWriter(self.file, fieldnames=FIELDS)
+            self.writer.writeheader()
+
+    def write(self, result: TournamentResult):
+        row = result_row(result)
+        if self.jsonl:
+            self.file.write(json.dumps(row) + "\n")
+        else:
+            self.writer.writerow(row)
+        # Los resultados se pueden seguir mientras el torneo continúa
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def run_tournament(
+    count: int,
+    seed: int = None,
+    agents: list = None,
+    workers: int = None,
+    output: str = None,
+    boards_dir: str = None,
+):
+    """
+    Juega el torneo completo.
+
+    Args:
+        count (int): Número de tableros aleatorios.
+        seed (int): Semilla del torneo.
+        agents (list): Nombres de los agentes. Por defecto, todos los de `AGENTS`.
+        workers (int): Número de procesos. Por defecto, uno por núcleo.
+        output (str): Archivo `.csv` o `.jsonl` donde se escriben los resultados.
+        boards_dir (str): Carpeta con tableros de texto que también se juegan.
+
+    Returns:
+        list: Un `TournamentResult` por partida, en el orden en que han terminado.
+    """
+    if agents is None:
+        agents = list(AGENTS)
+    unknown = [agent for agent in agents if agent not in AGENTS]
+    if unknown:
+        raise ValueError(f"Agentes desconocidos: {', '.join(unknown)}")
+    # Los procesos reciben la configuración del agente por si se registró después de crearse
+    entries = [(agent, AGENTS[agent]) for agent in agents]
+    games = [(spec, entry) for spec in tournament_boards(count, seed, boards_dir) for entry in entries]
+    # Primero las partidas grandes para que los procesos terminen a la vez
+    games.sort(key=lambda game: -len(game[0].grid))
+    chunks = [games[start : start + CHUNK_SIZE] for start in range(0, len(games), CHUNK_SIZE)]
+
+    writer = ResultWriter(output) if output else None
+    results = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            for future in as_completed([executor.submit(_play_chunk, chunk) for chunk in chunks]):
+                for result in future.result():
+                    results.append(result)
+                    if writer is not None:
+                        writer.write(result)
+    finally:
+        if writer is not None:
+            writer.close()
+    return results
+
+
+def percentile(values: list, q: float):
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+def tournament_report(results: list):
+    """
+    Resume el torneo por agente.
+
+    Args:
+        results (list): Resultados devueltos por `run_tournament`.
+
+    Returns:
+        str: Tasa de victorias, causas de derrota, turnos medios y percentiles
+        p50/p95/p99 del tiempo por turno de cada agente.
+    """
+    lines = []
+    causes = (CAUGHT, FELL, LOOP, NO_PATH, STEP_LIMIT)
+    for agent in sorted({result.agent for result in results}):
+        games = [result for result in results if result.agent == agent]
+        latencies = [latency for game in games for latency in game.latencies]
+        wins = sum(game.outcome == WIN for game in games)
+        lines.append(f"{agent}: {len(games)} partidas, {100 * wins / len(games):.1f}% ganadas")
+        lines.append(
+            "  derrotas: "
+            + ", ".join(f"{cause} {sum(game.outcome == cause for game in games)}" for cause in causes)
+        )
+        lines.append(f"  turnos por partida: {sum(game.steps for game in games) / len(games):.1f}")
+        lines.append(
+            f"  tiempo por turno: p50 {percentile(latencies, 50):.3f} ms, "
+            f"p95 {percentile(latencies, 95):.3f} ms, p99 {percentile(latencies, 99):.3f} ms"
+        )
+    return "\n".join(lines)
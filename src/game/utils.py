@@ -1,3 +1,6 @@
+DIRECTION_DELTAS = {"up": (-1, 0), "down": (1, 0), "left": (0, -1), "right": (0, 1)}
+
+
 def manhattan_distance(x1: int, y1: int, x2: int, y2: int):
     """
     Calcula la distancia de Manhattan entre dos puntos.
@@ -42,4 +45,86 @@ def get_agent_moves():
     Returns:
         list: Lista de direcciones pos
     """
-    return ["up", "down", "left", "right"]
\ No newline at end of file
+    return ["up", "down", "left", "right"]
+
+
+def agent_start(size: int):
+    """
+    Devuelve la posición inicial del agente (esquina inferior izquierda).
+
+    Args:
+        size (int): Tamaño del tablero.
+
+    Returns:
+        tuple: Posición (x, y) del agente.
+    """
+    return (size - 1, 0)
+
+
+def num_pits(size: int):
+    """
+    Devuelve el número de pozos de un tablero aleatorio (10% de las celdas).
+
+    Args:
+        size (int): Tamaño del tablero.
+
+    Returns:
+        int: Número de pozos.
+    """
+    return size * size // 10
+
+
+def valid_cells(size: int):
+    """
+    Devuelve las celdas en las que se puede colocar un objeto.
+
+    Son las celdas a una distancia de Manhattan mayor que 2 de la posición
+    inicial del agente.
+
+    Args:
+        size (int): Tamaño del tablero.
+
+    Returns:
+        list: Índices `x * size + y` de las celdas válidas, en orden creciente.
+    """
+    agent_x, agent_y = agent_start(size)
+    return [
+        x * size + y
+        for x in range(size)
+        for y in range(size)
+        if manhattan_distance(x, y, agent_x, agent_y) > 2
+    ]
+
+
+def read_text_board(file_path: str):
+    """
+    Lee un tablero en el formato de texto de la carpeta `tableros/`.
+
+    Cada línea es una fila; cada carácter es una celda, salvo los grupos entre
+    corchetes, que forman una única celda con varios elementos.
+
+    Args:
+        file_path (str): Ruta del archivo de texto.
+
+    Returns:
+        list, int: Filas del tablero con el contenido de cada celda y número de filas.
+    """
+    with open(file_path, "r") as file:
+        lines = file.readlines()
+
+    board = []
+    for line in lines:
+        row = []
+        i = 0
+        while i < len(line.strip()):
+            if line[i] == "[":
+                end_bracket = line.index("]", i)
+                cell_content = line[i + 1 : end_bracket]
+                row.append(cell_content)
+                i = end_bracket + 1
+            else:
+                row.append(line[i])
+                i += 1
+        board.append(row)
+
+    return board, len(board)
@@ -1,6 +1,8 @@
 import os
 import sys
+import time
 import argparse
+import importlib
 
 # Ajustar el sys.path para permitir imports relativos
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -8,13 +10,37 @@ project_root = os.path.abspath(os.path.join(current_dir, ".."))
 sys.path.append(project_root)
 
 from src.game.board import Board
-from src.ui.text_mode import TextMode
-from src.ui.pygame_mode import PygameMode
-from src.game.ai.astar import AStarPlayer
-from src.game.ai.minmax import MinMaxPlayer
+from src.game.sparse_board import SPARSE_MIN_SIZE, SparseBoard
+from src.game.utils import read_text_board
 
+# Tamaño máximo del tablero por defecto (se cambia con -maxtablero)
+MAX_BOARD_SIZE = 20
 
-def load_custom_board(file_path: str):
+# Modos de juego: nombre -> (módulo, clase). Cada modo se importa solo al
+# elegirlo, así el modo texto no carga pygame ni NumPy.
+GAME_MODES = {
+    "text": ("src.ui.text_mode", "TextMode"),
+    "pygame": ("src.ui.pygame_mode", "PygameMode"),
+    "astar": ("src.game.ai.astar", "AStarPlayer"),
+    "minmax": ("src.game.ai.minmax", "MinMaxPlayer"),
+}
+
+
+def game_mode_class(name: str):
+    """
+    Importa y devuelve la clase de un modo de juego de `GAME_MODES`.
+
+    Args:
+        name (str): Nombre del modo de juego.
+
+    Returns:
+        type: Clase del modo de juego.
+    """
+    module_name, class_name = GAME_MODES[name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def load_custom_board(file_path: str, max_size: int = MAX_BOARD_SIZE):
     """
     Carga un tablero personalizado desde un archivo de texto.
     Se espera que el archivo tenga el siguiente formato:
@@ -31,38 +57,23 @@ def load_custom_board(file_path: str):
 
     Args:
         file_path (str): Ruta del archivo de texto.
+        max_size (int): Tamaño máximo del tablero.
 
     Returns:
         list, int: Tablero personalizado y tamaño del tablero.
 
     Raises:
-        ValueError: Si el tablero no es cuadrado o el tamaño no está entre 3 y 20.
+        ValueError: Si el tablero no es cuadrado o el tamaño no está entre 3 y `max_size`.
     """
-    with open(file_path, "r") as file:
-        lines = file.readlines()
-
-    board = []
-    for line in lines:
-        row = []
-        i = 0
-        while i < len(line.strip()):
-            if line[i] == "[":
-                end_bracket = line.index("]", i)
-                cell_content = line[i + 1 : end_bracket]
-                row.append(cell_content)
-                i = end_bracket + 1
-            else:
-                row.append(line[i])
-                i += 1
-        board.append(row)
-
-    size = len(board)
+    board, size = read_text_board(file_path)
 
     if not all(len(row) == size for row in board):
         raise ValueError("El tablero no es cuadrado")
 
-    if size < 3 or size > 20:
-        raise ValueError("El tamaño del tablero debe estar entre 3x3 y 20x20")
+    if size < 3 or size > max_size:
+        raise ValueError(
+            f"El tamaño del tablero debe estar entre 3x3 y {max_size}x{max_size}"
+        )
 
     return board, size
 
@@ -77,13 +88,60 @@ Uso: python main.py [opciones]
 Opciones:
   -h, --help            Muestra este mensaje de ayuda
   -newtablero <0/1>     0 para tablero aleatorio, 1 para tablero personalizado
-  -board <size>         Tamaño del tablero (3-20) para tablero aleatorio
+  -board <size>         Tamaño del tablero (3-20, o hasta -maxtablero) para
+                        tablero aleatorio
+  -maxtablero <n>       Tamaño máximo de los tableros ({MAX_BOARD_SIZE} por defecto)
+  -disperso             Guarda solo los objetos del tablero y calcula las
+                        percepciones al consultarlas (siempre a partir de
+                        {SPARSE_MIN_SIZE}x{SPARSE_MIN_SIZE}). En pygame, las flechas desplazan la vista
   -tablero <filename>   Nombre del archivo del tablero personalizado
-  -gamemode <mode>      Modo de juego (text, pygame, astar, minmax)
+  -gamemode <mode>      Modo de juego (text, pygame, astar, minmax, bench, tournament)
+  -seed <n>             Semilla para generar tableros aleatorios reproducibles
+  -budget <ms>          Tiempo máximo por jugada en milisegundos para minmax
+                        (profundización iterativa en lugar de profundidad fija)
+  -planner <nombre>     Planificador del modo astar (astar, dstar, hpa, jps,
+                        spacetime). hpa busca por clústeres (HPA*), para tableros
+                        grandes; jps salta en línea recta las zonas sin
+                        percepciones; spacetime prevé los movimientos del pozo
+                        móvil (con -pozomovil) y busca una ruta que lo esquive
+  -velocidad <x>        Velocidad de los modos astar y minmax (1 por defecto, 2 el
+                        doble de rápido, 0 lo más rápido posible). En la partida,
+                        '+' y '-' la duplican o la reducen a la mitad
+  -fps <n>              Fotogramas por segundo máximos de la ventana (30 por defecto)
+  -adversario <modelo>  Nodos min de minmax: agent (mueve el agente) o pit
+                        (responde el pozo móvil con su único movimiento)
+  -pozomovil            En el modo astar, el pozo móvil persigue al agente
+  -corpus <archivo>     Corpus binario de tableros (python -m src.game.corpus)
+  -indice <k>           Posición del tablero del corpus que se juega (0 por defecto)
+  -estadisticas <arch>  En los modos astar, minmax y bench, cuenta lo que hace la
+                        búsqueda y mide cada fase del turno; el informe de cada
+                        partida se añade en JSON lines al archivo
+  -perfilturno <n>      Perfila con cProfile la decisión del turno n de cada partida
+                        (el informe se muestra si no se indica -estadisticas)
+
+Opciones del modo bench (partidas sin ventana ni esperas):
+  -jugador <nombre>     Jugador automático que se evalúa (astar, minmax)
+  -partidas <n>         Número de tableros aleatorios (100 por defecto)
+  -workers <n>          Procesos que juegan partidas en paralelo (1 por defecto;
+                        en tournament, uno por núcleo). En el modo minmax, procesos
+                        entre los que se reparte la búsqueda alfa-beta
+
+Opciones del modo tournament (todos los agentes en los mismos tableros):
+  -partidas <n>         Número de tableros aleatorios de 3x3 a 20x20
+  -salida <archivo>     Resultados de cada partida en .csv o .jsonl
 
 Ejemplos:
   python main.py -newtablero 1 -tablero tablero_6x6.txt -gamemode astar
   python main.py -newtablero 0 -board 6 -gamemode pygame
+  python main.py -newtablero 0 -board 1000 -maxtablero 2000 -gamemode astar -planner hpa
+  python main.py -newtablero 0 -board 10 -gamemode minmax -budget 200
+  python main.py -newtablero 0 -board 10 -gamemode minmax -workers 4
+  python main.py -newtablero 0 -board 12 -gamemode astar -planner dstar -pozomovil
+  python main.py -newtablero 0 -board 12 -gamemode astar -planner spacetime -pozomovil
+  python main.py -corpus tableros.wcorp -indice 3 -gamemode astar
+  python main.py -newtablero 0 -board 10 -gamemode minmax -estadisticas partidas.jsonl -perfilturno 1
+  python main.py -gamemode bench -jugador minmax -board 8 -partidas 1000 -seed 1 -workers 4
+  python main.py -gamemode tournament -partidas 500 -seed 1 -salida torneo.csv
     """
     print(help_text)
 
@@ -95,8 +153,27 @@ def main():
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("-newtablero", type=int, choices=[0, 1])
     parser.add_argument("-board", type=int)
+    parser.add_argument("-maxtablero", type=int, default=MAX_BOARD_SIZE)
+    parser.add_argument("-disperso", action="store_true")
     parser.add_argument("-tablero", type=str)
     parser.add_argument("-gamemode", type=str)
+    parser.add_argument("-seed", type=int)
+    parser.add_argument("-budget", type=float)
+    parser.add_argument(
+        "-planner", type=str, choices=["astar", "dstar", "hpa", "jps", "spacetime"], default="astar"
+    )
+    parser.add_argument("-pozomovil", action="store_true")
+    parser.add_argument("-velocidad", type=float, default=1.0)
+    parser.add_argument("-fps", type=int, default=30)
+    parser.add_argument("-adversario", type=str, choices=["agent", "pit"], default="agent")
+    parser.add_argument("-corpus", type=str)
+    parser.add_argument("-indice", type=int, default=0)
+    parser.add_argument("-jugador", type=str, choices=["astar", "minmax"], default="astar")
+    parser.add_argument("-partidas", type=int, default=100)
+    parser.add_argument("-workers", type=int)
+    parser.add_argument("-salida", type=str)
+    parser.add_argument("-estadisticas", type=str)
+    parser.add_argument("-perfilturno", type=int)
     parser.add_argument("-h", "--help", action="store_true")
 
     args = parser.parse_args()
@@ -105,13 +182,74 @@ def main():
         print_help()
         return
 
+    # Opciones adicionales de cada jugador
+    mode_options = {
+        "astar": {
+            "planner": args.planner,
+            "moving_pit": args.pozomovil,
+            "speed": args.velocidad,
+            "fps": args.fps,
+            "stats_path": args.estadisticas,
+            "profile_turn": args.perfilturno,
+        },
+        "minmax": {
+            "time_budget_ms": args.budget,
+            "adversary": args.adversario,
+            "speed": args.velocidad,
+            "fps": args.fps,
+            "stats_path": args.estadisticas,
+            "profile_turn": args.perfilturno,
+        },
+    }
+
+    if args.gamemode is not None and args.gamemode.lower() == "bench":
+        from src.game.simulation import run_batch, summarize
+
+        size = args.board or 6
+        if size < 3 or size > args.maxtablero:
+            print(f"El tamaño del tablero debe estar entre 3 y {args.maxtablero}.")
+            return
+        start = time.perf_counter()
+        results = run_batch(
+            args.jugador,
+            args.partidas,
+            size,
+            seed=args.seed,
+            workers=args.workers or 1,
+            **mode_options[args.jugador],
+        )
+        print(summarize(results, time.perf_counter() - start))
+        return
+
+    if args.gamemode is not None and args.gamemode.lower() == "tournament":
+        from src.game.tournament import run_tournament, tournament_report
+
+        results = run_tournament(
+            args.partidas,
+            seed=args.seed,
+            workers=args.workers,
+            output=args.salida,
+            boards_dir=os.path.join(os.path.dirname(__file__), "..", "tableros"),
+        )
+        print(tournament_report(results))
+        return
+
     print(f"Bienvenido a Hunt the Wumpus!")
 
     custom_board = None
     size = None
     game_mode = None
+    board = None
 
-    if args.newtablero is None:
+    if args.corpus is not None:
+        from src.game.corpus import BoardCorpus
+
+        try:
+            board = BoardCorpus(args.corpus).board(args.indice)
+        except Exception as e:
+            print(f"Error al cargar el tablero del corpus: {e}")
+            return
+    elif args.newtablero is None:
         while True:
             board_choice = input(
                 "¿Desea usar un tablero personalizado? (s/n): "
@@ -121,7 +259,9 @@ def main():
                 break
             print(f"Opción no válida. Por favor, ingrese 's' o 'n'.")
 
-    if args.newtablero == 1:
+    if board is not None:
+        size = board.size
+    elif args.newtablero == 1:
         if args.tablero is None:
             custom_boards_dir = os.path.join(
                 os.path.dirname(__file__), "..", "tableros"
@@ -136,7 +276,7 @@ def main():
             os.path.dirname(__file__), "..", "tableros", args.tablero
         )
         try:
-            custom_board, size = load_custom_board(file_path)
+            custom_board, size = load_custom_board(file_path, args.maxtablero)
         except Exception as e:
             print(f"Error al cargar el tablero: {e}")
             return
@@ -144,42 +284,42 @@ def main():
         if args.board is None:
             while True:
                 try:
-                    size = int(input("Ingrese el tamaño del tablero (3-20): "))
-                    if 3 <= size <= 20:
+                    size = int(
+                        input(f"Ingrese el tamaño del tablero (3-{args.maxtablero}): ")
+                    )
+                    if 3 <= size <= args.maxtablero:
                         break
                     else:
-                        print(f"El tamaño debe estar entre 3 y 20.")
+                        print(f"El tamaño debe estar entre 3 y {args.maxtablero}.")
                 except ValueError:
                     print(f"Por favor, ingrese un número válido.")
         else:
             size = args.board
-            if size < 3 or size > 20:
-                print(f"El tamaño del tablero debe estar entre 3 y 20.")
+            if size < 3 or size > args.maxtablero:
+                print(f"El tamaño del tablero debe estar entre 3 y {args.maxtablero}.")
                 return
 
-    game_modes = {
-        "text": TextMode,
-        "pygame": PygameMode,
-        "astar": AStarPlayer,
-        "minmax": MinMaxPlayer,
-    }
-
     if args.gamemode is None:
         while True:
             game_mode = input(
-                f"Elige el modo de juego ({', '.join(game_modes.keys())}): "
+                f"Elige el modo de juego ({', '.join(GAME_MODES.keys())}): "
             ).lower()
-            if game_mode in game_modes:
+            if game_mode in GAME_MODES:
                 break
             print(f"Modo inválido. Por favor, elige text, pygame, astar o minmax.")
     else:
         game_mode = args.gamemode.lower()
-        if game_mode not in game_modes:
+        if game_mode not in GAME_MODES:
             print(f"Modo de juego inválido. Use -h para ver las opciones disponibles.")
             return
 
-    board = Board(size, custom_board=custom_board)
-    game = game_modes[game_mode](board)
+    if game_mode == "minmax" and args.workers:
+        mode_options["minmax"]["search_workers"] = args.workers
+
+    if board is None:
+        board_class = SparseBoard if args.disperso or size >= SPARSE_MIN_SIZE else Board
+        board = board_class(size, custom_board=custom_board, seed=args.seed)
+    game = game_mode_class(game_mode)(board, **mode_options.get(game_mode, {}))
     game.run()
 
 
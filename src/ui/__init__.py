@@ -1,2 +1,17 @@
-from .pygame_mode import PygameMode
-from .text_mode import TextMode
\ No newline at end of file
+import importlib
+
+# Cada interfaz se importa al usarla: el modo texto no necesita cargar pygame
+_MODES = {
+    "PygameMode": ".pygame_mode",
+    "TextMode": ".text_mode",
+}
+
+__all__ = list(_MODES)
+
+
+def __getattr__(name):
+    if name not in _MODES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_MODES[name], __name__), name)
+    globals()[name] = value
+    return value
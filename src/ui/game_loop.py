@@ -0,0 +1,139 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import pygame
+
+from ..game.ai.stats import timed
+
+LOOP_MESSAGE = "El agente se ha estancado en un bucle."
+
+
+class GameLoop:
+    """
+    Bucle de partida de los jugadores automáticos con paso de simulación fijo.
+
+    La decisión del jugador (`decide`) se calcula en un hilo aparte mientras
+    la ventana sigue atendiendo eventos, y el turno se aplica en el hilo
+    principal (`apply_turn`). Los turnos se juegan cada `step_seconds`
+    segundos divididos entre la velocidad, y el tablero se dibuja como mucho
+    `fps` veces por segundo. Con velocidad 0 los turnos se juegan tan rápido
+    como se pueda, dibujando solo una vez por fotograma.
+
+    Teclas: `+` duplica la velocidad, `-` la reduce a la mitad, las flechas
+    desplazan la vista en tableros grandes y Escape sale.
+    """
+
+    def __init__(self, player, step_seconds: float, speed: float = 1.0, fps: int = 30, on_turn=None):
+        """
+        Args:
+            player: Jugador automático con `decide`, `apply_turn`, `board` y `game`.
+            step_seconds (float): Duración de un turno a velocidad 1.
+            speed (float): Multiplicador de velocidad (0 para ir lo más rápido posible).
+            fps (int): Fotogramas por segundo máximos.
+            on_turn (callable): Función a la que se pasa el movimiento de cada turno.
+        """
+        self.player = player
+        self.game = player.game
+        self.board = player.board
+        self.step_seconds = step_seconds
+        self.speed = speed
+        self.fps = fps
+        self.on_turn = on_turn
+        # Mensaje con el que ha terminado la partida (None si el usuario la abandona)
+        self.message = None
+        # Con las estadísticas del jugador activas también se mide el dibujo
+        self.stats = getattr(player, "stats", None)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def close(self):
+        """
+        Espera a que termine la decisión en curso y libera el hilo.
+        """
+        self.executor.shutdown(wait=True)
+
+    def handle_events(self):
+        """
+        Atiende los eventos de la ventana.
+
+        Returns:
+            bool: False si el usuario quiere salir.
+        """
+        for event in self.game.get_events():
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    return False
+                if self.game.scroll(event):
+                    continue
+                if event.unicode == "+" and self.speed > 0:
+                    self.speed *= 2
+                elif event.unicode == "-" and self.speed > 0:
+                    self.speed /= 2
+        return True
+
+    def check_game_over(self):
+        """
+        Comprueba si la partida ha terminado, incluido un bucle del agente.
+
+        Returns:
+            bool, str: Si ha terminado y el mensaje.
+        """
+        check_for_loop = getattr(self.player, "check_for_loop", None)
+        if check_for_loop is not None and check_for_loop():
+            return True, LOOP_MESSAGE
+        return self.board.check_game_over()
+
+    def play(self):
+        """
+        Juega una partida hasta que termina o el usuario cierra la ventana.
+
+        Returns:
+            bool: True si el usuario quiere jugar otra partida.
+        """
+        pending = None
+        accumulator = 0.0
+        last = time.perf_counter()
+        self.message = None
+        timed(self.stats, "draw", self.game.draw_board)
+
+        while True:
+            if not self.handle_events():
+                if pending is not None:
+                    pending.result()
+                return False
+
+            now = time.perf_counter()
+            frame_end = now + 1 / self.fps
+            if self.speed > 0:
+                # Como mucho un turno pendiente para no encadenar turnos tras una decisión lenta
+                accumulator = min(accumulator + (now - last) * self.speed, self.step_seconds)
+            last = now
+
+            # Simular todos los turnos que quepan en este fotograma
+            while True:
+                if pending is None:
+                    if self.speed > 0 and accumulator < self.step_seconds:
+                        break
+                    accumulator -= self.step_seconds if self.speed > 0 else 0
+                    pending = self.executor.submit(self.player.decide)
+                try:
+                    move = pending.result(timeout=max(0.0, frame_end - time.perf_counter()))
+                except TimeoutError:
+                    break
+                pending = None
+                self.player.apply_turn(move)
+                if self.on_turn is not None:
+                    self.on_turn(move)
+
+                game_over, message = self.check_game_over()
+                if game_over:
+                    self.message = message
+                    print(message)
+                    timed(self.stats, "draw", self.game.draw_board)
+                    return self.game.show_game_over_screen(message)
+
+            # Mientras se decide, el jugador puede estar probando movimientos sobre el tablero
+            if pending is None:
+                timed(self.stats, "draw", self.game.draw_board)
+            self.game.clock.tick(self.fps)
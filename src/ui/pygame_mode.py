@@ -1,15 +1,37 @@
 import pygame
-import os
 import numpy as np
 
+from .sprites import load_sprites
+
+MAX_WINDOW = 800  # Tamaño máximo de la ventana
+MIN_CELL_SIZE = 32  # Por debajo de este tamaño de celda se muestra solo una parte del tablero
+MAX_CELL_SIZE = 100
+SCROLL_KEYS = {
+    pygame.K_UP: (-1, 0),
+    pygame.K_DOWN: (1, 0),
+    pygame.K_LEFT: (0, -1),
+    pygame.K_RIGHT: (0, 1),
+}
+
 
 class PygameMode:
+    """
+    Ventana de pygame con la parte visible del tablero.
+
+    Si el tablero no cabe con celdas de al menos `MIN_CELL_SIZE` píxeles se
+    muestra una ventana de `view_size` x `view_size` celdas que sigue al
+    agente y que se puede desplazar con las flechas. Solo se dibujan las
+    celdas visibles.
+    """
+
     def __init__(self, board):
         self.board = board
         pygame.init()
         self.calculate_cell_size()
-        self.width = self.board.size * self.cell_size
-        self.height = self.board.size * self.cell_size
+        self.width = self.view_size * self.cell_size
+        self.height = self.view_size * self.cell_size
+        # Celda del tablero que se muestra en la esquina superior izquierda
+        self.origin = (0, 0)
         self.screen = pygame.display.set_mode((self.width, self.height))
         pygame.display.set_caption("Hunt the Wumpus")
 
@@ -19,46 +41,73 @@ class PygameMode:
         )  # Ajustar tamaño de fuente
         self.clock = pygame.time.Clock()
         self.QUIT = pygame.QUIT
+        # Estado de lo que hay dibujado en pantalla, para redibujar solo lo que cambia
+        self.glyphs = {}
+        self.drawn_revision = None
+        self.drawn_agent = None
+        self.drawn_utility = None
+        self.drawn_origin = None
 
     def calculate_cell_size(self):
-        max_width = 800  # Tamaño máximo de la ventana
+        self.view_size = min(self.board.size, MAX_WINDOW // MIN_CELL_SIZE)
         self.cell_size = min(
-            max_width // self.board.size, 100
+            MAX_WINDOW // self.view_size, MAX_CELL_SIZE
         )  # Limitar el tamaño máximo de celda a 100 píxeles
 
     def load_images(self):
-        base_path = os.path.join(os.path.dirname(__file__), "..", "..", "assets")
-        self.images = {
-            "A": pygame.image.load(os.path.join(base_path, "agent.png")),
-            "W": pygame.image.load(os.path.join(base_path, "wumpus.png")),
-            "G": pygame.image.load(os.path.join(base_path, "gold.png")),
-            "O": pygame.image.load(os.path.join(base_path, "pit.png")),
-            "b": pygame.image.load(os.path.join(base_path, "breeze.png")),
-            "s": pygame.image.load(os.path.join(base_path, "stench.png")),
-        }
-        for key in self.images:
-            self.images[key] = pygame.transform.scale(
-                self.images[key], (self.cell_size, self.cell_size)
-            )
+        self.images = load_sprites(self.cell_size)
 
     def calculate_utility(self):
-        utility = np.zeros((self.board.size, self.board.size))
-        gold_pos = self.board.gold_pos
-        for i in range(self.board.size):
-            for j in range(self.board.size):
-                if (i, j) == gold_pos:
-                    utility[i][j] = 0  # El oro tiene el menor coste.
-                elif "W" in self.board.board[i][j] or "O" in self.board.board[i][j]:
-                    utility[i][j] = 1000  # Wumpus y pozos tienen el mayor coste
-                else:
-                    distance = abs(i - gold_pos[0]) + abs(j - gold_pos[1])
-                    utility[i][
-                        j
-                    ] = distance  # El coste es directamente proporcional a la distancia
+        # El coste es el número de pasos hasta el oro rodeando los peligros,
+        # solo de las celdas visibles
+        x0, y0 = self.origin
+        utility = np.array(
+            self.board.gold_distances(x0, x0 + self.view_size, y0, y0 + self.view_size)
+        )
+        # Wumpus, pozos y celdas sin camino al oro tienen el mayor coste
+        utility[np.isinf(utility)] = 1000
         return utility
 
+    def clamp_origin(self, x0, y0):
+        limit = self.board.size - self.view_size
+        return min(max(x0, 0), limit), min(max(y0, 0), limit)
+
+    def follow_agent(self):
+        """
+        Centra la vista en el agente si se acerca al borde de la parte visible.
+        """
+        if self.board.agent_pos is None:
+            return
+        x, y = self.board.agent_pos
+        x0, y0 = self.origin
+        margin = self.view_size // 4
+        if not x0 + margin <= x < x0 + self.view_size - margin:
+            x0 = x - self.view_size // 2
+        if not y0 + margin <= y < y0 + self.view_size - margin:
+            y0 = y - self.view_size // 2
+        self.origin = self.clamp_origin(x0, y0)
+
+    def scroll(self, event):
+        """
+        Desplaza la vista media ventana si el evento es una flecha.
+
+        Returns:
+            bool: True si el evento era una flecha.
+        """
+        delta = SCROLL_KEYS.get(event.key)
+        if delta is None:
+            return False
+        step = max(1, self.view_size // 2)
+        x0, y0 = self.origin
+        self.origin = self.clamp_origin(x0 + delta[0] * step, y0 + delta[1] * step)
+        return True
+
     def get_events(self):
-        return pygame.event.get()
+        events = pygame.event.get()
+        # Si el sistema ha borrado la ventana hay que volver a dibujarla entera
+        if any(event.type == pygame.WINDOWEXPOSED for event in events):
+            self.invalidate()
+        return events
 
     def run(self):
         running = True
@@ -67,7 +116,9 @@ class PygameMode:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_w:
+                    if self.scroll(event):
+                        pass
+                    elif event.key == pygame.K_w:
                         self.board.move_agent("up")
                     elif event.key == pygame.K_s:
                         self.board.move_agent("down")
@@ -97,7 +148,6 @@ class PygameMode:
                                 print("Dirección inválida.")
 
             self.draw_board()
-            pygame.display.flip()
 
             game_over, message = self.board.check_game_over()
             if game_over:
@@ -109,30 +159,93 @@ class PygameMode:
 
         pygame.quit()
 
+    def invalidate(self):
+        """
+        Obliga a redibujar todo el tablero en la siguiente llamada a `draw_board`.
+        """
+        self.drawn_revision = None
+
+    def glyph(self, value):
+        """
+        Devuelve el texto renderizado de un valor de utilidad, reutilizando los ya renderizados.
+        """
+        text = f"{value:.0f}"
+        surface = self.glyphs.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, (100, 100, 100))
+            self.glyphs[text] = surface
+        return surface
+
+    def draw_cell(self, x, y, cells, utility):
+        """
+        Dibuja una celda del tablero.
+
+        Args:
+            x (int): Fila de la celda en el tablero.
+            y (int): Columna de la celda en el tablero.
+            cells (BoardView): Tablero como filas de tuplas de letras.
+            utility (np.ndarray): Utilidad de cada celda visible.
+
+        Returns:
+            pygame.Rect: Zona de la pantalla que se ha dibujado.
+        """
+        x0, y0 = self.origin
+        rect = pygame.Rect(
+            (y - y0) * self.cell_size, (x - x0) * self.cell_size, self.cell_size, self.cell_size
+        )
+        self.screen.fill((255, 255, 255), rect)
+        cell = cells[x][y]
+        if not cell:  # Si la celda está vacía
+            text = self.glyph(utility[x - x0][y - y0])
+            self.screen.blit(text, text.get_rect(center=rect.center))
+        for char in cell:
+            if char in self.images:
+                self.screen.blit(self.images[char], rect.topleft)
+        return rect
+
     def draw_board(self):
-        self.screen.fill((255, 255, 255))
-        board = self.board.get_board()
+        """
+        Dibuja el tablero redibujando solo las celdas que han cambiado.
+
+        Las celdas a redibujar son las que indica `Board.changes_since`, las
+        posiciones anterior y actual del agente y las celdas cuya utilidad ha
+        cambiado, siempre que estén en la parte visible. Si el tablero ha
+        cambiado por completo (por ejemplo, tras reiniciarlo) o la vista se ha
+        desplazado, se dibuja entera.
+        """
+        board = self.board
+        if board.agent_pos != self.drawn_agent:
+            self.follow_agent()
+        changes = None
+        if self.drawn_revision is not None and self.origin == self.drawn_origin:
+            changes = board.changes_since(self.drawn_revision)
+            if changes is not None and not changes and board.agent_pos == self.drawn_agent:
+                return
+
+        cells = board.get_board()
         utility = self.calculate_utility()
-        for y, row in enumerate(board):
-            for x, cell in enumerate(row):
-                if not cell:  # Si la celda está vacía
-                    utility_value = utility[y][x]
-                    text = self.font.render(
-                        f"{utility_value:.0f}", True, (100, 100, 100)
-                    )
-                    text_rect = text.get_rect(
-                        center=(
-                            x * self.cell_size + self.cell_size // 2,
-                            y * self.cell_size + self.cell_size // 2,
-                        )
-                    )
-                    self.screen.blit(text, text_rect)
-                for char in cell:
-                    if char in self.images:
-                        self.screen.blit(
-                            self.images[char], (x * self.cell_size, y * self.cell_size)
-                        )
-        pygame.display.flip()
+        x0, y0 = self.origin
+        view = self.view_size
+        if changes is None:
+            self.screen.fill((255, 255, 255))
+            for x in range(x0, x0 + view):
+                for y in range(y0, y0 + view):
+                    self.draw_cell(x, y, cells, utility)
+            pygame.display.flip()
+        else:
+            dirty = {
+                pos
+                for pos in (*changes, self.drawn_agent, board.agent_pos)
+                if pos is not None and x0 <= pos[0] < x0 + view and y0 <= pos[1] < y0 + view
+            }
+            dirty.update((x0 + x, y0 + y) for x, y in zip(*np.nonzero(utility != self.drawn_utility)))
+            rects = [self.draw_cell(int(x), int(y), cells, utility) for x, y in dirty]
+            pygame.display.update(rects)
+
+        self.drawn_revision = board.revision
+        self.drawn_agent = board.agent_pos
+        self.drawn_utility = utility
+        self.drawn_origin = self.origin
 
     def quit(self):
         pygame.quit()
@@ -143,24 +256,22 @@ class PygameMode:
         overlay.set_alpha(128)  # Valor de transparencia (0-255)
         overlay.fill((0, 0, 0))
         self.screen.blit(overlay, (0, 0))
+        self.invalidate()
 
         self.display_message(message)
         self.display_message("Presiona 'R' para reiniciar o 'Q' para salir", offset=50)
         pygame.display.flip()
 
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    waiting = False
-                    return False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_r:
-                        waiting = False
-                        return True  # Reiniciar el juego
-                    elif event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
-                        waiting = False
-                        return False  # Salir del juego
+        while True:
+            # Esperar sin consumir CPU hasta que llegue un evento
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                return False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    return True  # Reiniciar el juego
+                elif event.key == pygame.K_q or event.key == pygame.K_ESCAPE:
+                    return False  # Salir del juego
 
     def display_message(self, message, offset=0):
         text_surface = self.font.render(message, True, (255, 255, 255))
@@ -0,0 +1,128 @@
+import json
+import os
+
+import pygame
+
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "assets")
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hunt_the_wumpus")
+
+# Imagen de cada letra del tablero, en el orden en que se guardan en el atlas
+SPRITE_FILES = {
+    "A": "agent.png",
+    "W": "wumpus.png",
+    "G": "gold.png",
+    "O": "pit.png",
+    "b": "breeze.png",
+    "s": "stench.png",
+}
+
+# Atlas ya cargados en este proceso, por tamaño de celda y si están convertidos
+_atlases = {}
+
+
+def cache_key(cell_size: int):
+    """
+    Identifica un atlas por el tamaño de celda y la fecha y tamaño de cada imagen.
+
+    Args:
+        cell_size (int): Tamaño de las celdas en píxeles.
+
+    Returns:
+        dict: Datos que deben coincidir para reutilizar el atlas guardado.
+    """
+    files = {}
+    for name in SPRITE_FILES.values():
+        info = os.stat(os.path.join(ASSETS_DIR, name))
+        files[name] = [info.st_mtime_ns, info.st_size]
+    return {"cell_size": cell_size, "files": files}
+
+
+def build_atlas(cell_size: int):
+    """
+    Carga las imágenes y las escala a `cell_size` en una única superficie.
+
+    Args:
+        cell_size (int): Tamaño de las celdas en píxeles.
+
+    Returns:
+        pygame.Surface: Atlas con las imágenes en fila, en el orden de `SPRITE_FILES`.
+    """
+    atlas = pygame.Surface((cell_size * len(SPRITE_FILES), cell_size), pygame.SRCALPHA)
+    for i, name in enumerate(SPRITE_FILES.values()):
+        image = pygame.image.load(os.path.join(ASSETS_DIR, name))
+        scaled = pygame.transform.scale(image, (cell_size, cell_size))
+        # Sobre el atlas vacío, el máximo copia los píxeles sin mezclar la transparencia
+        atlas.blit(scaled, (i * cell_size, 0), special_flags=pygame.BLEND_RGBA_MAX)
+    return atlas
+
+
+def read_cached_atlas(path: str, key: dict):
+    """
+    Lee un atlas guardado con `write_cached_atlas` si sigue siendo válido.
+
+    Returns:
+        pygame.Surface: Atlas guardado, o None si no existe o está desactualizado.
+    """
+    try:
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+            if header["key"] != key:
+                return None
+            return pygame.image.frombuffer(file.read(), tuple(header["size"]), "RGBA").copy()
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def write_cached_atlas(path: str, key: dict, atlas: pygame.Surface):
+    """
+    Guarda los píxeles del atlas sin comprimir, precedidos de una cabecera JSON.
+
+    Si no se puede escribir la caché, el atlas simplemente se vuelve a crear
+    la próxima vez.
+    """
+    header = {"key": key, "size": list(atlas.get_size())}
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as file:
+            file.write(json.dumps(header).encode() + b"\n")
+            file.write(pygame.image.tobytes(atlas, "RGBA"))
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+
+def load_sprites(cell_size: int):
+    """
+    Devuelve las imágenes del tablero escaladas a `cell_size`.
+
+    El atlas se crea una sola vez por proceso y tamaño de celda, y además se
+    guarda en disco para que las siguientes ejecuciones no tengan que volver a
+    cargar y escalar los PNG. Si ya hay una ventana abierta, las imágenes se
+    convierten a su formato de píxel para que dibujarlas sea más rápido.
+
+    Args:
+        cell_size (int): Tamaño de las celdas en píxeles.
+
+    Returns:
+        dict: Imagen (subsuperficie del atlas) de cada letra del tablero.
+    """
+    converted = pygame.display.get_surface() is not None
+    sprites = _atlases.get((cell_size, converted))
+    if sprites is not None:
+        return sprites
+
+    key = cache_key(cell_size)
+    path = os.path.join(CACHE_DIR, f"sprites_{cell_size}.raw")
+    atlas = read_cached_atlas(path, key)
+    if atlas is None:
+        atlas = build_atlas(cell_size)
+        write_cached_atlas(path, key, atlas)
+    if converted:
+        atlas = atlas.convert_alpha()
+
+    sprites = {
+        char: atlas.subsurface((i * cell_size, 0, cell_size, cell_size))
+        for i, char in enumerate(SPRITE_FILES)
+    }
+    _atlases[(cell_size, converted)] = sprites
+    return sprites
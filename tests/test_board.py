@@ -0,0 +1,237 @@
+import random
+
+import pytest
+
+from src.game.board import Board
+from src.game.cells import AGENT, BREEZE, GOLD, HAZARD, PIT, STENCH, WUMPUS
+from src.game.sparse_board import SparseBoard
+from src.game.utils import DIRECTION_DELTAS
+
+BOARD_CLASSES = [Board, SparseBoard]
+SEEDS = range(20)
+
+
+def snapshot(board):
+    """
+    Devuelve todo el estado observable de un tablero, incluido su registro de cambios.
+    """
+    cells = [board.cell_flags(x, y) for x in range(board.size) for y in range(board.size)]
+    return (
+        board.agent_pos,
+        board.wumpus_pos,
+        board.moving_pit,
+        frozenset(board.pits),
+        board.arrowAvailable,
+        cells,
+        board.revision,
+        list(board._changes),
+    )
+
+
+def random_line(board, rng, length):
+    """
+    Aplica movimientos reversibles al azar y devuelve sus registros en orden.
+    """
+    records = []
+    for _ in range(length):
+        if board.check_game_over()[0]:
+            break
+        action = rng.choice(("move", "move", "hazard", "shot"))
+        direction = rng.choice(list(DIRECTION_DELTAS))
+        if action == "move":
+            record = board.apply_move(direction)
+        elif action == "hazard":
+            record = board.apply_hazard_move()
+        else:
+            record, _, _ = board.apply_shot(direction)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_undo_restores_board(board_class, seed):
+    board = board_class(6, verbose=False, seed=seed)
+    before = snapshot(board)
+
+    records = random_line(board, random.Random(seed), 12)
+    for record in reversed(records):
+        board.undo_move(record)
+
+    assert snapshot(board) == before
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+def test_hypothetical_moves_do_not_record_changes(board_class):
+    board = board_class(6, verbose=False, seed=3)
+    board.move_dangerous_object()
+    revision = board.revision
+
+    records = random_line(board, random.Random(3), 12)
+    assert board.revision == revision
+    assert board.changes_since(revision) == set()
+
+    for record in reversed(records):
+        board.undo_move(record)
+    assert board.revision == revision
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+def test_apply_hazard_move_matches_real_move(board_class):
+    board = board_class(6, verbose=False, seed=5)
+    real = board_class.from_state(board.to_state())
+
+    record = board.apply_hazard_move()
+    moved = real.move_dangerous_object()
+
+    assert (record is not None) == moved
+    assert board.moving_pit == real.moving_pit
+    assert snapshot(board)[:6] == snapshot(real)[:6]
+
+
+def test_undo_restores_pit_order():
+    board = Board(8, verbose=False, seed=2)
+    pits = list(board.pits)
+
+    record = board.apply_hazard_move()
+    assert record is not None
+    board.undo_move(record)
+
+    assert board.pits == pits
+
+
+def expected_counts(board):
+    """
+    Cuenta desde cero los pozos y el Wumpus vecinos de cada celda.
+    """
+    size = board.size
+    pit_count = bytearray(size * size)
+    wumpus_count = bytearray(size * size)
+    objects = [(pos, pit_count) for pos in board.pits]
+    if board.wumpus_pos is not None:
+        objects.append((board.wumpus_pos, wumpus_count))
+    for (x, y), counts in objects:
+        for dx, dy in DIRECTION_DELTAS.values():
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < size and 0 <= ny < size:
+                counts[nx * size + ny] += 1
+    return pit_count, wumpus_count
+
+
+def assert_counts_consistent(board):
+    pit_count, wumpus_count = expected_counts(board)
+    assert board._pit_count == pit_count
+    assert board._wumpus_count == wumpus_count
+    for index, value in enumerate(board._cells):
+        # Las celdas con un peligro no muestran percepciones
+        shown = not value & HAZARD
+        assert bool(value & BREEZE) == (shown and bool(pit_count[index]))
+        assert bool(value & STENCH) == (shown and bool(wumpus_count[index]))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_counts_follow_real_moves(seed):
+    board = Board(8, verbose=False, seed=seed)
+    assert_counts_consistent(board)
+
+    rng = random.Random(seed)
+    for _ in range(10):
+        board.move_dangerous_object()
+        assert_counts_consistent(board)
+    board.shoot_arrow(rng.choice(list(DIRECTION_DELTAS)))
+    assert_counts_consistent(board)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_counts_follow_undo(seed):
+    board = Board(8, verbose=False, seed=seed)
+    rng = random.Random(seed)
+
+    records = random_line(board, rng, 12)
+    assert_counts_consistent(board)
+    for record in reversed(records):
+        board.undo_move(record)
+        assert_counts_consistent(board)
+
+
+def test_breeze_survives_when_one_of_two_pits_moves():
+    # Dos pozos junto a la celda (1, 1): al mover uno, la brisa se mantiene
+    board = Board.from_grid(
+        [
+            [AGENT, PIT, 0, 0],
+            [0, 0, PIT, 0],
+            [0, 0, 0, 0],
+            [WUMPUS, 0, 0, GOLD],
+        ],
+        verbose=False,
+    )
+    assert board._pit_count[1 * 4 + 1] == 2
+
+    board.move_object("O", (1, 2), (2, 2))
+
+    assert board.cell_flags(1, 1) & BREEZE
+    assert board._pit_count[1 * 4 + 1] == 1
+    assert_counts_consistent(board)
+
+
+def assert_no_perceptions_on_hazards(board):
+    for row in board.get_board():
+        for cell in row:
+            if "O" in cell or "W" in cell:
+                assert "b" not in cell and "s" not in cell, cell
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_hazard_cells_show_no_perceptions(board_class, seed):
+    board = board_class(8, verbose=False, seed=seed)
+    assert_no_perceptions_on_hazards(board)
+
+    for _ in range(10):
+        board.move_dangerous_object()
+        assert_no_perceptions_on_hazards(board)
+    board.shoot_arrow(random.Random(seed).choice(list(DIRECTION_DELTAS)))
+    assert_no_perceptions_on_hazards(board)
+
+
+def test_pit_moving_next_to_another_pit():
+    board = Board.from_grid(
+        [
+            [AGENT, 0, 0, 0],
+            [0, PIT, PIT, 0],
+            [0, 0, 0, 0],
+            [WUMPUS, 0, 0, GOLD],
+        ],
+        verbose=False,
+    )
+    assert not board.cell_flags(1, 1) & BREEZE
+
+    # La celda que deja el pozo sigue junto al otro y recupera la brisa
+    board.move_object("O", (1, 2), (2, 2))
+    assert board.cell_flags(1, 2) & BREEZE
+    assert not board.cell_flags(2, 2) & BREEZE
+    assert_counts_consistent(board)
+
+    board.move_object("O", (2, 2), (2, 1))
+    assert not board.cell_flags(1, 1) & BREEZE
+    assert not board.cell_flags(2, 1) & BREEZE
+    assert_counts_consistent(board)
+
+
+def test_dead_wumpus_cell_shows_breeze():
+    board = Board.from_grid(
+        [
+            [AGENT, WUMPUS, PIT, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, 0],
+            [0, 0, 0, GOLD],
+        ],
+        verbose=False,
+    )
+    assert not board.cell_flags(0, 1) & BREEZE
+
+    # Muerto el Wumpus, su celda ya no es un peligro y muestra la brisa del pozo vecino
+    board.shoot_arrow("right")
+    assert board.cell_flags(0, 1) & BREEZE
+    assert_counts_consistent(board)
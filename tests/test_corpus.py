@@ -0,0 +1,98 @@
+import os
+
+import numpy as np
+import pytest
+
+from src.game.board import Board
+from src.game.corpus import (
+    STORED_FLAGS,
+    BoardCorpus,
+    CorpusWriter,
+    convert_text_boards,
+    text_board_to_grid,
+)
+from src.game.generator import generate_boards
+from src.game.utils import read_text_board
+
+BOARDS_DIR = os.path.join(os.path.dirname(__file__), "..", "tableros")
+
+
+def write_corpus(path, grids, seeds):
+    with CorpusWriter(str(path)) as writer:
+        for grid, seed in zip(grids, seeds):
+            writer.add(grid, seed)
+    return BoardCorpus(str(path))
+
+
+@pytest.mark.parametrize("size", [3, 5, 8])
+def test_corpus_round_trip(tmp_path, size):
+    # Con un tamaño impar la última celda ocupa medio byte
+    grids, seeds = generate_boards(40, size, seed=size)
+    seeds = [int(seed) for seed in seeds]
+    seeds[::3] = [None] * len(seeds[::3])
+
+    corpus = write_corpus(tmp_path / "tableros.wcorp", grids, seeds)
+
+    assert len(corpus) == len(grids)
+    for index, (grid, seed) in enumerate(zip(grids, seeds)):
+        assert np.array_equal(corpus.grid(index), grid & STORED_FLAGS)
+        assert corpus.seed(index) == seed
+    assert np.array_equal(corpus.grid(-1), grids[-1])
+
+
+def test_corpus_boards_match_their_grids(tmp_path):
+    grids, seeds = generate_boards(10, 6, seed=1)
+    seeds = [int(seed) for seed in seeds]
+    corpus = write_corpus(tmp_path / "tableros.wcorp", grids, seeds)
+
+    for index, (grid, seed) in enumerate(zip(grids, seeds)):
+        board = corpus.board(index, verbose=False)
+        expected = Board.from_grid(grid, verbose=False, seed=seed)
+        assert bytes(board._cells) == bytes(expected._cells)
+        assert board.moving_pit == expected.moving_pit
+
+
+def test_corpus_with_boards_of_different_sizes(tmp_path):
+    small, _ = generate_boards(2, 4, seed=0)
+    large, _ = generate_boards(2, 9, seed=0)
+    grids = [small[0], large[0], small[1], large[1]]
+
+    corpus = write_corpus(tmp_path / "tableros.wcorp", grids, [None] * 4)
+
+    assert [len(corpus.grid(index)) for index in range(4)] == [4, 9, 4, 9]
+    for index, grid in enumerate(grids):
+        assert np.array_equal(corpus.grid(index), grid)
+
+
+def test_index_out_of_range(tmp_path):
+    grids, _ = generate_boards(3, 4, seed=0)
+    corpus = write_corpus(tmp_path / "tableros.wcorp", grids, [None] * 3)
+
+    with pytest.raises(IndexError):
+        corpus.grid(3)
+    with pytest.raises(IndexError):
+        corpus.grid(-4)
+
+
+def test_invalid_files_are_rejected(tmp_path):
+    truncated = tmp_path / "truncado.wcorp"
+    truncated.write_bytes(b"WUMPCORP")
+    other = tmp_path / "otro.wcorp"
+    other.write_bytes(b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        BoardCorpus(str(truncated))
+    with pytest.raises(ValueError):
+        BoardCorpus(str(other))
+
+
+def test_text_boards_round_trip(tmp_path):
+    with CorpusWriter(str(tmp_path / "tableros.wcorp")) as writer:
+        added = convert_text_boards(BOARDS_DIR, writer)
+    corpus = BoardCorpus(str(tmp_path / "tableros.wcorp"))
+
+    assert added and len(corpus) == len(added)
+    for index, file_name in enumerate(added):
+        custom_board, _ = read_text_board(os.path.join(BOARDS_DIR, file_name))
+        assert np.array_equal(corpus.grid(index), text_board_to_grid(custom_board))
+        assert corpus.seed(index) is None
@@ -0,0 +1,55 @@
+import pytest
+
+from src.game.ai.costs import CostGrid
+from src.game.board import Board
+from src.game.sparse_board import SparseBoard
+from src.game.utils import DIRECTION_DELTAS
+
+BOARD_CLASSES = [Board, SparseBoard]
+SEEDS = range(10)
+
+
+def assert_consistent(grid, goal):
+    """
+    Comprueba `h(a) <= coste(b) + h(b)` para cada paso de una celda `a` a una vecina `b`.
+    """
+    size = grid.board.size
+    assert grid.heuristic(goal, goal) == 0
+    for x in range(size):
+        for y in range(size):
+            h = grid.heuristic((x, y), goal)
+            for dx, dy in DIRECTION_DELTAS.values():
+                neighbor = (x + dx, y + dy)
+                if 0 <= neighbor[0] < size and 0 <= neighbor[1] < size:
+                    assert h <= grid.cost(neighbor) + grid.heuristic(neighbor, goal)
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("size", [3, 6, 10, 20])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_heuristic_is_consistent_towards_the_gold(board_class, size, seed):
+    board = board_class(size, verbose=False, seed=seed)
+
+    assert_consistent(CostGrid(board), board.gold_pos)
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_heuristic_is_consistent_towards_other_goals(board_class, seed):
+    board = board_class(6, verbose=False, seed=seed)
+    grid = CostGrid(board)
+
+    for goal in [(0, 0), (0, 5), (5, 5), (2, 3)]:
+        assert_consistent(grid, goal)
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_heuristic_stays_consistent_when_the_pit_moves(board_class, seed):
+    board = board_class(10, verbose=False, seed=seed)
+    grid = CostGrid(board)
+
+    for _ in range(5):
+        if not board.move_dangerous_object():
+            break
+        assert_consistent(grid, board.gold_pos)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from src.game import generator
+from src.game.board import Board
+from src.game.cells import AGENT, GOLD, PIT, WUMPUS
+from src.game.generator import generate_boards, load_npz, save_npz
+from src.game.utils import agent_start, manhattan_distance, num_pits
+
+SIZES = [3, 6, 8, 11]
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_same_seed_gives_the_same_boards(size):
+    grids, seeds = generate_boards(50, size, seed=3)
+    again_grids, again_seeds = generate_boards(50, size, seed=3)
+    other_grids, _ = generate_boards(50, size, seed=4)
+
+    assert grids.shape == (50, size, size) and grids.dtype == np.uint8
+    assert np.array_equal(grids, again_grids)
+    assert np.array_equal(seeds, again_seeds)
+    assert not np.array_equal(grids, other_grids)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_objects_are_placed_away_from_the_agent(size):
+    grids, _ = generate_boards(200, size, seed=0)
+    agent_x, agent_y = agent_start(size)
+
+    for grid in grids:
+        assert grid[agent_x, agent_y] == AGENT
+        for flag, count in ((WUMPUS, 1), (GOLD, 1), (PIT, num_pits(size))):
+            assert np.count_nonzero(grid & flag) == count
+        for x, y in zip(*np.nonzero(grid & (WUMPUS | GOLD | PIT))):
+            assert manhattan_distance(x, y, agent_x, agent_y) > 2
+            # Cada celda tiene como mucho un objeto
+            assert bin(int(grid[x, y])).count("1") == 1
+
+
+def test_boards_do_not_depend_on_the_chunk_size(monkeypatch):
+    grids, seeds = generate_boards(20, 8, seed=5)
+
+    monkeypatch.setattr(generator, "CHUNK_SIZE", 7)
+    chunked_grids, chunked_seeds = generate_boards(20, 8, seed=5)
+
+    assert np.array_equal(grids, chunked_grids)
+    assert np.array_equal(seeds, chunked_seeds)
+
+
+def test_too_small_board_is_rejected():
+    with pytest.raises(ValueError):
+        generate_boards(1, 2, seed=0)
+
+
+def test_generated_boards_load_as_games():
+    grids, seeds = generate_boards(10, 8, seed=1)
+
+    for grid, seed in zip(grids, seeds):
+        board = Board.from_grid(grid, verbose=False, seed=int(seed))
+        assert board.agent_pos == agent_start(8)
+        assert len(board.pits) == num_pits(8)
+        assert board.moving_pit in board.pits
+
+
+def test_npz_round_trip(tmp_path):
+    grids, seeds = generate_boards(30, 7, seed=2)
+    path = tmp_path / "tableros.npz"
+
+    save_npz(str(path), grids, seeds)
+    loaded_grids, loaded_seeds = load_npz(str(path))
+
+    assert np.array_equal(loaded_grids, grids)
+    assert loaded_grids.dtype == grids.dtype
+    assert np.array_equal(loaded_seeds, seeds)
+    assert loaded_seeds.dtype == seeds.dtype
@@ -0,0 +1,194 @@
+import copy
+
+import pytest
+
+from src.game.ai.minmax import MinMaxPlayer
+from src.game.ai.transposition import EXACT
+from src.game.board import Board
+from src.game.sparse_board import SparseBoard
+from src.game.utils import get_agent_moves
+
+BOARD_CLASSES = [Board, SparseBoard]
+ADVERSARIES = ["agent", "pit"]
+SEEDS = range(10)
+
+
+def root_search(board_class, seed, **options):
+    """
+    Busca desde la raíz con un jugador nuevo, es decir, con la tabla de transposición vacía.
+    """
+    board = board_class(6, verbose=False, seed=seed)
+    player = MinMaxPlayer(board, depth_limit=4, headless=True, **options)
+    try:
+        player.tt.new_search()
+        return player.search(board)
+    finally:
+        player.close()
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("adversary", ADVERSARIES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_parallel_search_matches_serial(board_class, adversary, seed):
+    serial = root_search(board_class, seed, adversary=adversary)
+    parallel = root_search(board_class, seed, adversary=adversary, search_workers=2)
+
+    assert parallel == serial
+
+
+def minimax(player, board, depth, is_maximizing):
+    """
+    Minimax sin poda ni tabla de transposición, con el mismo árbol que `MinMaxPlayer.alphabeta`.
+    """
+    if board.check_game_over()[0] or depth == player.depth_limit:
+        return player.evaluate(board)
+    if not is_maximizing and player.adversary == "pit":
+        record = board.apply_hazard_move()
+        try:
+            return minimax(player, board, depth + 1, True)
+        finally:
+            if record is not None:
+                board.undo_move(record)
+    values = []
+    for move in get_agent_moves():
+        record = board.apply_move(move)
+        if record is None:
+            continue
+        try:
+            values.append(minimax(player, board, depth + 1, not is_maximizing))
+        finally:
+            board.undo_move(record)
+    return max(values) if is_maximizing else min(values)
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("adversary", ADVERSARIES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_alphabeta_with_empty_table_matches_minimax(board_class, adversary, seed):
+    board = board_class(8, verbose=False, seed=seed)
+    player = MinMaxPlayer(board, depth_limit=6, headless=True, adversary=adversary)
+
+    expected = minimax(player, board, 0, True)
+    player.tt.new_search()
+    _, value = player.search(board)
+
+    assert value == expected
+
+
+def store_children(player, board, depth, value):
+    """
+    Guarda en la tabla un valor exacto para cada hijo de la raíz.
+    """
+    for move in get_agent_moves():
+        record = board.apply_move(move)
+        if record is None:
+            continue
+        key = player.hasher.hash(board, False)
+        board.undo_move(record)
+        player.tt.store(key, depth, EXACT, value, None)
+
+
+def test_alphabeta_ignores_entries_searched_less_deeply():
+    board = Board(6, verbose=False, seed=0)
+    player = MinMaxPlayer(board, depth_limit=4, headless=True)
+    expected = minimax(player, board, 0, True)
+
+    # Ningún nodo interior puede usar una entrada de profundidad 0
+    store_children(player, board, 0, 10**6)
+    player.tt.new_search()
+    _, value = player.search(board)
+
+    assert value == expected
+
+
+def test_alphabeta_uses_entries_searched_deeply_enough():
+    board = Board(6, verbose=False, seed=0)
+    player = MinMaxPlayer(board, depth_limit=4, headless=True)
+
+    store_children(player, board, 3, 10**6)
+    player.tt.new_search()
+    _, value = player.search(board)
+
+    assert value == 10**6
+
+
+class CheckedReplyPlayer(MinMaxPlayer):
+    """
+    Jugador que comprueba cada respuesta del pozo contra `Board.move_dangerous_object`.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replies = 0
+
+    def forced_reply(self, board, depth, alpha, beta, search):
+        expected = copy.deepcopy(board)
+        expected.move_dangerous_object()
+
+        def checked_search(board, *args):
+            assert position(board) == position(expected)
+            self.replies += 1
+            return search(board, *args)
+
+        return super().forced_reply(board, depth, alpha, beta, checked_search)
+
+
+def position(board):
+    cells = [board.cell_flags(x, y) for x in range(board.size) for y in range(board.size)]
+    return board.agent_pos, board.moving_pit, frozenset(board.pits), board.wumpus_pos, cells
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_pit_replies_match_the_real_pit(board_class, seed):
+    board = board_class(8, verbose=False, seed=seed)
+    player = CheckedReplyPlayer(board, depth_limit=6, headless=True, adversary="pit")
+
+    player.decide()
+
+    assert player.replies > 0
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_principal_variation_follows_the_pit(board_class, seed):
+    board = board_class(8, verbose=False, seed=seed)
+    player = MinMaxPlayer(board, depth_limit=6, headless=True, adversary="pit")
+    player.tt.new_search()
+    player.search(board)
+
+    pv_moves = player.principal_variation(player.depth_limit)
+
+    # La variante se puede jugar en la partida real: tras cada respuesta del
+    # pozo, la posición es la siguiente de la variante
+    game = copy.deepcopy(board)
+    played = 0
+    for _ in range(len(pv_moves)):
+        move = pv_moves.get(player.hasher.hash(game, True))
+        if move is None:
+            break
+        game.move_agent(move)
+        played += 1
+        if game.check_game_over()[0]:
+            break
+        game.move_dangerous_object()
+    assert played == len(pv_moves)
+    assert played == player.depth_limit // 2 or game.check_game_over()[0]
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("adversary", ADVERSARIES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_search_leaves_the_change_log_alone(board_class, adversary, seed):
+    board = board_class(8, verbose=False, seed=seed)
+    player = MinMaxPlayer(board, headless=True, adversary=adversary, time_budget_ms=20)
+    revision = board.revision
+    changes = list(board._changes)
+    before = position(board)
+
+    player.decide()
+
+    assert board.revision == revision
+    assert board.changes_since(revision) == set()
+    assert list(board._changes) == changes
+    assert position(board) == before
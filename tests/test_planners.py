@@ -0,0 +1,209 @@
+import pytest
+
+from src.game.ai.astar import AStarPlayer
+from src.game.ai.dstar_lite import DStarLite
+from src.game.ai.hpa import HierarchicalPlanner
+from src.game.board import Board
+from src.game.cells import HAZARD
+from src.game.sparse_board import SparseBoard
+from src.game.utils import get_move_direction
+
+BOARD_CLASSES = [Board, SparseBoard]
+SEEDS = range(15)
+SIZES = [6, 10, 20]
+# Las rutas en las que JPS se saltaba un giro eran raras, así que se prueban más tableros
+JPS_SEEDS = range(60)
+
+
+def path_cost(player, path):
+    """
+    Suma el coste de `get_cost` de las celdas de una ruta, sin contar la de salida.
+    """
+    return sum(player.get_cost(pos) for pos in path[1:])
+
+
+def assert_valid_path(board, path, start, goal):
+    assert path[0] == start
+    assert path[-1] == goal
+    for (x, y), (nx, ny) in zip(path, path[1:]):
+        assert abs(x - nx) + abs(y - ny) == 1
+        assert not board.cell_flags(nx, ny) & HAZARD
+
+
+def optimal_cost(player):
+    """
+    Coste de la ruta de A* desde la posición actual del agente, o None si no hay ruta.
+    """
+    board = player.board
+    path = player.a_star_search(board.agent_pos, board.gold_pos)
+    return None if path is None else path_cost(player, path)
+
+
+def dstar_path(player):
+    board = player.board
+    dstar = DStarLite(
+        board.size,
+        player.get_cost,
+        player.min_step_cost(),
+        sparse=isinstance(board, SparseBoard),
+    )
+    dstar.initialize(board.agent_pos, board.gold_pos)
+    dstar.compute_shortest_path()
+    return dstar.extract_path()
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_dstar_is_optimal(board_class, size, seed):
+    board = board_class(size, verbose=False, seed=seed)
+    player = AStarPlayer(board, headless=True)
+
+    path = dstar_path(player)
+
+    expected = optimal_cost(player)
+    if expected is None:
+        assert path is None
+    else:
+        assert_valid_path(board, path, board.agent_pos, board.gold_pos)
+        assert path_cost(player, path) == expected
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_dstar_replans_after_hazard_moves(board_class, seed):
+    board = board_class(10, verbose=False, seed=seed)
+    player = AStarPlayer(board, planner="dstar", moving_pit=True, headless=True)
+
+    for _ in range(20):
+        if board.check_game_over()[0]:
+            break
+        move = player.decide()
+        expected = optimal_cost(player)
+        if expected is None:
+            assert move is None
+            break
+        # La ruta reparada, desde la celda actual del agente, cuesta lo mismo que una nueva
+        remaining = player.path[player.path_index - 1 :]
+        assert_valid_path(board, remaining, board.agent_pos, board.gold_pos)
+        assert path_cost(player, remaining) == expected
+        player.apply_turn(move)
+
+
+def hpa_planner(player):
+    return HierarchicalPlanner(player.board.size, player.get_cost, player.min_step_cost())
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("size", [10, 20, 40])
+@pytest.mark.parametrize("seed", SEEDS)
+def test_hpa_finds_a_path_when_astar_does(board_class, size, seed):
+    board = board_class(size, verbose=False, seed=seed)
+    player = AStarPlayer(board, headless=True)
+
+    path = hpa_planner(player).find_path(board.agent_pos, board.gold_pos)
+
+    # HPA* no es óptimo, pero encuentra ruta siempre que exista
+    expected = optimal_cost(player)
+    if expected is None:
+        assert path is None
+    else:
+        assert_valid_path(board, path, board.agent_pos, board.gold_pos)
+        assert path_cost(player, path) >= expected
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_hpa_invalidation_matches_fresh_planner(board_class, seed):
+    board = board_class(20, verbose=False, seed=seed)
+    player = AStarPlayer(board, headless=True)
+    planner = hpa_planner(player)
+    planner.find_path(board.agent_pos, board.gold_pos)
+
+    for _ in range(10):
+        revision = board.revision
+        if not board.move_dangerous_object():
+            break
+        planner.invalidate(board.changes_since(revision))
+
+        fresh = hpa_planner(player)
+        expected = fresh.find_path(board.agent_pos, board.gold_pos)
+        assert planner.find_path(board.agent_pos, board.gold_pos) == expected
+        for key, cluster in planner.clusters.items():
+            assert cluster.costs == fresh.get_cluster(key).costs
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("size", [10, 20, 40, 80])
+@pytest.mark.parametrize("seed", JPS_SEEDS)
+def test_jps_is_optimal(board_class, size, seed):
+    board = board_class(size, verbose=False, seed=seed)
+    player = AStarPlayer(board, headless=True)
+
+    path = player.jump_point_search(board.agent_pos, board.gold_pos)
+
+    expected = optimal_cost(player)
+    if expected is None:
+        assert path is None
+    else:
+        assert_valid_path(board, path, board.agent_pos, board.gold_pos)
+        assert path_cost(player, path) == expected
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_jps_follows_hazard_moves(board_class, seed):
+    board = board_class(20, verbose=False, seed=seed)
+    player = AStarPlayer(board, headless=True)
+
+    for _ in range(10):
+        path = player.jump_point_search(board.agent_pos, board.gold_pos)
+        # Los puntos de salto guardados siguen al pozo móvil
+        fresh = AStarPlayer(board, headless=True)
+        assert player.jump_point_bounds(board.gold_pos) == fresh.jump_point_bounds(board.gold_pos)
+        expected = optimal_cost(player)
+        if expected is None:
+            assert path is None
+        else:
+            assert_valid_path(board, path, board.agent_pos, board.gold_pos)
+            assert path_cost(player, path) == expected
+        if not board.move_dangerous_object():
+            break
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_space_time_predicts_the_pit(board_class, size, seed):
+    board = board_class(size, verbose=False, seed=seed)
+    player = AStarPlayer(board, planner="spacetime", moving_pit=True, headless=True)
+
+    path, pit_path = player.space_time_search(board.agent_pos, board.gold_pos)
+    if path is None:
+        return
+    assert pit_path[0] == board.moving_pit
+    for i, pos in enumerate(path[1:], start=1):
+        board.move_agent(get_move_direction(board.agent_pos, pos))
+        over, message = board.check_game_over()
+        assert not over or board.agent_pos == board.gold_pos, message
+        if over:
+            break
+        board.move_dangerous_object()
+        # El pozo responde como se simuló y no alcanza al agente
+        assert board.moving_pit == pit_path[i]
+        assert not board.check_game_over()[0]
+
+
+@pytest.mark.parametrize("board_class", BOARD_CLASSES)
+@pytest.mark.parametrize("seed", SEEDS)
+def test_space_time_agent_never_dies(board_class, seed):
+    board = board_class(10, verbose=False, seed=seed)
+    player = AStarPlayer(board, planner="spacetime", moving_pit=True, headless=True)
+
+    for _ in range(200):
+        over, message = board.check_game_over()
+        if over:
+            assert board.agent_pos == board.gold_pos, message
+            break
+        if player.play_turn() is None:
+            break
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from src.game.board import Board
+from src.game.cells import AGENT, GOLD, PIT, WUMPUS
+from src.game.sparse_board import SparseBoard
+from src.game.utils import DIRECTION_DELTAS
+
+SEEDS = range(20)
+
+
+def board_pair(size, seed):
+    """
+    Crea un `Board` y un `SparseBoard` con el mismo contenido y el mismo pozo móvil.
+    """
+    board = Board(size, verbose=False, seed=seed)
+    grid = [[board.cell_flags(x, y) for y in range(size)] for x in range(size)]
+    dense = Board.from_grid(grid, verbose=False, seed=seed)
+    sparse = SparseBoard.from_grid(grid, verbose=False, seed=seed)
+    sparse.moving_pit = dense.moving_pit
+    return dense, sparse
+
+
+def cells(board):
+    return [board.cell_flags(x, y) for x in range(board.size) for y in range(board.size)]
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_same_cells(seed):
+    dense, sparse = board_pair(8, seed)
+
+    assert cells(sparse) == cells(dense)
+    assert sparse.dense_cells() == dense._cells
+    assert set(sparse.pits) == set(dense.pits)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_same_game(seed):
+    dense, sparse = board_pair(8, seed)
+    rng = random.Random(seed)
+
+    for _ in range(15):
+        if dense.check_game_over()[0]:
+            break
+        direction = rng.choice(list(DIRECTION_DELTAS))
+        dense_revision, sparse_revision = dense.revision, sparse.revision
+        dense.move_agent(direction)
+        sparse.move_agent(direction)
+        dense_next = dense.get_next_object_position(dense.moving_pit)
+        assert sparse.get_next_object_position(sparse.moving_pit) == dense_next
+        dense.move_dangerous_object()
+        sparse.move_dangerous_object()
+
+        assert sparse.agent_pos == dense.agent_pos
+        assert sparse.moving_pit == dense.moving_pit
+        assert cells(sparse) == cells(dense)
+        assert sparse.check_game_over() == dense.check_game_over()
+        assert sparse.changes_since(sparse_revision) == dense.changes_since(dense_revision)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_same_flow_field(seed):
+    dense, sparse = board_pair(8, seed)
+
+    assert sparse.flow_field().distance == dense.flow_field().distance
+    dense.move_dangerous_object()
+    sparse.move_dangerous_object()
+    assert sparse.flow_field().distance == dense.flow_field().distance
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_same_hypothetical_moves(seed):
+    dense, sparse = board_pair(8, seed)
+
+    for board in (dense, sparse):
+        board.apply_hazard_move()
+        board.apply_shot("right")
+
+    assert sparse.moving_pit == dense.moving_pit
+    assert sparse.wumpus_pos == dense.wumpus_pos
+    assert cells(sparse) == cells(dense)
+
+
+def test_shot_kills_wumpus_on_both():
+    grid = [
+        [AGENT, WUMPUS, 0, 0],
+        [0, 0, 0, PIT],
+        [0, 0, 0, 0],
+        [0, 0, 0, GOLD],
+    ]
+    dense = Board.from_grid(grid, verbose=False)
+    sparse = SparseBoard.from_grid(grid, verbose=False)
+
+    for board in (dense, sparse):
+        revision = board.revision
+        assert board.shoot_arrow("right") == (True, "¡Has matado al Wumpus!")
+        assert board.wumpus_pos is None
+        assert board.changes_since(revision) == {(0, 0), (0, 1), (0, 2), (1, 1)}
+    assert cells(sparse) == cells(dense)
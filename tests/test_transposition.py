@@ -0,0 +1,117 @@
+from src.game.ai.transposition import (
+    EXACT,
+    LAZY_KEY_CELLS,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    TranspositionTable,
+    ZobristHasher,
+)
+from src.game.board import Board
+
+
+def test_table_size_is_bounded():
+    table = TranspositionTable(100)
+    assert len(table.entries) == 128
+
+    for key in range(1000):
+        table.store(key, 1, EXACT, key, "up")
+
+    assert len(table.entries) == 128
+    assert all(entry is not None for entry in table.entries)
+    # Cada posición de la tabla conserva la última clave que ha recibido
+    assert table.probe(999).value == 999
+    assert table.probe(999 - 128) is None
+    assert table.stats()["replacements"] == 1000 - 128
+
+
+def test_probe_checks_the_whole_key():
+    table = TranspositionTable(16)
+    table.store(5, 2, EXACT, 1.0, "up")
+
+    assert table.probe(5 + 16) is None
+    assert table.probe(5).move == "up"
+    assert (table.probes, table.hits) == (2, 1)
+
+
+def test_shallower_entry_does_not_replace_deeper_one_in_the_same_search():
+    table = TranspositionTable(16)
+    table.store(5, 4, UPPER_BOUND, 1.0, "up")
+
+    table.store(5 + 16, 2, EXACT, 2.0, "down")
+    assert table.probe(5).value == 1.0
+    assert table.probe(5 + 16) is None
+
+    # Con la misma profundidad o más, la entrada nueva sustituye a la anterior
+    table.store(5 + 16, 4, LOWER_BOUND, 2.0, "down")
+    assert table.probe(5) is None
+    assert table.probe(5 + 16) == (5 + 16, 4, LOWER_BOUND, 2.0, "down", 0)
+
+
+def test_entries_of_a_previous_search_are_always_replaced():
+    table = TranspositionTable(16)
+    table.store(5, 8, EXACT, 1.0, "up")
+
+    table.new_search()
+    table.store(5 + 16, 1, EXACT, 2.0, "down")
+
+    assert table.probe(5) is None
+    assert table.probe(5 + 16).generation == 1
+
+
+def test_clear_empties_the_table():
+    table = TranspositionTable(16)
+    table.new_search()
+    table.store(5, 1, EXACT, 1.0, "up")
+    table.probe(5)
+
+    table.clear()
+
+    assert table.probe(5) is None
+    assert table.generation == 0
+    assert table.stats() == {
+        "probes": 1,
+        "hits": 0,
+        "cutoffs": 0,
+        "stores": 0,
+        "replacements": 0,
+    }
+
+
+def test_hash_changes_with_every_part_of_the_position():
+    board = Board(6, verbose=False, seed=0)
+    hasher = ZobristHasher(board.size)
+    key = hasher.hash(board, True)
+
+    assert hasher.hash(board, False) != key
+    assert ZobristHasher(board.size).hash(board, True) == key
+
+    changes = []
+    record = board.apply_move("right")
+    changes.append(hasher.hash(board, True))
+    board.undo_move(record)
+    record = board.apply_hazard_move()
+    if record is not None:
+        changes.append(hasher.hash(board, True))
+        board.undo_move(record)
+    board.arrowAvailable = False
+    changes.append(hasher.hash(board, True))
+    board.arrowAvailable = True
+    wumpus_pos, board.wumpus_pos = board.wumpus_pos, None
+    changes.append(hasher.hash(board, True))
+    board.wumpus_pos = wumpus_pos
+
+    assert key not in changes
+    assert len(set(changes)) == len(changes)
+    assert hasher.hash(board, True) == key
+
+
+def test_lazy_keys_on_large_boards_are_reproducible():
+    size = 300
+    assert size * size > LAZY_KEY_CELLS
+    first, second = ZobristHasher(size), ZobristHasher(size)
+
+    keys = [first.agent_keys[index] for index in range(0, size * size, 997)]
+
+    assert keys == [second.agent_keys[index] for index in range(0, size * size, 997)]
+    assert len(set(keys)) == len(keys)
+    assert all(0 <= key < 1 << 64 for key in keys)